@@ -0,0 +1,12 @@
+import runpy
+import sys
+
+## @package Benchmark
+#  Nome antigo mantido por compatibilidade: o código está em aasb.benchmark.
+#  Importar este módulo devolve o próprio aasb.benchmark.
+
+if __name__ == "__main__":
+    runpy.run_module("aasb.benchmark", run_name="__main__")
+else:
+    from aasb import benchmark
+    sys.modules[__name__] = benchmark
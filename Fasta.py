@@ -0,0 +1,12 @@
+import runpy
+import sys
+
+## @package Fasta
+#  Nome antigo mantido por compatibilidade: o código está em aasb.fasta.
+#  Importar este módulo devolve o próprio aasb.fasta.
+
+if __name__ == "__main__":
+    runpy.run_module("aasb.fasta", run_name="__main__")
+else:
+    from aasb import fasta
+    sys.modules[__name__] = fasta
@@ -0,0 +1,12 @@
+import runpy
+import sys
+
+## @package IndiceSufixos
+#  Nome antigo mantido por compatibilidade: o código está em aasb.indice_sufixos.
+#  Importar este módulo devolve o próprio aasb.indice_sufixos.
+
+if __name__ == "__main__":
+    runpy.run_module("aasb.indice_sufixos", run_name="__main__")
+else:
+    from aasb import indice_sufixos
+    sys.modules[__name__] = indice_sufixos
@@ -0,0 +1,12 @@
+import runpy
+import sys
+
+## @package Instrumentacao
+#  Nome antigo mantido por compatibilidade: o código está em aasb.instrumentacao.
+#  Importar este módulo devolve o próprio aasb.instrumentacao.
+
+if __name__ == "__main__":
+    runpy.run_module("aasb.instrumentacao", run_name="__main__")
+else:
+    from aasb import instrumentacao
+    sys.modules[__name__] = instrumentacao
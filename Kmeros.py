@@ -0,0 +1,12 @@
+import runpy
+import sys
+
+## @package Kmeros
+#  Nome antigo mantido por compatibilidade: o código está em aasb.kmeros.
+#  Importar este módulo devolve o próprio aasb.kmeros.
+
+if __name__ == "__main__":
+    runpy.run_module("aasb.kmeros", run_name="__main__")
+else:
+    from aasb import kmeros
+    sys.modules[__name__] = kmeros
@@ -0,0 +1,12 @@
+import runpy
+import sys
+
+## @package Motivos
+#  Nome antigo mantido por compatibilidade: o código está em aasb.motivos.
+#  Importar este módulo devolve o próprio aasb.motivos.
+
+if __name__ == "__main__":
+    runpy.run_module("aasb.motivos", run_name="__main__")
+else:
+    from aasb import motivos
+    sys.modules[__name__] = motivos
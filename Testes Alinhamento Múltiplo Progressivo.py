@@ -1,4 +1,5 @@
 import unittest
+from aasb.alinhamento_progressivo import alinhamento, consenso, alinhamento_progressivo
 
 class TestesAlinhamentoSequencias(unittest.TestCase):
     """!
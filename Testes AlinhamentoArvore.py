@@ -0,0 +1,102 @@
+import random
+import unittest
+from aasb.alinhamento_arvore import (alinhamento_progressivo_arvore, alinhar_perfis, arvore_guia,
+                                     codificar_alinhamento, descodificar_alinhamento, niveis)
+from aasb.alinhamento_progressivo import alinhamento
+
+AMINOACIDOS = "ACDEFGHIKLMNPQRSTVWY"
+
+class TesteAlinhamentoArvore(unittest.TestCase):
+    """!
+    @brief Testes unitários para o alinhamento progressivo guiado por árvore.
+    """
+
+    def setUp(self):
+        self.aleatorio = random.Random(46)
+
+    def mutar(self, sequencia, mutacoes):
+        sequencia = list(sequencia)
+        for _ in range(mutacoes):
+            p = self.aleatorio.randrange(len(sequencia))
+            tipo = self.aleatorio.randrange(3)
+            if tipo == 0:
+                sequencia[p] = self.aleatorio.choice(AMINOACIDOS)
+            elif tipo == 1 and len(sequencia) > 1:
+                del sequencia[p]
+            else:
+                sequencia.insert(p, self.aleatorio.choice(AMINOACIDOS))
+        return "".join(sequencia)
+
+    def test_dois_perfis_igual_a_alinhamento(self):
+        """!
+        @brief Testa que a fusão de duas sequências coincide com alinhamento().
+        """
+        for _ in range(50):
+            seq1 = "".join(self.aleatorio.choice("ACGT") for _ in range(self.aleatorio.randint(1, 25)))
+            seq2 = "".join(self.aleatorio.choice("ACGT") for _ in range(self.aleatorio.randint(1, 25)))
+            fundido = alinhar_perfis(codificar_alinhamento([seq1]), codificar_alinhamento([seq2]))
+            self.assertEqual(tuple(descodificar_alinhamento(fundido)), alinhamento(seq1, seq2))
+
+    def test_perfis_mantem_colunas(self):
+        """!
+        @brief Testa que a fusão de perfis preserva as colunas de cada perfil.
+        """
+        a = codificar_alinhamento(["AC-GT", "ACTGT"])
+        b = codificar_alinhamento(["ACGT", "AGGT"])
+        fundido = descodificar_alinhamento(alinhar_perfis(a, b))
+        self.assertEqual(len(fundido), 4)
+        self.assertEqual(len({len(linha) for linha in fundido}), 1)
+        colunas_a = [c for c in zip(*fundido[:2]) if c != ("-", "-")]
+        self.assertEqual(["".join(linha) for linha in zip(*colunas_a)], ["AC-GT", "ACTGT"])
+
+    def test_arvore_guia(self):
+        """!
+        @brief Testa que a árvore guia agrupa primeiro as sequências mais próximas e que os níveis respeitam as dependências.
+        """
+        familia1 = "MKVLAAGIVGLLAGCSSQPEW"
+        familia2 = "TTRPHDEYWQNNFRKSGMCHL"
+        sequencias = [familia1, familia2, self.mutar(familia1, 2), self.mutar(familia2, 2)]
+        arvore = arvore_guia(sequencias)
+        self.assertEqual({frozenset(map(frozenset, [arvore[0], arvore[1]]))},
+                         {frozenset([frozenset([0, 2]), frozenset([1, 3])])})
+        feitos = set(range(4))
+        for nivel in niveis(arvore):
+            for no in nivel:
+                self.assertTrue(all((f if isinstance(f, int) else id(f)) in feitos for f in no))
+            feitos |= {id(no) for no in nivel}
+
+    def test_alinhamento_paralelo(self):
+        """!
+        @brief Testa que o alinhamento mantém as sequências e que o resultado paralelo é igual ao sequencial.
+        """
+        ancestral = "".join(self.aleatorio.choice(AMINOACIDOS) for _ in range(60))
+        sequencias = [self.mutar(ancestral, 6) for _ in range(24)]
+        alinhadas = alinhamento_progressivo_arvore(sequencias)
+        self.assertEqual([linha.replace("-", "") for linha in alinhadas], sequencias)
+        self.assertEqual(len({len(linha) for linha in alinhadas}), 1)
+        self.assertEqual(alinhamento_progressivo_arvore(sequencias, processos=2), alinhadas)
+
+    def test_arvore_em_escada(self):
+        """!
+        @brief Testa uma árvore dada pelo utilizador com mais níveis do que o limite de recursão.
+        """
+        sequencias = ["ACGT", "AGT", "ACT"] * 400
+        arvore = 0
+        for i in range(1, len(sequencias)):
+            arvore = (arvore, i)
+        self.assertEqual(len(niveis(arvore)), len(sequencias) - 1)
+        alinhadas = alinhamento_progressivo_arvore(sequencias, arvore=arvore)
+        self.assertEqual([linha.replace("-", "") for linha in alinhadas], sequencias)
+
+    def test_erros(self):
+        """!
+        @brief Testa a validação das entradas.
+        """
+        with self.assertRaises(ValueError):
+            alinhamento_progressivo_arvore([])
+        with self.assertRaises(ValueError):
+            alinhamento_progressivo_arvore(["ACGT", ""])
+        self.assertEqual(alinhamento_progressivo_arvore(["ACGT"]), ["ACGT"])
+
+if __name__ == '__main__':
+    unittest.main()
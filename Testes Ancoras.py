@@ -0,0 +1,126 @@
+import random
+import unittest
+from aasb.alinhamento_progressivo import alinhamento_progressivo
+from aasb.ancoras import Ancora, alinhamento_ancorado, cortes, encontrar_ancoras
+
+class TesteAncoras(unittest.TestCase):
+    """!
+    @brief Testes unitários para a segmentação de alinhamentos múltiplos por âncoras.
+    """
+
+    def setUp(self):
+        self.aleatorio = random.Random(48)
+
+    def aleatoria(self, n):
+        return "".join(self.aleatorio.choice("ACGT") for _ in range(n))
+
+    def test_ancoras_colineares(self):
+        """!
+        @brief Testa que as âncoras são correspondências exatas, pela mesma ordem e sem sobreposição.
+        """
+        blocos = [self.aleatoria(40) for _ in range(4)]
+        sequencias = [self.aleatoria(5) + "".join(b + self.aleatoria(self.aleatorio.randint(3, 9)) for b in blocos)
+                      for _ in range(5)]
+        ancoras = encontrar_ancoras(sequencias, k=12)
+        self.assertEqual([a.comprimento for a in ancoras], [40] * 4)
+        for s, sequencia in enumerate(sequencias):
+            fim = 0
+            for ancora, bloco in zip(ancoras, blocos):
+                inicio = ancora.posicoes[s]
+                self.assertEqual(sequencia[inicio:inicio + ancora.comprimento], bloco)
+                self.assertGreaterEqual(inicio, fim)
+                fim = inicio + ancora.comprimento
+
+    def test_ordem_inconsistente(self):
+        """!
+        @brief Testa que de duas âncoras trocadas numa das sequências só uma entra na cadeia.
+        """
+        a, b = self.aleatoria(30), self.aleatoria(20)
+        sequencias = ["TT" + a + "GG" + b, "CC" + a + "TT" + b, "AA" + b + "CC" + a]
+        ancoras = encontrar_ancoras(sequencias, k=10)
+        self.assertEqual([x.comprimento for x in ancoras], [30])
+
+    def test_cortes_interpolados(self):
+        """!
+        @brief Testa que uma sequência sem a âncora recebe cortes interpolados e ordenados.
+        """
+        ancoras = [Ancora((10, 12, -1), 5)]
+        posicoes = cortes(["A" * 30, "A" * 32, "A" * 31], ancoras)
+        self.assertEqual(posicoes[:2].tolist(), [[0, 10, 15, 30], [0, 12, 17, 32]])
+        self.assertEqual(posicoes[2].tolist(), [0, 11, 16, 31])
+
+    def test_alinhamento_ancorado(self):
+        """!
+        @brief Testa que o alinhamento por segmentos mantém as sequências e é igual em paralelo.
+        """
+        ancestral = self.aleatoria(600)
+        sequencias = []
+        for _ in range(6):
+            sequencia = list(ancestral)
+            for _ in range(12):
+                p = self.aleatorio.randrange(len(sequencia))
+                if self.aleatorio.random() < 0.5:
+                    del sequencia[p]
+                else:
+                    sequencia[p] = self.aleatorio.choice("ACGT")
+            sequencias.append("".join(sequencia))
+        alinhadas = alinhamento_ancorado(sequencias)
+        self.assertEqual([linha.replace("-", "") for linha in alinhadas], sequencias)
+        self.assertEqual(len({len(linha) for linha in alinhadas}), 1)
+        self.assertEqual(alinhamento_ancorado(sequencias, processos=2), alinhadas)
+        progressivo = alinhamento_ancorado(sequencias, alinhador=alinhamento_progressivo)
+        self.assertEqual([linha.replace("-", "") for linha in progressivo], sequencias)
+
+    def test_ancoras_parciais(self):
+        """!
+        @brief Testa âncoras presentes só na maioria das sequências.
+        """
+        comum = self.aleatoria(200)
+        sequencias = [comum, comum[:100] + "A" + comum[100:], self.aleatoria(150)]
+        self.assertEqual(encontrar_ancoras(sequencias, minimo=1.0), [])
+        self.assertTrue(encontrar_ancoras(sequencias, minimo=0.6))
+        alinhadas = alinhamento_ancorado(sequencias, minimo=0.6)
+        self.assertEqual([linha.replace("-", "") for linha in alinhadas], sequencias)
+
+    def test_presenca_minima_com_rearranjos(self):
+        """!
+        @brief Testa que, com âncoras curtas e sequências rearranjadas, cada âncora da cadeia
+               continua presente no mínimo de sequências e colinear em todas elas.
+        """
+        for _ in range(20):
+            ancestral = list(self.aleatoria(200))
+            sequencias = []
+            for _ in range(self.aleatorio.randint(3, 6)):
+                sequencia = ancestral[:]
+                for _ in range(20):
+                    p = self.aleatorio.randrange(len(sequencia))
+                    if self.aleatorio.random() < 0.5:
+                        del sequencia[p]
+                    else:
+                        sequencia[p] = self.aleatorio.choice("ACGT")
+                a, b = sorted(self.aleatorio.sample(range(len(sequencia)), 2))
+                sequencias.append("".join(sequencia[b:] + sequencia[a:b] + sequencia[:a]))
+            ancoras = encontrar_ancoras(sequencias, k=4, minimo=0.5)
+            exigidas = max(2, -(-len(sequencias) // 2))
+            for ancora in ancoras:
+                self.assertGreaterEqual(sum(p >= 0 for p in ancora.posicoes), exigidas)
+            for s, sequencia in enumerate(sequencias):
+                fim = 0
+                for ancora in ancoras:
+                    inicio = ancora.posicoes[s]
+                    if inicio >= 0:
+                        self.assertGreaterEqual(inicio, fim)
+                        fim = inicio + ancora.comprimento
+                self.assertLessEqual(fim, len(sequencia))
+
+    def test_erros(self):
+        """!
+        @brief Testa a validação das entradas.
+        """
+        with self.assertRaises(ValueError):
+            alinhamento_ancorado([])
+        with self.assertRaises(ValueError):
+            alinhamento_ancorado(["ACGT", ""])
+
+if __name__ == '__main__':
+    unittest.main()
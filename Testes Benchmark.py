@@ -0,0 +1,42 @@
+import unittest
+from Benchmark import gerar_adn, gerar_proteina, gerar_familia, executar, comparar
+
+class TesteBenchmark(unittest.TestCase):
+    """!
+    @brief Testes unitários para o benchmark.
+    """
+
+    def test_geradores_reprodutiveis(self):
+        """!
+        @brief Testa que os geradores dão sempre o mesmo resultado para a mesma semente.
+        """
+        self.assertEqual(gerar_adn(100), gerar_adn(100))
+        self.assertNotEqual(gerar_adn(100, 1), gerar_adn(100, 2))
+        self.assertTrue(set(gerar_adn(500)) <= set("ACGT"))
+        self.assertEqual(len(gerar_proteina(80)), 80)
+        familia = gerar_familia(50, 4)
+        self.assertEqual(familia, gerar_familia(50, 4))
+        self.assertEqual(len(familia), 4)
+
+    def test_executar(self):
+        """!
+        @brief Testa uma execução reduzida de alguns casos.
+        """
+        resultados = executar(["SW", "complemento_inverso"], repeticoes=1, escala=0.01)
+        self.assertEqual([r["caso"] for r in resultados["resultados"]], ["SW"] * 3 + ["complemento_inverso"] * 3)
+        for r in resultados["resultados"]:
+            self.assertGreater(r["tempo"], 0)
+            self.assertGreaterEqual(r["memoria_pico"], 0)
+
+    def test_comparar(self):
+        """!
+        @brief Testa a deteção de regressões face à referência.
+        """
+        referencia = {"resultados": [{"caso": "SW", "tamanho": 10, "tempo": 1.0, "memoria_pico": 100}]}
+        atual = {"resultados": [{"caso": "SW", "tamanho": 10, "tempo": 1.5, "memoria_pico": 110}]}
+        regressoes = comparar(atual, referencia, 0.25)
+        self.assertEqual([(r["metrica"], r["razao"]) for r in regressoes], [("tempo", 1.5)])
+        self.assertEqual(comparar(atual, referencia, 0.6), [])
+
+if __name__ == '__main__':
+    unittest.main()
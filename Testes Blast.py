@@ -1,5 +1,6 @@
 import unittest
-from Blast import query_map, get_all_positions, hits, extend_hit_direction
+from Blast import query_map, get_all_positions, hits, hits_indexados, hits_mem, extend_hit_direction
+from IndiceSufixos import IndiceSufixos
 
 class TestSequenceAnalysis(unittest.TestCase):
     def test_query_map(self):
@@ -23,6 +24,18 @@ class TestSequenceAnalysis(unittest.TestCase):
         expected = [(0, 0), (0, 12), (1, 1), (1, 13), (4, 16), (5, 17), (6, 18)]
         self.assertEqual(result, expected)
 
+    def test_hits_indexados(self):
+        query = "AATATATNGAT"
+        seq = "AATATGTTATATAATAATATTTGATNN"
+        result = hits_indexados(query, seq, 3)
+        expected = sorted(h for h in hits(query_map(query, 3), seq) if "N" not in query[h[0]:h[0] + 3])
+        self.assertEqual(result, expected)
+
+    def test_hits_mem(self):
+        indice = IndiceSufixos.construir("GGAATATATCCTATAG")
+        self.assertEqual(hits_mem("CAATATATG", indice, 4), [(1, 2, 7), (2, 5, 4), (3, 11, 4), (4, 3, 4)])
+        self.assertEqual(hits_mem("CTATAC", indice, 4), [(0, 10, 5), (1, 4, 4)])
+
     def test_extend_hit_direction(self):
         query = "AATATAT"
         seq = "AATATGTTATATAATAATATTT"
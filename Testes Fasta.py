@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+import Fasta
+from Fasta import (ler_blocos_fasta, ler_fastq, ler_sequencias, indexar,
+                   FicheiroIndexado, Registo)
+
+class TesteLeituraFasta(unittest.TestCase):
+    """!
+    @brief Testes unitários para a leitura de ficheiros FASTA.
+    """
+
+    def setUp(self):
+        """!
+        @brief Escreve um ficheiro FASTA temporário com linhas de comprimentos variados.
+        """
+        self.registos = {"seq1": "ACGTACGTTTGACCA" * 7, "seq2": "GGC", "seq3": "TTAGC" * 20}
+        conteudo = ">seq1 primeira sequência\n"
+        s = self.registos["seq1"]
+        conteudo += "\n".join(s[i:i + 60] for i in range(0, len(s), 60)) + "\n"
+        conteudo += ">seq2\r\nGG\r\nC\r\n>seq3\n" + self.registos["seq3"]
+        descritor, self.caminho = tempfile.mkstemp(suffix=".fa")
+        with os.fdopen(descritor, "w") as ficheiro:
+            ficheiro.write(conteudo)
+
+    def tearDown(self):
+        os.remove(self.caminho)
+
+    def reconstruir(self, tamanho_bloco, sobreposicao):
+        """!
+        @brief Reconstrói cada registo a partir dos blocos lidos.
+        """
+        sequencias = {}
+        for identificador, inicio, bloco in ler_blocos_fasta(self.caminho, tamanho_bloco, sobreposicao):
+            atual = sequencias.get(identificador, "")
+            self.assertEqual(len(atual) - sobreposicao if atual else 0, inicio)
+            self.assertLessEqual(len(bloco), tamanho_bloco + sobreposicao)
+            sequencias[identificador] = atual[:inicio] + bloco
+        return sequencias
+
+    def test_blocos_sem_sobreposicao(self):
+        """!
+        @brief Testa se os blocos sem sobreposição reconstroem as sequências.
+        """
+        self.assertEqual(self.reconstruir(16, 0), self.registos)
+
+    def test_blocos_com_sobreposicao(self):
+        """!
+        @brief Testa se os blocos com sobreposição repetem o final do bloco anterior.
+        """
+        self.assertEqual(self.reconstruir(7, 4), self.registos)
+        self.assertEqual(self.reconstruir(1000, 4), self.registos)
+
+    def test_leituras_pequenas(self):
+        """!
+        @brief Testa cabeçalhos e linhas divididos entre leituras consecutivas do ficheiro.
+        """
+        original = Fasta.TAMANHO_LEITURA
+        try:
+            for tamanho in (1, 3, 5, 64):
+                Fasta.TAMANHO_LEITURA = tamanho
+                self.assertEqual(self.reconstruir(9, 3), self.registos)
+        finally:
+            Fasta.TAMANHO_LEITURA = original
+
+    def test_ler_fasta(self):
+        """!
+        @brief Testa a leitura sequencial de registos FASTA.
+        """
+        registos = list(ler_sequencias(self.caminho))
+        self.assertEqual({r.identificador: r.sequencia for r in registos}, self.registos)
+        self.assertEqual(registos[0].descricao, "primeira sequência")
+        self.assertIsNone(registos[0].qualidade)
+
+    def test_indice_fasta(self):
+        """!
+        @brief Testa o acesso aleatório a regiões através do índice .fai.
+        """
+        try:
+            with FicheiroIndexado(self.caminho) as ficheiro:
+                self.assertEqual(sorted(ficheiro), sorted(self.registos))
+                for nome, sequencia in self.registos.items():
+                    self.assertEqual(ficheiro.comprimento(nome), len(sequencia))
+                    self.assertEqual(ficheiro[nome], sequencia)
+                    for inicio, fim in ((0, 1), (2, 2), (1, 61), (59, 61), (55, 200)):
+                        self.assertEqual(ficheiro.obter(nome, inicio, fim), sequencia[inicio:fim])
+            self.assertTrue(os.path.exists(self.caminho + ".fai"))
+            with FicheiroIndexado(self.caminho) as ficheiro:
+                self.assertEqual(ficheiro.obter("seq1", 58, 63), self.registos["seq1"][58:63])
+        finally:
+            if os.path.exists(self.caminho + ".fai"):
+                os.remove(self.caminho + ".fai")
+
+class TesteLeituraFastq(unittest.TestCase):
+    """!
+    @brief Testes unitários para a leitura de ficheiros FASTQ.
+    """
+
+    def setUp(self):
+        """!
+        @brief Escreve um ficheiro FASTQ temporário.
+        """
+        self.registos = [Registo("r1", "", "ACGTN", "IIII#"), Registo("r2", "lane=2", "GG", "!I")]
+        descritor, self.caminho = tempfile.mkstemp(suffix=".fq")
+        with os.fdopen(descritor, "w") as ficheiro:
+            for r in self.registos:
+                ficheiro.write(f"@{r.identificador} {r.descricao}\n{r.sequencia}\n+\n{r.qualidade}\n")
+
+    def tearDown(self):
+        for caminho in (self.caminho, self.caminho + ".fai"):
+            if os.path.exists(caminho):
+                os.remove(caminho)
+
+    def test_ler_fastq(self):
+        """!
+        @brief Testa a leitura sequencial de registos FASTQ.
+        """
+        self.assertEqual(list(ler_sequencias(self.caminho)), self.registos)
+
+    def test_fastq_invalido(self):
+        """!
+        @brief Testa a deteção de registos com sequência e qualidade de comprimentos diferentes.
+        """
+        with open(self.caminho, "a") as ficheiro:
+            ficheiro.write("@r3\nACG\n+\nII\n")
+        with self.assertRaises(ValueError):
+            list(ler_fastq(self.caminho))
+
+    def test_indice_fastq(self):
+        """!
+        @brief Testa o acesso aleatório a sequências e qualidades de um FASTQ.
+        """
+        self.assertEqual([e.nome for e in indexar(self.caminho)], ["r1", "r2"])
+        with FicheiroIndexado(self.caminho) as ficheiro:
+            for r in self.registos:
+                self.assertEqual(ficheiro[r.identificador], r.sequencia)
+                self.assertEqual(ficheiro.qualidade(r.identificador), r.qualidade)
+            self.assertEqual(ficheiro.obter("r1", 1, 3), "CG")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import random
+import unittest
+import numpy as np
+from aasb.blosum import Blosum62
+from aasb.frente_onda import alinhar_frente_onda, preencher_bloco
+from aasb.needleman_wunsch import alinhar, alinhar_transcricao
+from aasb import instrumentacao
+
+AMINOACIDOS = "ARNDCQEGHILKMFPSTWYV"
+
+class TesteFrenteOnda(unittest.TestCase):
+    """!
+    @brief Testes unitários para o alinhamento global por blocos em frente de onda.
+    """
+
+    def setUp(self):
+        self.aleatorio = random.Random(45)
+
+    def aleatoria(self, n, alfabeto=AMINOACIDOS):
+        return "".join(self.aleatorio.choice(alfabeto) for _ in range(n))
+
+    def test_igual_a_alinhar(self):
+        """!
+        @brief Testa que a transcrição e a pontuação coincidem com as de alinhar() para vários tamanhos de bloco.
+        """
+        for _ in range(40):
+            seq1 = self.aleatoria(self.aleatorio.randint(1, 50))
+            seq2 = self.aleatoria(self.aleatorio.randint(1, 50), AMINOACIDOS[:6])
+            esperado = alinhar_transcricao(seq1, seq2)
+            for bloco in (1, 4, 16, 64):
+                self.assertEqual(alinhar_frente_onda(seq1, seq2, bloco=bloco), esperado)
+
+    def test_preencher_bloco(self):
+        """!
+        @brief Testa que um bloco com as fronteiras da matriz completa reproduz a sua última linha e coluna.
+        """
+        seq1, seq2 = "HGWAGKLMNP", "PHSWGKLP"
+        pontuacao, _ = alinhar(seq1, seq2)
+        substituicoes = np.array([[Blosum62().substituicao(a, b) for a in seq1[2:]] for b in seq2[3:]])
+        topo = np.array(pontuacao[3][2:])
+        esquerda = np.array([linha[2] for linha in pontuacao[3:]])
+        fundo, direita, _ = preencher_bloco(substituicoes, topo, esquerda, -8)
+        self.assertEqual(fundo.tolist(), pontuacao[-1][2:])
+        self.assertEqual(direita.tolist(), [linha[-1] for linha in pontuacao[3:]])
+
+    def test_paralelo(self):
+        """!
+        @brief Testa que o preenchimento com vários processos dá o mesmo resultado que o sequencial.
+        """
+        seq1 = self.aleatoria(400)
+        seq2 = seq1[:150] + self.aleatoria(10) + seq1[180:]
+        esperado = alinhar_transcricao(seq1, seq2)
+        self.assertEqual(alinhar_frente_onda(seq1, seq2, bloco=48, processos=2), esperado)
+
+    def test_traceback_por_blocos(self):
+        """!
+        @brief Testa que o traceback só recalcula os blocos atravessados pelo caminho.
+        """
+        seq1 = self.aleatoria(600)
+        instrumentacao.ativar()
+        try:
+            transcricao = alinhar_frente_onda(seq1, seq1, bloco=100)
+            contadores = instrumentacao.relatorio()["contadores"]
+        finally:
+            instrumentacao.desativar()
+            instrumentacao.limpar()
+        self.assertEqual(transcricao.cigar, "600=")
+        self.assertEqual(contadores["alinhar_frente_onda.blocos"], 36)
+        self.assertEqual(contadores["alinhar_frente_onda.blocos_recalculados"], 6)
+
+    def test_sequencias_vazias(self):
+        """!
+        @brief Testa que sequências vazias são rejeitadas.
+        """
+        with self.assertRaises(ValueError):
+            alinhar_frente_onda("", "ACD")
+
+if __name__ == '__main__':
+    unittest.main()
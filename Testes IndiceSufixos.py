@@ -0,0 +1,97 @@
+import os
+import random
+import tempfile
+import unittest
+from IndiceSufixos import IndiceSufixos, CorrespondenciaMaxima, construir_sufixos
+
+class TesteIndiceSufixos(unittest.TestCase):
+    """!
+    @brief Testes unitários para o índice de sufixos.
+    """
+
+    def setUp(self):
+        """!
+        @brief Gera uma referência aleatória com repetições.
+        """
+        random.seed(11)
+        bloco = ''.join(random.choice("ACGT") for _ in range(60))
+        self.referencia = bloco + ''.join(random.choice("ACGT") for _ in range(200)) + bloco[:40]
+        self.indice = IndiceSufixos.construir(self.referencia)
+
+    def test_array_sufixos(self):
+        """!
+        @brief Compara o array de sufixos com a ordenação direta dos sufixos.
+        """
+        for texto in (b"banana", b"AAAAAAA", b"ACGTACGTTACG$ACG", b"A"):
+            esperado = sorted(range(len(texto)), key=lambda i: texto[i:])
+            self.assertEqual(construir_sufixos(texto).tolist(), esperado)
+
+    def test_contar_localizar(self):
+        """!
+        @brief Compara contagens e posições com uma procura exaustiva.
+        """
+        for comprimento in (1, 3, 8, 45):
+            for _ in range(10):
+                i = random.randrange(len(self.referencia) - comprimento)
+                padrao = self.referencia[i:i + comprimento]
+                esperado = [j for j in range(len(self.referencia) - comprimento + 1)
+                            if self.referencia[j:j + comprimento] == padrao]
+                self.assertEqual(self.indice.localizar(padrao), esperado)
+                self.assertEqual(self.indice.contar(padrao), len(esperado))
+        self.assertEqual(self.indice.contar("ACGTN"), 0)
+
+    def test_varias_sequencias(self):
+        """!
+        @brief Testa as coordenadas locais e que as ocorrências não atravessam sequências.
+        """
+        indice = IndiceSufixos.construir({"a": "ACGTAC", "b": "GTACCA"})
+        self.assertEqual([indice.coordenadas(p) for p in indice.localizar("GTAC")], [("a", 2), ("b", 0)])
+        self.assertEqual(indice.contar("ACGT"), 1)
+        self.assertEqual(indice.contar("ACG"), 1)
+        self.assertEqual(indice.contar("ACGTACG"), 0)
+
+    def test_guardar_carregar(self):
+        """!
+        @brief Testa que o índice carregado do disco (mapeado em memória) dá os mesmos resultados.
+        """
+        with tempfile.TemporaryDirectory() as pasta:
+            prefixo = os.path.join(pasta, "ref")
+            self.indice.guardar(prefixo)
+            with IndiceSufixos.carregar(prefixo) as carregado:
+                self.assertEqual(carregado.sufixos.tolist(), self.indice.sufixos.tolist())
+                padrao = self.referencia[10:30]
+                self.assertEqual(carregado.localizar(padrao), self.indice.localizar(padrao))
+                self.assertEqual(carregado.coordenadas(5), ("seq", 5))
+
+    def test_correspondencias_maximas(self):
+        """!
+        @brief Compara as MEMs com uma procura exaustiva, numa referência aleatória e numa repetitiva.
+        """
+        query = self.referencia[20:55] + "T" + self.referencia[100:130]
+        obtido = self.indice.correspondencias_maximas(query, 12)
+        self.assertEqual(obtido, self.correspondencias_exaustivas(query, self.referencia, 12))
+        self.assertEqual(obtido[0][:2], (0, 20))
+        repetitiva = "AC" * 40 + "G" + "ACG" * 20
+        query = "TACACACACGACGACGTACACAC"
+        obtido = IndiceSufixos.construir(repetitiva).correspondencias_maximas(query, 4)
+        self.assertEqual(obtido, self.correspondencias_exaustivas(query, repetitiva, 4))
+
+    def correspondencias_exaustivas(self, query, ref, minimo):
+        """!
+        @brief Procura exaustiva das correspondências exatas maximais.
+        """
+        esperado = []
+        for i in range(len(query)):
+            for p in range(len(ref)):
+                if (i > 0 and p > 0 and query[i - 1] == ref[p - 1]) or query[i] != ref[p]:
+                    continue
+                comprimento = 0
+                while i + comprimento < len(query) and p + comprimento < len(ref) \
+                        and query[i + comprimento] == ref[p + comprimento]:
+                    comprimento += 1
+                if comprimento >= minimo:
+                    esperado.append(CorrespondenciaMaxima(i, p, comprimento))
+        return esperado
+
+if __name__ == '__main__':
+    unittest.main()
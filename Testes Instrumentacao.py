@@ -0,0 +1,76 @@
+import os
+import pstats
+import tempfile
+import unittest
+from aasb import instrumentacao, needleman_wunsch as nw, smith_waterman as sw
+from aasb.instrumentacao import ativar, desativar, fase, contar, instrumentado, relatorio, obter_pstats, exportar_pstats
+
+@instrumentado("externa")
+def externa():
+    with fase("interna"):
+        contar("passos", 3)
+    with fase("interna"):
+        contar("passos")
+
+class TesteInstrumentacao(unittest.TestCase):
+    """!
+    @brief Testes unitários para a instrumentação.
+    """
+
+    def tearDown(self):
+        desativar()
+        instrumentacao.limpar()
+
+    def test_desativada(self):
+        """!
+        @brief Testa que nada é registado com a instrumentação desativada.
+        """
+        externa()
+        self.assertEqual(relatorio(), {"fases": {}, "contadores": {}})
+
+    def test_fases_e_contadores(self):
+        """!
+        @brief Testa o registo de fases aninhadas e de contadores.
+        """
+        ativar()
+        externa()
+        externa()
+        dados = relatorio()
+        self.assertEqual(set(dados["fases"]), {"externa", "externa/interna"})
+        self.assertEqual(dados["fases"]["externa"]["chamadas"], 2)
+        self.assertEqual(dados["fases"]["externa/interna"]["chamadas"], 4)
+        self.assertLessEqual(dados["fases"]["externa"]["tempo_proprio"], dados["fases"]["externa"]["tempo_total"])
+        self.assertEqual(dados["contadores"], {"passos": 8})
+
+    def test_pstats(self):
+        """!
+        @brief Testa a exportação no formato do pstats.
+        """
+        ativar()
+        externa()
+        estatisticas = obter_pstats().stats
+        self.assertEqual(estatisticas[("<fase>", 0, "externa/interna")][1], 2)
+        self.assertIn(("<fase>", 0, "externa"), estatisticas[("<fase>", 0, "externa/interna")][4])
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "fases.prof")
+            exportar_pstats(caminho)
+            self.assertEqual(pstats.Stats(caminho).stats, estatisticas)
+
+    def test_alinhadores(self):
+        """!
+        @brief Testa as fases e contadores registados pelos alinhadores.
+        """
+        ativar()
+        _, traceback = nw.alinhar("HGWAG", "PHSWG")
+        nw.reconstruir_alinhamento("HGWAG", "PHSWG", traceback)
+        matriz = [[2 if i == j else -1 for j in range(4)] for i in range(4)]
+        score, trace = sw.SW("ACGT", "AGT", matriz, -2)
+        sw.reconstruct_SW("ACGT", "AGT", score, trace)
+        dados = relatorio()
+        self.assertTrue({"alinhar/inicializacao", "alinhar/preenchimento", "reconstruir_alinhamento",
+                         "SW/preenchimento", "reconstruct_SW/transcricoes_SW/traceback"} <= set(dados["fases"]))
+        self.assertEqual(dados["contadores"]["alinhar.celulas"], 25)
+        self.assertEqual(dados["contadores"]["SW.celulas"], 12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from Kmeros import (codificar_kmero, descodificar_kmero, kmeros_inteiros, contar_kmeros,
+                    indice_posicoes, distancia_jaccard)
+
+def complemento_inverso(kmero):
+    return kmero[::-1].translate(str.maketrans("ACGT", "TGCA"))
+
+class TesteKmeros(unittest.TestCase):
+    """!
+    @brief Testes unitários para a contagem de k-meros.
+    """
+
+    def setUp(self):
+        """!
+        @brief Gera sequências aleatórias com algumas bases ambíguas.
+        """
+        random.seed(5)
+        self.sequencias = [''.join(random.choice("ACGTACGTN") for _ in range(300)) for _ in range(4)]
+
+    def contagem_referencia(self, k, canonicos):
+        """!
+        @brief Contagem de referência com strings e um Counter.
+        """
+        contagem = Counter()
+        for s in self.sequencias:
+            for i in range(len(s) - k + 1):
+                kmero = s[i:i + k]
+                if "N" not in kmero:
+                    contagem[min(kmero, complemento_inverso(kmero)) if canonicos else kmero] += 1
+        return dict(contagem)
+
+    def test_codificacao(self):
+        """!
+        @brief Testa a conversão entre k-meros e inteiros.
+        """
+        self.assertEqual(codificar_kmero("ACGT"), 0b00011011)
+        self.assertEqual(descodificar_kmero(codificar_kmero("TTGCA" * 6 + "AC"), 32), "TTGCA" * 6 + "AC")
+        with self.assertRaises(ValueError):
+            codificar_kmero("ANT")
+
+    def test_kmeros_inteiros(self):
+        """!
+        @brief Testa as posições e valores das janelas válidas.
+        """
+        posicoes, valores = kmeros_inteiros("ACGNTTA", 2)
+        self.assertEqual(posicoes.tolist(), [0, 1, 4, 5])
+        self.assertEqual([descodificar_kmero(v, 2) for v in valores], ["AC", "CG", "TT", "TA"])
+
+    def test_contagens(self):
+        """!
+        @brief Testa as contagens simples e canónicas contra a referência.
+        """
+        for k in (1, 3, 7):
+            for canonicos in (False, True):
+                tabela = contar_kmeros(self.sequencias, k, canonicos)
+                self.assertEqual(tabela.para_dicionario(), self.contagem_referencia(k, canonicos))
+        tabela = contar_kmeros(self.sequencias, 5)
+        kmero, n = tabela.mais_frequentes(1)[0]
+        self.assertEqual(tabela.contagem(kmero), n)
+        self.assertEqual(tabela.contagem(complemento_inverso(kmero)), n)
+
+    def test_contagem_em_processos(self):
+        """!
+        @brief Testa se a contagem por lotes em vários processos dá a mesma tabela.
+        """
+        serie = contar_kmeros(self.sequencias, 6)
+        paralelo = contar_kmeros(self.sequencias, 6, processos=3)
+        self.assertEqual(serie.kmeros.tolist(), paralelo.kmeros.tolist())
+        self.assertEqual(serie.contagens.tolist(), paralelo.contagens.tolist())
+        longa = ''.join(self.sequencias)                     #uma só sequência, cortada em pedaços
+        for processos in (2, 5):
+            self.assertEqual(contar_kmeros(longa, 6, processos=processos).para_dicionario(),
+                             contar_kmeros(longa, 6).para_dicionario())
+
+    def test_espectro(self):
+        """!
+        @brief Testa o espectro e a sua exportação.
+        """
+        tabela = contar_kmeros("AAAAACCG", 2, canonicos=False)
+        self.assertEqual(tabela.espectro().tolist(), [0, 3, 0, 0, 1])
+        descritor, caminho = tempfile.mkstemp()
+        os.close(descritor)
+        try:
+            tabela.exportar_espectro(caminho)
+            with open(caminho) as ficheiro:
+                self.assertEqual(ficheiro.read(), "1\t3\n4\t1\n")
+        finally:
+            os.remove(caminho)
+
+    def test_indice_posicoes(self):
+        """!
+        @brief Testa o índice de posições de cada k-mero.
+        """
+        kmeros, inicios, posicoes = indice_posicoes("AATATAT", 3)
+        grupos = {descodificar_kmero(v, 3): posicoes[inicios[i]:inicios[i + 1]].tolist()
+                  for i, v in enumerate(kmeros)}
+        self.assertEqual(grupos, {"AAT": [0], "ATA": [1, 3], "TAT": [2, 4]})
+
+    def test_distancia_jaccard(self):
+        """!
+        @brief Testa a distância de Jaccard entre tabelas de k-meros.
+        """
+        a = contar_kmeros("ACGTTGCA", 3)
+        self.assertEqual(distancia_jaccard(a, a), 0.0)
+        self.assertEqual(distancia_jaccard(contar_kmeros("AAAA", 3), contar_kmeros("CCGG", 3)), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from aasb.linha_comandos import executar, main
+from aasb.needleman_wunsch import alinhar
+from aasb.sequencias import dna_para_proteina, encontrar_orfs
+
+class TesteLinhaComandos(unittest.TestCase):
+    """!
+    @brief Testes unitários para a linha de comandos em lote.
+    """
+
+    def setUp(self):
+        """!
+        @brief Cria ficheiros FASTA temporários com leituras e referências.
+        """
+        self.pasta = tempfile.TemporaryDirectory()
+        self.leituras = {"a": "ATGAAATTTGGGCCCTAAATGCCC", "b": "ACGTACGTTTGACGTACGATCGATCGTACG", "c": "GATTACAGATTACA"}
+        self.referencias = {"r1": "TTTTACGTACGTTTGACGTACGATCGATCGTTTTT", "r2": "ATGAAATTTGGGCCCTAAAAA"}
+        self.caminho_leituras = self.escrever("leituras.fasta", self.leituras)
+        self.caminho_referencias = self.escrever("referencias.fasta", self.referencias)
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def escrever(self, nome, sequencias):
+        caminho = os.path.join(self.pasta.name, nome)
+        with open(caminho, "w") as ficheiro:
+            for identificador, sequencia in sequencias.items():
+                ficheiro.write(f">{identificador}\n{sequencia}\n")
+        return caminho
+
+    def correr(self, *argumentos):
+        saida = os.path.join(self.pasta.name, "saida.jsonl")
+        self.assertEqual(main([*argumentos, "-q", "-o", saida]), 0)
+        with open(saida) as ficheiro:
+            return [json.loads(linha) for linha in ficheiro]
+
+    def test_traducao(self):
+        """!
+        @brief Testa o subcomando translate com um e com vários processos.
+        """
+        esperado = {i: dna_para_proteina(s) for i, s in self.leituras.items()}
+        for processos in ("1", "2"):
+            linhas = self.correr("translate", self.caminho_leituras, "-p", processos, "--lote", "1")
+            self.assertEqual({l["id"]: l["proteina"] for l in linhas}, esperado)
+
+    def test_orfs(self):
+        """!
+        @brief Testa que o subcomando orfs produz uma linha por ORF.
+        """
+        linhas = self.correr("orfs", self.caminho_leituras, "--comprimento-minimo", "2")
+        esperado = [{"id": i, **orf._asdict()} for i, s in self.leituras.items() for orf in encontrar_orfs(s, 2)]
+        self.assertEqual(linhas, esperado)
+
+    def test_alinhamento(self):
+        """!
+        @brief Testa o alinhamento global de cada leitura com cada referência.
+        """
+        linhas = self.correr("align", self.caminho_leituras, "-r", self.caminho_referencias, "--renderizar")
+        self.assertEqual(len(linhas), 6)
+        for linha in linhas:
+            leitura, referencia = self.leituras[linha["id"]], self.referencias[linha["referencia"]]
+            self.assertEqual(linha["pontuacao"], alinhar(leitura, referencia)[0][-1][-1])
+            self.assertEqual(linha["alinhamento"][0].replace("-", ""), leitura)
+
+    def test_msa_arvore(self):
+        """!
+        @brief Testa que msa e tree processam cada ficheiro como um todo.
+        """
+        linhas = self.correr("msa", self.caminho_leituras)
+        self.assertEqual(len(linhas), 1)
+        alinhadas = linhas[0]["alinhamento"]
+        self.assertEqual([a["id"] for a in alinhadas], ["a", "b", "c"])
+        self.assertEqual(len({len(a["sequencia"]) for a in alinhadas}), 1)
+        guiado = self.correr("msa", self.caminho_leituras, "--arvore")[0]["alinhamento"]
+        self.assertEqual([a["sequencia"].replace("-", "") for a in guiado], list(self.leituras.values()))
+        ancorado = self.correr("msa", self.caminho_leituras, "--ancoras", "6")[0]["alinhamento"]
+        self.assertEqual([a["sequencia"].replace("-", "") for a in ancorado], list(self.leituras.values()))
+        arvore = self.correr("tree", self.caminho_leituras)[0]["arvore"]
+        self.assertEqual(sorted(arvore.replace("(", "").replace(")", "").split(",")), ["a", "b", "c"])
+
+    def test_pesquisa(self):
+        """!
+        @brief Testa o subcomando search com as coordenadas na referência.
+        """
+        linhas = self.correr("search", self.caminho_leituras, "-r", self.caminho_referencias, "--minimo", "12", "-p", "2")
+        self.assertEqual(sorted((l["id"], l["referencia"], l["pos_query"], l["pos_ref"], l["comprimento"]) for l in linhas),
+                         [("a", "r2", 0, 0, 19), ("b", "r1", 0, 4, 27)])
+
+    def test_mapeamento(self):
+        """!
+        @brief Testa o subcomando map, processado por lotes inteiros.
+        """
+        linhas = self.correr("map", self.caminho_leituras, "-r", self.caminho_referencias, "-k", "11")
+        self.assertEqual([(l["id"], l["referencia"], l["posicao"], l["cadeia"]) for l in linhas],
+                         [("a", "r2", 0, "+"), ("b", "r1", 4, "+")])
+
+    def test_motivo(self):
+        """!
+        @brief Testa o subcomando scan com um motivo lido linha a linha.
+        """
+        caminho = os.path.join(self.pasta.name, "motivo.txt")
+        with open(caminho, "w") as ficheiro:
+            ficheiro.write("TGAC\nTGAC\nTGCC\n")
+        linhas = self.correr("scan", self.caminho_leituras, "-m", caminho, "--limiar", "3")
+        self.assertEqual([(l["id"], l["posicao"], l["cadeia"]) for l in linhas], [("a", 19, "+"), ("b", 9, "+")])
+        antecipadas = self.correr("scan", self.caminho_leituras, "-m", caminho, "--limiar", "3", "--antecipar")
+        self.assertEqual(antecipadas, linhas)
+
+    def test_debito(self):
+        """!
+        @brief Testa as contagens do débito devolvido por executar.
+        """
+        saida = io.StringIO()
+        debito = executar("translate", {"tabela": 1, "seis_quadros": False}, self.leituras.items(), saida, lote=2)
+        self.assertEqual((debito["registos"], debito["residuos"], debito["resultados"]),
+                         (3, sum(map(len, self.leituras.values())), 3))
+        self.assertEqual(len(saida.getvalue().splitlines()), 3)
+
+if __name__ == '__main__':
+    unittest.main()
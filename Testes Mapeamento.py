@@ -0,0 +1,99 @@
+import random
+import unittest
+import numpy as np
+from aasb.mapeamento import Mapeador, alinhar_em_banda
+from aasb.sequencias import complemento_inverso
+
+def distancia_semiglobal(leitura, referencia):
+    """!
+    @brief Distância de edição semi-global (pontas da referência livres) por programação dinâmica completa.
+    """
+    anterior = [0] * (len(referencia) + 1)
+    for i, a in enumerate(leitura, 1):
+        atual = [i] + [0] * len(referencia)
+        for j, b in enumerate(referencia, 1):
+            atual[j] = min(anterior[j - 1] + (a != b), anterior[j] + 1, atual[j - 1] + 1)
+        anterior = atual
+    return min(anterior)
+
+def mutar(sequencia, aleatorio, mutacoes):
+    """!
+    @brief Aplica substituições, remoções e inserções em posições aleatórias.
+    """
+    sequencia = list(sequencia)
+    for _ in range(mutacoes):
+        p = aleatorio.randrange(1, len(sequencia) - 1)
+        tipo = aleatorio.randrange(3)
+        if tipo == 0:
+            sequencia[p] = aleatorio.choice("ACGT".replace(sequencia[p], ""))
+        elif tipo == 1:
+            del sequencia[p]
+        else:
+            sequencia.insert(p, aleatorio.choice("ACGT"))
+    return "".join(sequencia)
+
+class TesteMapeamento(unittest.TestCase):
+    """!
+    @brief Testes unitários para o mapeamento de leituras.
+    """
+
+    def setUp(self):
+        """!
+        @brief Gera duas referências aleatórias.
+        """
+        self.aleatorio = random.Random(17)
+        self.referencias = {"r1": "".join(self.aleatorio.choice("ACGT") for _ in range(3000)),
+                            "r2": "".join(self.aleatorio.choice("ACGT") for _ in range(2000))}
+        self.mapeador = Mapeador(self.referencias, k=11)
+
+    def test_banda_vs_completo(self):
+        """!
+        @brief Compara a distância do alinhamento em banda com a programação dinâmica completa.
+        """
+        referencia = self.referencias["r1"]
+        for _ in range(30):
+            inicio = self.aleatorio.randrange(100, 2800)
+            leitura = mutar(referencia[inicio:inicio + 60], self.aleatorio, 3)
+            janela = referencia[inicio - 8:inicio + len(leitura) + 8]
+            codigos = lambda s: np.frombuffer(s.encode(), dtype=np.uint8)[None, :]
+            distancias, _, _ = alinhar_em_banda(codigos(leitura), codigos(janela), 8, np.array([0]),
+                                                np.array([len(janela)]))
+            self.assertEqual(distancias[0], distancia_semiglobal(leitura, janela))
+
+    def test_mapear(self):
+        """!
+        @brief Testa a posição, cadeia, distância e CIGAR de leituras com erros em ambas as cadeias.
+        """
+        leituras, esperado = [], []
+        for i in range(200):
+            nome = self.aleatorio.choice(["r1", "r2"])
+            inicio = self.aleatorio.randrange(0, len(self.referencias[nome]) - 80)
+            leitura = mutar(self.referencias[nome][inicio:inicio + 80], self.aleatorio, 2)
+            cadeia = self.aleatorio.choice("+-")
+            leituras.append((f"l{i}", leitura if cadeia == "+" else complemento_inverso(leitura)))
+            esperado.append((nome, inicio, cadeia))
+        for (identificador, leitura), (nome, inicio, cadeia), mapeamento in \
+                zip(leituras, esperado, self.mapeador.mapear(leituras)):
+            self.assertEqual((mapeamento.leitura, mapeamento.referencia, mapeamento.cadeia), (identificador, nome, cadeia))
+            self.assertLessEqual(abs(mapeamento.posicao - inicio), 2)
+            self.assertLessEqual(mapeamento.distancia, 2)
+            consulta = leitura if cadeia == "+" else complemento_inverso(leitura)
+            alinhada, referencia = mapeamento.transcricao.renderizar(consulta, self.referencias[nome])
+            self.assertEqual(alinhada.replace("-", ""), consulta)
+            self.assertEqual(sum(a != b for a, b in zip(alinhada, referencia)), mapeamento.distancia)
+
+    def test_extremos_e_nao_mapeadas(self):
+        """!
+        @brief Testa leituras nos extremos das referências, leituras sem sementes e o limite de distância.
+        """
+        r1, r2 = self.referencias["r1"], self.referencias["r2"]
+        inicio, fim, aleatoria, curta = self.mapeador.mapear([r1[:50], r2[-50:], "ACGT" * 20, "ACGTACG"])
+        self.assertEqual((inicio.referencia, inicio.posicao, inicio.transcricao.cigar), ("r1", 0, "50="))
+        self.assertEqual((fim.referencia, fim.posicao, fim.transcricao.fim2), ("r2", 1950, 2000))
+        self.assertIsNone(aleatoria)
+        self.assertIsNone(curta)
+        leitura = mutar(r1[500:560], self.aleatorio, 3)
+        self.assertIsNone(self.mapeador.mapear_leitura(leitura, distancia_maxima=0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+from PWM import MatrizMotivo
+from Motivos import AmostradorGibbs, descobrir_motivo
+
+class TesteDescobertaMotivos(unittest.TestCase):
+    """!
+    @brief Testes unitários para a descoberta de motivos por amostragem de Gibbs.
+    """
+
+    def setUp(self):
+        """!
+        @brief Gera sequências aleatórias com um motivo plantado numa posição conhecida.
+        """
+        random.seed(11)
+        self.motivo = "TTGACGCA"
+        self.sequencias, self.posicoes = [], []
+        for _ in range(30):
+            fundo = ''.join(random.choice('ACGT') for _ in range(60))
+            posicao = random.randrange(len(fundo) - len(self.motivo))
+            self.sequencias.append(fundo[:posicao] + self.motivo + fundo[posicao + len(self.motivo):])
+            self.posicoes.append(posicao)
+
+    def test_contagens_incrementais(self):
+        """!
+        @brief Testa se as contagens atualizadas incrementalmente coincidem com a tabela recalculada.
+        """
+        amostrador = AmostradorGibbs(self.sequencias, 8, semente=1)
+        for _ in range(3):
+            amostrador.iterar()
+        esperado = MatrizMotivo.de_sequencias(amostrador.sitios()).valores
+        self.assertEqual(amostrador.contagens.tolist(), esperado.tolist())
+
+    def test_descobre_motivo_plantado(self):
+        """!
+        @brief Testa se o motivo plantado é recuperado.
+        """
+        resultado = descobrir_motivo(self.sequencias, 8, reinicios=3, iteracoes=20, processos=1)
+        self.assertEqual(resultado.posicoes, self.posicoes)
+        self.assertEqual(set(resultado.sitios), {self.motivo})
+        self.assertAlmostEqual(resultado.pwm[0]['T'], max(resultado.pwm[0].values()))
+
+    def test_reinicios_em_paralelo(self):
+        """!
+        @brief Testa se os reinícios em processos separados dão o mesmo resultado que em série.
+        """
+        serie = descobrir_motivo(self.sequencias, 8, reinicios=2, iteracoes=5, processos=1)
+        paralelo = descobrir_motivo(self.sequencias, 8, reinicios=2, iteracoes=5, processos=2)
+        self.assertEqual(serie.posicoes, paralelo.posicoes)
+        self.assertAlmostEqual(serie.pontuacao, paralelo.pontuacao)
+
+    def test_sequencia_curta(self):
+        """!
+        @brief Testa a validação das sequências mais curtas do que o motivo.
+        """
+        with self.assertRaises(AssertionError):
+            AmostradorGibbs(["ACGT", "ACGTACGT"], 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@
 """
 
 import unittest
-from alinhamento_sequencias import alinhar, obter_pontuacao_alinhamento, reconstruir_alinhamento
+from aasb.needleman_wunsch import alinhar, obter_pontuacao_alinhamento, reconstruir_alinhamento
 
 class TestAlinhamentoSequencias(unittest.TestCase):
     """
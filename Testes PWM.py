@@ -1,5 +1,11 @@
+import itertools
+import math
+import os
+import random
+import tempfile
 import unittest
-from PWM import AnalisadorSequencias
+import numpy as np
+from PWM import AnalisadorSequencias, BibliotecaMotivos, MatrizMotivo, DistribuicaoPontuacoes
 
 class TesteAnalisadorSequencias(unittest.TestCase):
     """!
@@ -73,5 +79,387 @@ class TesteAnalisadorSequencias(unittest.TestCase):
                           for pos in pssm 
                           for val in pos.values()))
 
+class TesteMatrizMotivo(unittest.TestCase):
+    """!
+    @brief Testes unitários para a representação matricial MatrizMotivo.
+    """
+
+    def setUp(self):
+        """!
+        @brief Prepara os dados de teste utilizados em vários testes.
+        """
+        self.sequencias = ['ATTG', 'ATCG', 'ATTC', 'ACTC']
+
+    def test_contagens_coincidem_com_tabela(self):
+        """!
+        @brief Testa se a contagem vetorizada coincide com a tabela de contagens.
+        """
+        matriz = MatrizMotivo.de_sequencias(self.sequencias, pseudocontagem=0.5)
+        self.assertEqual(matriz.valores.shape, (4, 4))
+        self.assertEqual(matriz.para_dicionarios(),
+                         AnalisadorSequencias.tabela_contagens(self.sequencias, pseudocontagem=0.5))
+        self.assertEqual(matriz.valores[1, matriz.indice['C']], 1.5)
+
+    def test_caracteres_fora_do_alfabeto(self):
+        """!
+        @brief Testa se os caracteres fora do alfabeto são ignorados na contagem.
+        """
+        matriz = MatrizMotivo.de_sequencias(['A-', 'AN'])
+        self.assertEqual(matriz.valores.sum(axis=1).tolist(), [2.0, 0.0])
+
+    def test_conversao_dicionarios(self):
+        """!
+        @brief Testa a conversão de e para a lista de dicionários.
+        """
+        pwm = AnalisadorSequencias.pwm(self.sequencias)
+        matriz = MatrizMotivo.de_dicionarios(pwm)
+        self.assertEqual(matriz.alfabeto, "ACGT")
+        self.assertEqual(matriz.para_dicionarios(), pwm)
+
+    def test_pssm(self):
+        """!
+        @brief Testa se a PSSM da matriz coincide com calcula_pssm.
+        """
+        pwm = AnalisadorSequencias.pwm(self.sequencias, pseudocontagem=1)
+        esperado = AnalisadorSequencias.calcula_pssm(pwm)
+        obtido = MatrizMotivo.de_dicionarios(pwm).pssm().para_dicionarios()
+        for col_esperada, col_obtida in zip(esperado, obtido):
+            for base in col_esperada:
+                self.assertAlmostEqual(col_esperada[base], col_obtida[base])
+
+    def test_pwm_numero_de_sequencias(self):
+        """!
+        @brief Testa a normalização da PWM quando o número de sequências difere do comprimento.
+        """
+        pwm = AnalisadorSequencias.pwm(['AT', 'AT', 'AC'])
+        self.assertAlmostEqual(pwm[1]['T'], 2 / 3)
+        self.assertAlmostEqual(sum(pwm[1].values()), 1.0)
+
+class TestePesquisaMotivos(unittest.TestCase):
+    """!
+    @brief Testes unitários para a pesquisa vetorizada de PSSMs.
+    """
+
+    def setUp(self):
+        """!
+        @brief Prepara uma PSSM e uma sequência onde o motivo ocorre nas duas cadeias.
+        """
+        pwm = AnalisadorSequencias.pwm(['ATTG', 'ATCG', 'ATTC', 'ACTC'], pseudocontagem=0.5)
+        self.pssm = AnalisadorSequencias.calcula_pssm(pwm)
+        self.sequencia = "TTTATTGTTTCGATTT"       # ATTG em 3 e CGAT (comp. inv. ATCG) em 10
+
+    def pontuar(self, janela):
+        """!
+        @brief Pontuação de referência de uma janela, calculada coluna a coluna.
+        """
+        return sum(coluna[base] for coluna, base in zip(self.pssm, janela))
+
+    def test_pontuacoes_coincidem_com_referencia(self):
+        """!
+        @brief Testa se todas as janelas de ambas as cadeias têm a pontuação de referência.
+        """
+        complementos = {'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A'}
+        ocorrencias = AnalisadorSequencias.procurar_motivo(self.sequencia, self.pssm,
+                                                          limiar=float('-inf'))
+        self.assertEqual(len(ocorrencias), 2 * (len(self.sequencia) - 3))
+        for o in ocorrencias:
+            janela = self.sequencia[o.posicao:o.posicao + 4]
+            if o.cadeia == '-':
+                janela = ''.join(complementos[b] for b in reversed(janela))
+            self.assertAlmostEqual(o.pontuacao, self.pontuar(janela))
+
+    def test_limiar_e_top_k(self):
+        """!
+        @brief Testa a seleção por limiar e por número máximo de ocorrências.
+        """
+        melhores = AnalisadorSequencias.procurar_motivo(self.sequencia, self.pssm, top_k=2)
+        self.assertEqual({(o.posicao, o.cadeia) for o in melhores}, {(3, '+'), (10, '-')})
+        limiar = min(o.pontuacao for o in melhores)
+        acima = AnalisadorSequencias.procurar_motivo(self.sequencia, self.pssm, limiar=limiar)
+        self.assertEqual(acima, melhores)
+        diretas = AnalisadorSequencias.procurar_motivo(self.sequencia, self.pssm, top_k=2,
+                                                      ambas_cadeias=False)
+        self.assertTrue(all(o.cadeia == '+' for o in diretas))
+
+    def test_caracteres_ambiguos(self):
+        """!
+        @brief Testa se as janelas com N não são reportadas.
+        """
+        ocorrencias = AnalisadorSequencias.procurar_motivo("ATTGNATTG", self.pssm, limiar=-100)
+        self.assertEqual(sorted({o.posicao for o in ocorrencias}), [0, 5])
+
+    def test_proteinas(self):
+        """!
+        @brief Testa a pesquisa de uma PSSM de proteínas, que por omissão só usa a cadeia direta.
+        """
+        pwm = AnalisadorSequencias.pwm(['MKV', 'MKI', 'MRV'], tipo="PROTEINA", pseudocontagem=0.1)
+        pssm = AnalisadorSequencias.calcula_pssm(pwm, AnalisadorSequencias.ALFABETO_PROTEINA)
+        sequencia = "GGMKVAAMRVW"
+        melhores = AnalisadorSequencias.procurar_motivo(sequencia, pssm, top_k=2)
+        self.assertEqual([(o.posicao, o.cadeia) for o in melhores], [(2, '+'), (7, '+')])
+        antecipadas, _ = AnalisadorSequencias.procurar_motivo_antecipando(sequencia, pssm, melhores[-1].pontuacao)
+        self.assertEqual([o[:2] for o in antecipadas], [o[:2] for o in melhores])
+        self.assertRaises(AssertionError, AnalisadorSequencias.procurar_motivo, sequencia, pssm, ambas_cadeias=True)
+
+    def test_seq_mais_provavel_motivo_longo(self):
+        """!
+        @brief Testa a procura com um motivo longo cujo produto de probabilidades sofre underflow.
+        """
+        motivo = "ACGT" * 150
+        pwm = AnalisadorSequencias.pwm([motivo, motivo.replace("G", "C")], pseudocontagem=0.1)
+        resultado = AnalisadorSequencias.seq_mais_provavel("TT" + motivo + "TT", pwm)
+        self.assertEqual(resultado, [motivo])
+
+    def test_procurar_em_fasta(self):
+        """!
+        @brief Testa se a pesquisa por blocos num FASTA coincide com a pesquisa em memória.
+        """
+        random.seed(7)
+        registos = {f"r{i}": ''.join(random.choice('ACGTN') for _ in range(tamanho))
+                    for i, tamanho in enumerate((250, 3, 97))}
+        descritor, caminho = tempfile.mkstemp(suffix=".fa")
+        with os.fdopen(descritor, "w") as ficheiro:
+            for identificador, sequencia in registos.items():
+                ficheiro.write(f">{identificador}\n")
+                ficheiro.write("\n".join(sequencia[i:i + 50] for i in range(0, len(sequencia), 50)) + "\n")
+        try:
+            obtido = sorted(AnalisadorSequencias.procurar_motivo_fasta(caminho, self.pssm, limiar=0,
+                                                                       tamanho_bloco=16))
+        finally:
+            os.remove(caminho)
+        esperado = sorted((identificador, o) for identificador, sequencia in registos.items()
+                          for o in AnalisadorSequencias.procurar_motivo(sequencia, self.pssm, limiar=0))
+        self.assertTrue(esperado)
+        self.assertEqual([(i, o.posicao, o.cadeia) for i, o in obtido],
+                         [(i, o.posicao, o.cadeia) for i, o in esperado])
+        for (_, a), (_, b) in zip(obtido, esperado):
+            self.assertAlmostEqual(a.pontuacao, b.pontuacao)
+
+class TesteBibliotecaMotivos(unittest.TestCase):
+    """!
+    @brief Testes unitários para a pesquisa simultânea de várias PSSMs.
+    """
+
+    def setUp(self):
+        """!
+        @brief Prepara motivos de vários comprimentos e uma sequência com N.
+        """
+        aleatorio = random.Random(49)
+        self.motivos = {}
+        for i, L in enumerate((4, 6, 6, 9, 12)):
+            base = ''.join(aleatorio.choice('ACGT') for _ in range(L))
+            sitios = [''.join(c if aleatorio.random() < 0.8 else aleatorio.choice('ACGT') for c in base)
+                      for _ in range(8)]
+            self.motivos[f"m{i}"] = MatrizMotivo.de_sequencias(sitios, pseudocontagem=0.25).normalizar().pssm()
+        self.limiares = {nome: 0.5 * m.valores.max(axis=1).sum() for nome, m in self.motivos.items()}
+        self.sequencia = ''.join(aleatorio.choice('ACGT') for _ in range(3000))
+        self.sequencia = self.sequencia[:1000] + "NN" + self.sequencia[1002:]
+
+    def comparar(self, obtidas, esperadas):
+        """!
+        @brief Compara ocorrências pelas posições e cadeias e pelas pontuações aproximadas.
+        """
+        obtidas, esperadas = sorted(obtidas), sorted(esperadas)
+        self.assertEqual([o[:2] for o in obtidas], [o[:2] for o in esperadas])
+        for a, b in zip(obtidas, esperadas):
+            self.assertAlmostEqual(a.pontuacao, b.pontuacao)
+
+    def test_igual_a_pesquisa_individual(self):
+        """!
+        @brief Testa se cada motivo tem as mesmas ocorrências que MatrizMotivo.procurar.
+        """
+        resultado = BibliotecaMotivos(self.motivos, self.limiares).procurar(self.sequencia)
+        self.assertEqual(list(resultado), list(self.motivos))
+        for nome, matriz in self.motivos.items():
+            esperadas = matriz.procurar(self.sequencia, self.limiares[nome])
+            self.assertTrue(esperadas)
+            self.comparar(resultado[nome], esperadas)
+            pontuacoes = [round(o.pontuacao, 9) for o in resultado[nome]]
+            self.assertEqual(pontuacoes, sorted(pontuacoes, reverse=True))
+
+    def test_uma_cadeia_e_pvalor(self):
+        """!
+        @brief Testa a pesquisa só na cadeia direta e os limiares por P-valor.
+        """
+        biblioteca = BibliotecaMotivos(self.motivos, pvalor=1e-3)
+        for nome, ocorrencias in biblioteca.procurar(self.sequencia, ambas_cadeias=False).items():
+            matriz = self.motivos[nome]
+            self.comparar(ocorrencias, matriz.procurar(self.sequencia, matriz.limiar_pvalor(1e-3),
+                                                       ambas_cadeias=False))
+
+    def test_infinitos_e_proteinas(self):
+        """!
+        @brief Testa PSSMs com -inf (sem pseudocontagens) e um alfabeto sem complemento.
+        """
+        motivo = MatrizMotivo.de_sequencias(["ACDE", "ACDF"], "ACDEF").normalizar().pssm()
+        resultado = BibliotecaMotivos({"p": motivo}, limiar=0).procurar("FFACDEACDFACCC")
+        self.assertEqual([(o.posicao, o.cadeia) for o in resultado["p"]], [(2, '+'), (6, '+')])
+
+    def test_procurar_em_fasta(self):
+        """!
+        @brief Testa se a pesquisa por blocos num FASTA coincide com a pesquisa em memória.
+        """
+        descritor, caminho = tempfile.mkstemp(suffix=".fa")
+        with os.fdopen(descritor, "w") as ficheiro:
+            ficheiro.write(">r1\n" + self.sequencia[:1700] + "\n>r2\n" + self.sequencia[1700:] + "\n")
+        biblioteca = BibliotecaMotivos(self.motivos, self.limiares)
+        try:
+            obtido = sorted(biblioteca.procurar_em_fasta(caminho, tamanho_bloco=256))
+        finally:
+            os.remove(caminho)
+        esperado = sorted((identificador, nome, o)
+                          for identificador, parte in (("r1", self.sequencia[:1700]), ("r2", self.sequencia[1700:]))
+                          for nome, ocorrencias in biblioteca.procurar(parte).items() for o in ocorrencias)
+        self.assertEqual([(i, n, o[:2]) for i, n, o in obtido], [(i, n, o[:2]) for i, n, o in esperado])
+
+class TestePesquisaAntecipada(unittest.TestCase):
+    """!
+    @brief Testes unitários para a pesquisa de PSSMs com corte antecipado das janelas.
+    """
+
+    def setUp(self):
+        """!
+        @brief Prepara um motivo longo, implantado numa sequência aleatória com N.
+        """
+        aleatorio = random.Random(50)
+        base = ''.join(aleatorio.choice('ACGT') for _ in range(20))
+        sitios = [''.join(c if aleatorio.random() < 0.85 else aleatorio.choice('ACGT') for c in base)
+                  for _ in range(12)]
+        self.pwm = AnalisadorSequencias.pwm(sitios, pseudocontagem=0.25)
+        self.pssm = AnalisadorSequencias.calcula_pssm(self.pwm)
+        self.sequencia = ''.join(aleatorio.choice('ACGT') for _ in range(5000))
+        self.sequencia = self.sequencia[:700] + base + self.sequencia[720:1500] + "N" + self.sequencia[1501:]
+
+    def test_igual_a_pesquisa_exaustiva(self):
+        """!
+        @brief Testa se as ocorrências coincidem com a pesquisa exaustiva para vários limiares.
+        """
+        matriz = MatrizMotivo.de_dicionarios(self.pssm)
+        for pvalor in (1e-2, 1e-4, 1e-7):
+            limiar = matriz.limiar_pvalor(pvalor)
+            for ambas in (True, False):
+                esperadas = AnalisadorSequencias.procurar_motivo(self.sequencia, self.pssm, limiar=limiar,
+                                                                 ambas_cadeias=ambas)
+                obtidas, ignoradas = AnalisadorSequencias.procurar_motivo_antecipando(self.sequencia, self.pssm,
+                                                                                     limiar, ambas)
+                self.assertEqual(obtidas, esperadas)
+                self.assertGreater(ignoradas, 0.3 if pvalor < 1e-3 else 0)
+                self.assertLess(ignoradas, 1)
+        self.assertIn((700, '+'), [o[:2] for o in obtidas])
+
+    def test_limiar_igual_a_pontuacao(self):
+        """!
+        @brief Testa que uma janela com pontuação exatamente igual ao limiar é reportada pelos dois métodos.
+        """
+        matriz = MatrizMotivo.de_dicionarios(self.pssm)
+        pontuacoes = matriz.pontuar(matriz.codificar(self.sequencia))
+        for limiar in sorted(pontuacoes[np.isfinite(pontuacoes)])[-40::7]:
+            esperadas = matriz.procurar(self.sequencia, limiar)
+            self.assertEqual(matriz.procurar_antecipando(self.sequencia, limiar)[0], esperadas)
+            self.assertIn(limiar, [o.pontuacao for o in esperadas])
+
+    def test_fracao_ignorada_cresce_com_limiar(self):
+        """!
+        @brief Testa que um limiar mais alto corta mais janelas e que sem limiar nada é ignorado.
+        """
+        matriz = MatrizMotivo.de_dicionarios(self.pssm)
+        fracoes = [matriz.procurar_antecipando(self.sequencia, matriz.limiar_pvalor(p))[1] for p in (1e-2, 1e-6)]
+        self.assertLess(fracoes[0], fracoes[1])
+        todas, ignoradas = matriz.procurar_antecipando(self.sequencia, float('-inf'), ambas_cadeias=False)
+        self.assertEqual(ignoradas, 0)
+        self.assertEqual(len(todas), len(matriz.procurar(self.sequencia, float('-inf'), ambas_cadeias=False)))
+
+    def test_conteudo_informacao_e_infinitos(self):
+        """!
+        @brief Testa o conteúdo de informação e a pesquisa com pontuações -inf (sem pseudocontagens).
+        """
+        matriz = MatrizMotivo.de_sequencias(['AAAA', 'AACG', 'ACGT']).normalizar().pssm()
+        self.assertEqual(list(matriz.conteudo_informacao().round(6)), [2.0, 1.081704, 0.415037, 0.415037])
+        sequencia = "TTAACGTTACGTNAAAA"
+        esperadas = matriz.procurar(sequencia, -5)
+        obtidas, _ = matriz.procurar_antecipando(sequencia, -5)
+        self.assertEqual([o[:2] for o in sorted(obtidas)], [o[:2] for o in sorted(esperadas)])
+        self.assertTrue(esperadas)
+        self.assertEqual(matriz.procurar_antecipando("ACG", 0), ([], 0.0))
+
+class TesteDistribuicaoPontuacoes(unittest.TestCase):
+    """!
+    @brief Testes unitários para o cálculo exato de P-valores de uma PSSM.
+    """
+
+    def setUp(self):
+        """!
+        @brief Prepara uma PSSM com pontuações inteiras e enumera todas as janelas possíveis.
+        """
+        self.fundo = {'A': 0.3, 'C': 0.2, 'G': 0.2, 'T': 0.3}
+        self.pssm = [{'A': 2, 'C': -1, 'G': 0, 'T': -3},
+                     {'A': -2, 'C': 1, 'G': float('-inf'), 'T': 3},
+                     {'A': 0, 'C': 0, 'G': 2, 'T': -1}]
+        self.janelas = []
+        for janela in itertools.product("ACGT", repeat=3):
+            pontuacao = sum(coluna[b] for coluna, b in zip(self.pssm, janela))
+            probabilidade = self.fundo[janela[0]] * self.fundo[janela[1]] * self.fundo[janela[2]]
+            self.janelas.append((pontuacao, probabilidade))
+
+    def pvalor_exato(self, limiar):
+        """!
+        @brief P-valor de referência obtido por enumeração.
+        """
+        return sum(p for s, p in self.janelas if s >= limiar)
+
+    def test_pvalor_exato(self):
+        """!
+        @brief Testa se o P-valor coincide com a enumeração de todas as janelas.
+        """
+        for limiar in (-10, -4, 0, 0.5, 3, 7, 8):
+            self.assertAlmostEqual(
+                AnalisadorSequencias.pvalor_pontuacao(limiar, self.pssm, self.fundo),
+                self.pvalor_exato(limiar))
+
+    def test_limiar_pvalor(self):
+        """!
+        @brief Testa se o limiar é a menor pontuação com P-valor dentro do pedido.
+        """
+        for pvalor in (0.5, 0.1, 0.01, 1e-6):
+            limiar = AnalisadorSequencias.limiar_pvalor(pvalor, self.pssm, self.fundo)
+            self.assertLessEqual(self.pvalor_exato(limiar), pvalor)
+            self.assertGreater(self.pvalor_exato(limiar - 0.01), pvalor)
+
+    def test_pontuacoes_alcancaveis(self):
+        """!
+        @brief Compara o P-valor de todas as pontuações alcançáveis com a enumeração exaustiva.
+
+        @details Com uma só posição, ou pontuações múltiplas da granularidade, o resultado é
+                 exato; nos restantes casos o erro de cada janela é de no máximo L / 2 intervalos.
+        """
+        aleatorio = random.Random(29)
+        fundo = {'A': 0.1, 'C': 0.4, 'G': 0.3, 'T': 0.2}
+        for L, casas, exato in ((1, 6, True), (1, 3, True), (3, 2, True), (4, 1, True), (3, 6, False)):
+            for _ in range(5):
+                pssm = [{b: round(aleatorio.uniform(-3, 2), casas) for b in "ACGT"} for _ in range(L)]
+                janelas = []
+                for janela in itertools.product("ACGT", repeat=L):
+                    janelas.append((sum(coluna[b] for coluna, b in zip(pssm, janela)),
+                                    math.prod(fundo[b] for b in janela)))
+                for pontuacao, _ in janelas:
+                    obtido = AnalisadorSequencias.pvalor_pontuacao(pontuacao, pssm, fundo)
+                    if exato:
+                        self.assertAlmostEqual(obtido, sum(p for s, p in janelas if s >= pontuacao - 1e-9))
+                    else:
+                        folga = L * 0.005 + 1e-9
+                        self.assertGreaterEqual(obtido + 1e-12, sum(p for s, p in janelas if s >= pontuacao + folga))
+                        self.assertLessEqual(obtido - 1e-12, sum(p for s, p in janelas if s >= pontuacao - folga))
+                maximo = max(s for s, _ in janelas)
+                self.assertGreater(AnalisadorSequencias.pvalor_pontuacao(maximo, pssm, fundo), 0)
+
+    def test_cache(self):
+        """!
+        @brief Testa se a distribuição é reutilizada para o mesmo motivo.
+        """
+        matriz = MatrizMotivo.de_dicionarios(self.pssm)
+        distribuicao = matriz.distribuicao(self.fundo)
+        self.assertIsInstance(distribuicao, DistribuicaoPontuacoes)
+        self.assertIs(MatrizMotivo.de_dicionarios(self.pssm).distribuicao(self.fundo), distribuicao)
+
 if __name__ == '__main__':
     unittest.main()
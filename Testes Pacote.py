@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+import unittest
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+def executar(*argumentos):
+    return subprocess.run([sys.executable, *argumentos], cwd=PASTA, capture_output=True,
+                          text=True, check=True).stdout.strip()
+
+class TestePacote(unittest.TestCase):
+    """!
+    @brief Testes da organização em pacote e do arranque rápido.
+    """
+
+    def test_importacao_sem_numpy(self):
+        """!
+        @brief Testa que importar o pacote e usar complemento_inverso não importa NumPy.
+        """
+        codigo = ("import sys, aasb\n"
+                  "from aasb.sequencias import complemento_inverso\n"
+                  "print(complemento_inverso('ACGTT'), 'numpy' in sys.modules)")
+        self.assertEqual(executar("-c", codigo), "AACGT False")
+
+    def test_numpy_diferido(self):
+        """!
+        @brief Testa que as funções vetorizadas importam NumPy quando são usadas.
+        """
+        codigo = ("import sys\n"
+                  "from aasb.sequencias import contagem_bases, dna_para_proteina\n"
+                  "print(contagem_bases('ACGGT')['G'], dna_para_proteina('ATGTAA'), 'numpy' in sys.modules)")
+        self.assertEqual(executar("-c", codigo), "2 M_ True")
+
+    def test_linha_de_comandos(self):
+        """!
+        @brief Testa o subcomando complemento_inverso da linha de comandos.
+        """
+        self.assertEqual(executar("-m", "aasb", "complemento_inverso", "ACGTT", "aatt"), "AACGT\nAATT")
+
+    def test_nomes_antigos(self):
+        """!
+        @brief Testa que os nomes antigos dos módulos continuam a funcionar.
+        """
+        import Sequências
+        import Blast
+        from aasb import sequencias, blast
+        self.assertIs(Sequências, sequencias)
+        self.assertIs(Blast, blast)
+
+if __name__ == '__main__':
+    unittest.main()
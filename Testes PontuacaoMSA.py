@@ -0,0 +1,91 @@
+import random
+import unittest
+from aasb.alinhamento_progressivo import alinhamento_progressivo
+from aasb.blosum import Blosum62
+from aasb.pontuacao_msa import PontuacaoMSA, matriz_identidade, soma_pares
+
+AMINOACIDOS = "ACDEFGHIKLMNPQRSTVWY"
+
+def soma_pares_ingenua(alinhamento, matriz, gap):
+    """!
+    @brief Soma dos pares por definição, O(k² L).
+    """
+    total = 0
+    for coluna in zip(*alinhamento):
+        for i in range(len(coluna)):
+            for j in range(i + 1, len(coluna)):
+                a, b = coluna[i], coluna[j]
+                if a == "-" and b == "-":
+                    continue
+                total += gap if "-" in (a, b) else matriz[a][b]
+    return total
+
+class TestePontuacaoMSA(unittest.TestCase):
+    """!
+    @brief Testes unitários para a pontuação de alinhamentos múltiplos.
+    """
+
+    def setUp(self):
+        self.aleatorio = random.Random(47)
+        self.alinhamento = ["".join(self.aleatorio.choice(AMINOACIDOS + "--") for _ in range(40)) for _ in range(12)]
+
+    def test_soma_pares(self):
+        """!
+        @brief Testa a soma dos pares com a Blosum62 contra a definição.
+        """
+        pontuacao = PontuacaoMSA(self.alinhamento)
+        self.assertEqual(pontuacao.soma_pares(), soma_pares_ingenua(self.alinhamento, Blosum62().tab, -8))
+        self.assertEqual(int(pontuacao.soma_pares_colunas().sum()), pontuacao.soma_pares())
+
+    def test_alinhamento_progressivo(self):
+        """!
+        @brief Testa a pontuação da saída de alinhamento_progressivo() com a matriz +1/-1.
+        """
+        alinhado = alinhamento_progressivo(["ACGTTGCA", "ACGTGCA", "AGTTGCA"])
+        matriz = matriz_identidade("ACGTN")
+        self.assertEqual(soma_pares(alinhado, matriz, -1), soma_pares_ingenua(alinhado, matriz, -1))
+
+    def test_entropia_conservacao(self):
+        """!
+        @brief Testa a entropia e a conservação de colunas conservadas, variáveis e só com lacunas.
+        """
+        pontuacao = PontuacaoMSA(["AAC-", "ACC-", "AGC-", "ATA-"])
+        self.assertEqual(pontuacao.entropia().tolist(), [0.0, 2.0, pontuacao.entropia()[2], 0.0])
+        self.assertAlmostEqual(pontuacao.entropia()[2], 0.8112781244591328)
+        conservacao = pontuacao.conservacao()
+        self.assertEqual(conservacao[0], 1.0)
+        self.assertEqual(conservacao[3], 0.0)
+        self.assertTrue(conservacao[0] > conservacao[2] > conservacao[1])
+
+    def test_substituir_linha(self):
+        """!
+        @brief Testa que a atualização incremental coincide com a pontuação recalculada de raiz.
+        """
+        pontuacao = PontuacaoMSA(self.alinhamento)
+        alinhamento = list(self.alinhamento)
+        for _ in range(25):
+            indice = self.aleatorio.randrange(len(alinhamento))
+            linha = list(alinhamento[indice])
+            for _ in range(4):
+                linha[self.aleatorio.randrange(len(linha))] = self.aleatorio.choice(AMINOACIDOS + "-")
+            alinhamento[indice] = "".join(linha)
+            recalculada = PontuacaoMSA(alinhamento)
+            self.assertEqual(pontuacao.substituir_linha(indice, alinhamento[indice]), recalculada.soma_pares())
+            self.assertEqual(pontuacao.soma_pares_colunas().tolist(), recalculada.soma_pares_colunas().tolist())
+            self.assertEqual(pontuacao.entropia().tolist(), recalculada.entropia().tolist())
+
+    def test_erros(self):
+        """!
+        @brief Testa a validação das entradas.
+        """
+        with self.assertRaises(ValueError):
+            PontuacaoMSA([])
+        with self.assertRaises(ValueError):
+            PontuacaoMSA(["ACG", "AC"])
+        with self.assertRaises(ValueError):
+            PontuacaoMSA(["ACG", "ACZ"], matriz_identidade("ACGT"))
+        with self.assertRaises(ValueError):
+            PontuacaoMSA(["ACG", "ACG"]).substituir_linha(0, "AC")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,25 @@
 
 import unittest
+import Sequências
+from Sequências import *
+
+## Código genético padrão escrito à mão, independente de TABELAS_NCBI
+CODOES_PADRAO = {"TTT":"F", "TTC":"F", "TTA":"L", "TTG":"L",
+                 "TCT":"S", "TCC":"S", "TCA":"S", "TCG":"S",
+                 "TAT":"Y", "TAC":"Y", "TAA":"_", "TAG":"_",
+                 "TGT":"C", "TGC":"C", "TGA":"_", "TGG":"W",
+                 "CTT":"L", "CTC":"L", "CTA":"L", "CTG":"L",
+                 "CCT":"P", "CCC":"P", "CCA":"P", "CCG":"P",
+                 "CAT":"H", "CAC":"H", "CAA":"Q", "CAG":"Q",
+                 "CGT":"R", "CGC":"R", "CGA":"R", "CGG":"R",
+                 "ATT":"I", "ATC":"I", "ATA":"I", "ATG":"M",
+                 "ACT":"T", "ACC":"T", "ACA":"T", "ACG":"T",
+                 "AAT":"N", "AAC":"N", "AAA":"K", "AAG":"K",
+                 "AGT":"S", "AGC":"S", "AGA":"R", "AGG":"R",
+                 "GTT":"V", "GTC":"V", "GTA":"V", "GTG":"V",
+                 "GCT":"A", "GCC":"A", "GCA":"A", "GCG":"A",
+                 "GAT":"D", "GAC":"D", "GAA":"E", "GAG":"E",
+                 "GGT":"G", "GGC":"G", "GGA":"G", "GGG":"G"}
 
 class TestDNAFunctions(unittest.TestCase):
 
@@ -51,5 +71,126 @@ class TestDNAFunctions(unittest.TestCase):
     def test_obter_orfs(self):
         self.assertEqual(obter_orfs("ATGAAATAG"), [['ATG', 'AAA', 'TAG'], ['TGA', 'AAT'], ['GAA', 'ATA'], ['CTA', 'TTT', 'CAT'], ['TAT', 'TTC'], ['ATT', 'TCA']])
 
+    def test_dna_valido(self):
+        self.assertTrue(dna_valido("ATCGatcg"))
+        self.assertFalse(dna_valido("ATXG"))
+        self.assertFalse(dna_valido("ATÇG"))
+        self.assertFalse(dna_valido(""))
+        self.assertTrue(dna_valido(ADNCompacto("ACGT")))
+        self.assertFalse(dna_valido(ADNCompacto("ACNT")))
+
+    def test_contagem_bases(self):
+        self.assertEqual(contagem_bases("ATCGatcgNX"), {'A': 2, 'C': 2, 'G': 2, 'T': 2})
+        self.assertEqual(contagem_bases(ADNCompacto("AANNT")), {'A': 2, 'C': 0, 'G': 0, 'T': 1})
+        self.assertEqual(frequencias_bases("AATT"), {'A': 0.5, 'C': 0.0, 'G': 0.0, 'T': 0.5})
+        self.assertEqual(frequencias_bases(""), {'A': 0, 'C': 0, 'G': 0, 'T': 0})
+
+    def test_perfil_gc(self):
+        perfil = perfil_gc("GGGGCCATNNNN", 4)
+        self.assertEqual(perfil.posicoes.tolist(), [0, 4, 8])
+        self.assertEqual(perfil.gc[:2].tolist(), [1.0, 0.5])
+        self.assertEqual(perfil.desvio[:2].tolist(), [1.0, -1.0])
+        self.assertTrue(np.isnan(perfil.gc[2]))
+
+    def test_perfil_gc_sobreposto(self):
+        seq = "ATGCGCGTTAGCCGATNGC"
+        perfil = perfil_gc(seq, 6, 4)
+        for inicio, gc, desvio in zip(perfil.posicoes, perfil.gc, perfil.desvio):
+            janela = seq[inicio:inicio + 6]
+            g, c = janela.count("G"), janela.count("C")
+            validas = sum(janela.count(b) for b in "ACGT")
+            self.assertAlmostEqual(gc, (g + c) / validas)
+            self.assertAlmostEqual(desvio, (g - c) / (g + c))
+        self.assertEqual(len(perfil.posicoes), (len(seq) - 6) // 4 + 1)
+
+    def test_tabela_padrao(self):
+        self.assertEqual(CODIGO_GENETICO, CODOES_PADRAO)
+        for codao, aminoacido in CODOES_PADRAO.items():
+            self.assertEqual(dna_para_proteina(codao), aminoacido)
+        self.assertEqual(dna_para_proteina("ATGNNNTAA"), "M__")
+
+    def test_tabelas_alternativas(self):
+        self.assertEqual(dna_para_proteina("TGAAGAATA", tabela=1), "_RI")
+        self.assertEqual(dna_para_proteina("TGAAGAATA", tabela=2), "W_M")
+        with self.assertRaises(KeyError):
+            dna_para_proteina("ATG", tabela=99)
+
+    def test_traduzir_seis_quadros(self):
+        seq = "ATGAAATAGATGTTTTAATGAC"
+        esperado = ["".join(CODOES_PADRAO[c] for c in orf) for orf in obter_orfs(seq)]
+        self.assertEqual(traduzir_seis_quadros(seq), esperado)
+        self.assertEqual(traduzir_seis_quadros(ADNCompacto(seq)), esperado)
+        self.assertEqual(traduzir_seis_quadros("AT"), ["", "", "", "", "", ""])
+
+    def test_encontrar_orfs(self):
+        seq = "CCATGAAATAGG"
+        self.assertEqual(list(encontrar_orfs(seq, comprimento_minimo=1)),
+                         [ORF("+", 2, 2, 11, "MK")])
+        self.assertEqual(list(encontrar_orfs(complemento_inverso(seq), comprimento_minimo=1)),
+                         [ORF("-", 2, 1, 10, "MK")])
+        self.assertEqual(list(encontrar_orfs(seq, comprimento_minimo=3)), [])
+
+    def test_encontrar_orfs_mais_longa(self):
+        seq = "ATGATGCCCTAAATGTGA"
+        orfs = list(encontrar_orfs(seq, comprimento_minimo=0))
+        self.assertEqual([(o.inicio, o.fim, o.proteina) for o in orfs if o.cadeia == "+"],
+                         [(0, 12, "MMP"), (12, 18, "M")])
+        for orf in orfs:
+            regiao = seq[orf.inicio:orf.fim]
+            if orf.cadeia == "-":
+                regiao = complemento_inverso(regiao)
+            self.assertEqual(dna_para_proteina(regiao), orf.proteina + "_")
+
+    def test_encontrar_orfs_codoes_invalidos(self):
+        self.assertEqual(list(encontrar_orfs("ATGAAANNNAAACCCTAA", comprimento_minimo=1)), [])
+        self.assertEqual(list(encontrar_orfs("ATGAAANNNATGCCCTAA", comprimento_minimo=1)),
+                         [ORF("+", 0, 9, 18, "MP")])
+        self.assertEqual(list(encontrar_orfs(ADNCompacto("ATGANAATGCCCTGA"), comprimento_minimo=0)),
+                         [ORF("+", 0, 6, 15, "MP")])
+
+    def test_encontrar_orfs_blocos(self):
+        seq = "CCATGAAATAGGATGCCCAAAGGGTTTTAAATGNCCTAGTTATGGCATTAGCATCACCTATTTACGTGACCAT" * 3
+        esperadas = list(encontrar_orfs(seq, comprimento_minimo=0))
+        original = Sequências.BLOCO_ORFS
+        try:
+            for bloco in (3, 6, 12, 99):
+                Sequências.BLOCO_ORFS = bloco
+                self.assertEqual(list(encontrar_orfs(seq, comprimento_minimo=0)), esperadas)
+                self.assertEqual(list(encontrar_orfs(ADNCompacto(seq), comprimento_minimo=0)), esperadas)
+        finally:
+            Sequências.BLOCO_ORFS = original
+        self.assertTrue(all("_" not in orf.proteina for orf in esperadas))
+        self.assertEqual(len({orf.cadeia for orf in esperadas}), 2)
+
+class TestADNCompacto(unittest.TestCase):
+
+    def test_conversao_str(self):
+        for seq in ["", "A", "ACGTACGTA", "acgtNNNNrY", "NNNN"]:
+            self.assertEqual(str(ADNCompacto(seq)), seq.upper())
+
+    def test_memoria(self):
+        seq = ADNCompacto("ACGT" * 1000)
+        self.assertEqual(seq.nbytes, 1000)
+        self.assertEqual(seq.dados.nbytes, 1000)
+
+    def test_fatias_sem_copia(self):
+        seq = ADNCompacto("ATGNNCGTTA")
+        fatia = seq[2:7]
+        self.assertIs(fatia.dados, seq.dados)
+        self.assertEqual(str(fatia), "GNNCG")
+        self.assertEqual(str(fatia[1:-1]), "NNC")
+        self.assertEqual(seq[-1], "A")
+        self.assertEqual(str(seq[::2]), "AGNGT")
+
+    def test_complemento_inverso(self):
+        seq = ADNCompacto("ATGNNCGTTAR")
+        self.assertEqual(str(seq.complemento_inverso()), "YTAACGNNCAT")
+        self.assertEqual(str(seq[1:6].complemento_inverso()), "GNNCA")
+        self.assertEqual(str(complemento_inverso(ADNCompacto("ATCG"))), "CGAT")
+        self.assertEqual(seq.complemento_inverso().complemento_inverso(), seq)
+
+    def test_codigos(self):
+        self.assertEqual(ADNCompacto("ACGTN").codigos().tolist(), [0, 1, 2, 3, 4])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from aasb.indice_sufixos import IndiceSufixos
+from aasb.linha_comandos import alinhar_par, resultado_alinhamento
+from aasb.sequencias import dna_para_proteina
+from aasb.servico import Servico, pedir
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+class TesteServico(unittest.TestCase):
+    """!
+    @brief Testes unitários para o serviço assíncrono com micro-lotes.
+    """
+
+    def setUp(self):
+        """!
+        @brief Cria uma pasta temporária com um índice de sufixos guardado.
+        """
+        self.pasta = tempfile.TemporaryDirectory()
+        self.prefixo = os.path.join(self.pasta.name, "referencia")
+        IndiceSufixos.construir({"r1": "TTTTACGTACGTTTGACGTACGATCGATCGTTTTT", "r2": "ATGAAATTTGGGCCCTAAAAA"}).guardar(self.prefixo)
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_micro_lotes(self):
+        """!
+        @brief Testa que pedidos concorrentes são agrupados e que cada um recebe a sua resposta.
+        """
+        sequencias = ["ATGAAATTTGGG" * (i % 5 + 1) for i in range(40)]
+
+        async def cenario():
+            async with Servico(processos=2, lote=16, espera=0.05) as servico:
+                respostas = await asyncio.gather(*(servico.pedir({"id": i, "tipo": "translate", "sequencia": s})
+                                                   for i, s in enumerate(sequencias)))
+                return respostas, servico.metricas()
+
+        respostas, metricas = asyncio.run(cenario())
+        self.assertEqual([r["id"] for r in respostas], list(range(40)))
+        self.assertEqual([r["resultado"]["proteina"] for r in respostas], [dna_para_proteina(s) for s in sequencias])
+        self.assertEqual(metricas["pedidos"], 40)
+        self.assertLessEqual(metricas["lotes"], 5)
+        self.assertEqual((metricas["fila"], metricas["em_curso"], metricas["erros"]), (0, 0, 0))
+        self.assertLessEqual(metricas["latencia"]["p50"], metricas["latencia"]["p99"])
+
+    def test_erros(self):
+        """!
+        @brief Testa que um pedido inválido devolve um erro sem afetar os restantes.
+        """
+        async def cenario():
+            async with Servico(indices={"ref": self.prefixo}) as servico:
+                return await asyncio.gather(servico.pedir({"id": 1, "tipo": "search", "sequencia": "ACGT", "indice": "outro"}),
+                                            servico.pedir({"id": 2, "tipo": "desconhecido"}),
+                                            servico.pedir({"id": 3, "tipo": "search", "indice": "ref", "minimo": 12,
+                                                           "sequencia": "GGACGTACGTTTGACGTACGATCGATCGTACG"}))
+
+        erro_indice, erro_tipo, pesquisa = asyncio.run(cenario())
+        self.assertIn("KeyError", erro_indice["erro"])
+        self.assertIn("desconhecido", erro_tipo["erro"])
+        self.assertEqual(pesquisa["resultado"], [{"referencia": "r1", "pos_query": 2, "pos_ref": 4, "comprimento": 27}])
+
+    def test_socket_unix(self):
+        """!
+        @brief Testa o serviço completo num socket Unix com o cliente síncrono.
+        """
+        caminho = os.path.join(self.pasta.name, "aasb.sock")
+        processo = subprocess.Popen([sys.executable, "-m", "aasb", "servir", "--socket", caminho,
+                                     "--indice", f"ref={self.prefixo}"], cwd=PASTA)
+        try:
+            for _ in range(200):
+                if os.path.exists(caminho):
+                    break
+                time.sleep(0.05)
+            pedidos = [{"tipo": "align", "seq1": "HEAGAWGHEE", "seq2": "PAWHEAE", "renderizar": True},
+                       {"tipo": "align", "seq1": "ACGTTGCA", "seq2": "TTACGTTGAT", "metodo": "local"},
+                       {"tipo": "scan", "sequencia": "AATGACCC", "sitios": ["TGAC", "TGAC", "TGCC"], "limiar": 3},
+                       {"tipo": "metricas"}]
+            alinhamento_global, alinhamento_local, motivo, metricas = pedir(pedidos, caminho)
+        finally:
+            processo.terminate()
+            processo.wait()
+        self.assertEqual(processo.returncode, 0)
+        self.assertFalse(os.path.exists(caminho))
+        self.assertEqual(alinhamento_global["resultado"],
+                         resultado_alinhamento(alinhar_par("HEAGAWGHEE", "PAWHEAE"), "HEAGAWGHEE", "PAWHEAE", True))
+        self.assertEqual(alinhamento_local["resultado"],
+                         {"cigar": "6=", "inicio1": 0, "fim1": 6, "inicio2": 2, "fim2": 8, "pontuacao": 12})
+        self.assertEqual([(o["posicao"], o["cadeia"]) for o in motivo["resultado"]], [(2, "+")])
+        self.assertIn("latencia", metricas["resultado"])
+
+    def test_pedidos_grandes(self):
+        """!
+        @brief Testa pedidos com mais de 64 KiB e que uma linha acima do limite recebe um erro sem fechar a ligação.
+        """
+        caminho = os.path.join(self.pasta.name, "grande.sock")
+        sequencia = "ACGT" * 25000 + "TGAC"
+
+        async def cenario(limite):
+            async with Servico(limite=limite) as servico:
+                await servico.escutar(caminho)
+                return await asyncio.to_thread(pedir, [{"tipo": "scan", "sequencia": sequencia, "sitios": ["TGAC"] * 3,
+                                                        "limiar": 3, "ambas_cadeias": False},
+                                                       {"tipo": "translate", "sequencia": "ATGAAATAA"}], caminho)
+
+        motivo, traducao = asyncio.run(cenario(2**20))
+        self.assertEqual([o["posicao"] for o in motivo["resultado"]], [100000])
+        self.assertEqual(traducao["resultado"], {"proteina": "MK_"})
+        motivo, traducao = asyncio.run(cenario(2**16))
+        self.assertEqual(motivo["erro"], "sem resposta")
+        self.assertEqual(traducao["resultado"], {"proteina": "MK_"})
+
+if __name__ == '__main__':
+    unittest.main()
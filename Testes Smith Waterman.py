@@ -1,4 +1,5 @@
 import unittest
+from aasb.smith_waterman import SW, score_SW, reconstruct_SW
 
 class TestSmithWaterman(unittest.TestCase):
 
@@ -25,7 +26,7 @@ class TestSmithWaterman(unittest.TestCase):
         seq2 = "AGT"
         score, _ = SW(seq1, seq2, self.scoring_matrix, self.g)
         max_score = score_SW(score)
-        self.assertEqual(max_score, 4)
+        self.assertEqual(max_score, 6)
 
     def test_reconstruct_SW(self):
         seq1 = "AGT"
@@ -35,6 +36,13 @@ class TestSmithWaterman(unittest.TestCase):
         self.assertEqual(alinhamento_seq1, "AGT")
         self.assertEqual(alinhamento_seq2, "AGT")
 
+    def test_reconstruct_SW_comprimentos_diferentes(self):
+        for seq1, seq2, esperado in (("ACGTTTT", "AGT", ("ACGT", "A-GT")), ("AGT", "ACGTTTT", ("A-GT", "ACGT"))):
+            score, trace = SW(seq1, seq2, self.scoring_matrix, self.g)
+            self.assertEqual((len(score), len(score[0])), (len(seq1) + 1, len(seq2) + 1))
+            self.assertEqual(score_SW(score), 4)
+            self.assertEqual(reconstruct_SW(seq1, seq2, score, trace), esperado)
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,70 @@
+import random
+import unittest
+from aasb.alinhamento_progressivo import alinhamento, alinhamento_transcricao, alinhamento_progressivo
+from aasb.needleman_wunsch import alinhar, alinhar_transcricao, reconstruir_alinhamento
+from aasb.smith_waterman import SW, transcricoes_SW
+from aasb.transcricao import Transcricao
+
+class TesteTranscricao(unittest.TestCase):
+    """!
+    @brief Testes unitários para as transcrições de edição (CIGAR) dos alinhamentos.
+    """
+
+    def test_de_operacoes(self):
+        """!
+        @brief Testa a compressão das operações e o cálculo das coordenadas finais.
+        """
+        transcricao = Transcricao.de_operacoes("===XIID==", 3, 5, 7)
+        self.assertEqual(transcricao, Transcricao("3=1X2I1D2=", 3, 11, 5, 12, 7))
+        self.assertEqual(transcricao.operacoes(), [(3, "="), (1, "X"), (2, "I"), (1, "D"), (2, "=")])
+        self.assertEqual(transcricao.colunas(), 9)
+        self.assertAlmostEqual(transcricao.identidade(), 5 / 9)
+
+    def test_renderizar_codificar(self):
+        """!
+        @brief Testa a reconstrução das sequências com lacunas e a serialização em bytes.
+        """
+        transcricao = Transcricao("2=1I1X1D1=", 0, 5, 0, 5, 1)
+        self.assertEqual(transcricao.renderizar("ACGTA", "ACTGA"), ("ACGT-A", "AC-TGA"))
+        dados = transcricao.codificar()
+        self.assertEqual(len(dados), 20 + len(transcricao.cigar))
+        self.assertEqual(Transcricao.descodificar(dados), transcricao)
+
+    def test_needleman_wunsch(self):
+        """!
+        @brief Testa que a transcrição global reproduz o alinhamento e a pontuação.
+        """
+        transcricao = alinhar_transcricao("HGWAG", "PHSWG")
+        pontuacao, traceback = alinhar("HGWAG", "PHSWG")
+        self.assertEqual(transcricao.pontuacao, pontuacao[-1][-1])
+        self.assertEqual((transcricao.inicio1, transcricao.fim1, transcricao.inicio2, transcricao.fim2), (0, 5, 0, 5))
+        self.assertEqual(transcricao.renderizar("HGWAG", "PHSWG"), reconstruir_alinhamento("HGWAG", "PHSWG", traceback))
+
+    def test_smith_waterman(self):
+        """!
+        @brief Testa as coordenadas do alinhamento local.
+        """
+        matriz = [[2 if i == j else -1 for j in range(4)] for i in range(4)]
+        score, trace = SW("TTACGTAA", "GGACGTCC", matriz, -2)
+        (transcricao,) = transcricoes_SW("TTACGTAA", "GGACGTCC", score, trace)
+        self.assertEqual(transcricao, Transcricao("4=", 2, 6, 2, 6, 8))
+        score, trace = SW("ACGTTTT", "AGT", matriz, -2)
+        self.assertEqual(transcricoes_SW("ACGTTTT", "AGT", score, trace), [Transcricao("1=1I2=", 0, 4, 0, 3, 4)])
+        score, trace = SW("AGT", "ACGTTTT", matriz, -2)
+        self.assertEqual(transcricoes_SW("AGT", "ACGTTTT", score, trace), [Transcricao("1=1D2=", 0, 3, 0, 4, 4)])
+
+    def test_alinhamento_multiplo(self):
+        """!
+        @brief Testa o alinhamento de pares do MSA e que o alinhamento progressivo preserva as sequências.
+        """
+        self.assertEqual(alinhamento_transcricao("GATTACA", "GCATGCU").renderizar("GATTACA", "GCATGCU"),
+                         alinhamento("GATTACA", "GCATGCU"))
+        random.seed(5)
+        for _ in range(20):
+            sequencias = [''.join(random.choice("ACGT") for _ in range(random.randint(4, 25))) for _ in range(5)]
+            alinhadas = alinhamento_progressivo(sequencias)
+            self.assertEqual([s.replace("-", "") for s in alinhadas], sequencias)
+            self.assertEqual(len({len(s) for s in alinhadas}), 1)
+
+if __name__ == '__main__':
+    unittest.main()
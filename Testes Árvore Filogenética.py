@@ -1,4 +1,6 @@
 import unittest
+from aasb.arvore_filogenetica import (calcular_distancia, gerar_matriz_distancias, encontrar_par_minimo,
+                                     atualizar_distancias, construir_arvore)
 
 class TesteAlgoritmoDNA(unittest.TestCase):
     def test_calcular_distancia(self):
@@ -0,0 +1,43 @@
+import importlib
+
+## @package aasb
+#  Algoritmos para Análise de Sequências Biológicas.
+#  Os submódulos são carregados apenas quando são usados (`aasb.sequencias`,
+#  `aasb.needleman_wunsch`, ...), para que importar o pacote seja imediato e uma
+#  chamada curta da linha de comandos não carregue NumPy nem tabelas que não usa.
+
+MODULOS = (
+    "alinhamento_arvore",
+    "alinhamento_progressivo",
+    "ancoras",
+    "arvore_filogenetica",
+    "benchmark",
+    "blast",
+    "blosum",
+    "fasta",
+    "frente_onda",
+    "indice_sufixos",
+    "instrumentacao",
+    "kmeros",
+    "linha_comandos",
+    "mapeamento",
+    "motivos",
+    "needleman_wunsch",
+    "pontuacao_msa",
+    "pwm",
+    "sequencias",
+    "servico",
+    "smith_waterman",
+    "transcricao",
+)
+
+__all__ = list(MODULOS)
+
+
+def __getattr__(nome: str):
+    """
+    @brief Importa um submódulo no primeiro acesso (PEP 562).
+    """
+    if nome in MODULOS:
+        return importlib.import_module(f".{nome}", __name__)
+    raise AttributeError(f"o módulo {__name__!r} não tem o atributo {nome!r}")
@@ -0,0 +1,10 @@
+import sys
+
+from .linha_comandos import main
+
+## @package aasb.__main__
+#  Linha de comandos do pacote (`python -m aasb ...`); os subcomandos estão em aasb.linha_comandos.
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import importlib
+from typing import Dict
+
+## @package preguicoso
+#  Importação diferida de dependências pesadas (por exemplo NumPy).
+#  O módulo só é importado no primeiro acesso a um atributo; nesse momento o nome
+#  global do módulo que pediu a importação passa a apontar para o módulo real,
+#  pelo que os acessos seguintes não têm qualquer custo adicional.
+
+
+class _ModuloPreguicoso:
+    """
+    @brief Substituto de um módulo que o importa no primeiro acesso a um atributo.
+    """
+    __slots__ = ("_nome", "_globais", "_alias")
+
+    def __init__(self, nome: str, globais: Dict[str, object], alias: str):
+        self._nome = nome
+        self._globais = globais
+        self._alias = alias
+
+    def __getattr__(self, atributo: str):
+        modulo = importlib.import_module(self._nome)
+        self._globais[self._alias] = modulo
+        return getattr(modulo, atributo)
+
+    def __repr__(self) -> str:
+        return f"<módulo {self._nome!r} (importação diferida)>"
+
+
+def importar_preguicoso(nome: str, globais: Dict[str, object], alias: str) -> _ModuloPreguicoso:
+    """
+    @brief Cria um substituto para o módulo `nome`, guardado em globais[alias].
+
+    @details Utilização: `np = importar_preguicoso("numpy", globals(), "np")`. As anotações
+             de tipo que referem o módulo devem ser diferidas (`from __future__ import annotations`).
+
+    @param nome Nome do módulo a importar.
+    @param globais Dicionário global do módulo que faz a importação.
+    @param alias Nome global a substituir pelo módulo real.
+    @return O substituto (a usar como se fosse o módulo).
+    """
+    return _ModuloPreguicoso(nome, globais, alias)
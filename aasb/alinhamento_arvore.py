@@ -0,0 +1,264 @@
+from typing import Dict, List, Optional, Tuple, Union
+from math import log
+
+import numpy as np
+
+from .frente_onda import CIMA, DIAGONAL, preencher_bloco
+from .instrumentacao import contar, fase, instrumentado
+
+## @package alinhamento_arvore
+#  Alinhamento múltiplo progressivo guiado por uma árvore.
+#  Cada nó da árvore funde os alinhamentos (perfis) dos seus dois filhos com um
+#  alinhamento perfil-perfil; as fusões de subárvores irmãs são independentes, pelo
+#  que são feitas por níveis, das folhas para a raiz, e cada nível é distribuído por
+#  um conjunto de processos. Um alinhamento circula entre processos como uma matriz
+#  uint8 (uma linha por sequência, uma coluna por posição, '-' nas lacunas).
+#  A pontuação é a média sum-of-pairs das pontuações de alinhamento(): +1 para
+#  resíduos iguais, -1 para diferentes e -1 por lacuna; para duas sequências o
+#  resultado é o mesmo de alinhamento().
+
+Arvore = Union[int, Tuple["Arvore", "Arvore"]]
+
+LACUNA: int = ord("-")
+ESCALA: int = 1000
+MAXIMO_KMEROS: int = 4096
+
+_IGUAL, _DIFERENTE, _LACUNA = 1, -1, -1
+
+
+def codificar_alinhamento(sequencias: List[str]) -> np.ndarray:
+    """
+    @brief Matriz uint8 (sequências x colunas) de um alinhamento com todas as linhas do mesmo comprimento.
+    """
+    return np.frombuffer("".join(sequencias).encode("latin-1"), dtype=np.uint8).reshape(len(sequencias), -1).copy()
+
+
+def descodificar_alinhamento(alinhamento: np.ndarray) -> List[str]:
+    """
+    @brief Linhas de uma matriz criada com codificar_alinhamento().
+    """
+    return [linha.tobytes().decode("latin-1") for linha in alinhamento]
+
+
+def _frequencias(alinhamento: np.ndarray, simbolos: np.ndarray) -> np.ndarray:
+    """
+    @brief Frequência de cada símbolo em cada coluna, forma (colunas, símbolos).
+    """
+    return np.stack([(alinhamento == s).mean(axis=0) for s in simbolos], axis=1)
+
+
+def alinhar_perfis(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    @brief Alinha dois alinhamentos (perfis) com Needleman-Wunsch sobre as colunas.
+
+    @details A pontuação de um par de colunas é Fa · M · Fbᵀ, em que Fa e Fb são as
+             frequências dos símbolos (incluindo '-') e M a matriz +1/-1 com -1 entre
+             resíduo e lacuna e 0 entre lacunas; todas as pontuações são calculadas com
+             um único produto de matrizes. Em caso de empate prefere-se a diagonal,
+             depois uma coluna só de a e por fim uma coluna só de b, como em alinhamento().
+
+    @param a Matriz uint8 (ka x La)
+    @param b Matriz uint8 (kb x Lb)
+    @return Matriz uint8 ((ka + kb) x L) com as linhas de a seguidas das de b
+    """
+    simbolos = np.union1d(np.unique(a), np.unique(b))
+    M = np.where(simbolos[:, None] == simbolos[None, :], _IGUAL, _DIFERENTE).astype(float)
+    lacuna = simbolos == LACUNA
+    M[lacuna, :] = _LACUNA
+    M[:, lacuna] = _LACUNA
+    M[np.ix_(lacuna, lacuna)] = 0
+    pontuacoes = np.rint(ESCALA * _frequencias(a, simbolos) @ M @ _frequencias(b, simbolos).T).astype(np.int32)
+
+    La, Lb = a.shape[1], b.shape[1]
+    gap = ESCALA * _LACUNA
+    _, _, direcoes = preencher_bloco(pontuacoes, gap * np.arange(Lb + 1), gap * np.arange(La + 1), gap,
+                                     direcoes=True)
+    contar("alinhar_perfis.celulas", La * Lb)
+
+    colunas_a: List[int] = []                                       #-1 marca uma lacuna
+    colunas_b: List[int] = []
+    i, j = La, Lb
+    while i > 0 and j > 0:
+        direcao = direcoes[i - 1, j - 1]
+        if direcao == DIAGONAL:
+            i -= 1
+            j -= 1
+            colunas_a.append(i)
+            colunas_b.append(j)
+        elif direcao == CIMA:
+            i -= 1
+            colunas_a.append(i)
+            colunas_b.append(-1)
+        else:
+            j -= 1
+            colunas_a.append(-1)
+            colunas_b.append(j)
+    colunas_a.extend(range(i - 1, -1, -1))
+    colunas_b.extend([-1] * i)
+    colunas_a.extend([-1] * j)
+    colunas_b.extend(range(j - 1, -1, -1))
+
+    colunas_a = np.array(colunas_a[::-1], dtype=np.intp)
+    colunas_b = np.array(colunas_b[::-1], dtype=np.intp)
+    resultado = np.full((a.shape[0] + b.shape[0], len(colunas_a)), LACUNA, dtype=np.uint8)
+    presentes = colunas_a >= 0
+    resultado[:a.shape[0], presentes] = a[:, colunas_a[presentes]]
+    presentes = colunas_b >= 0
+    resultado[a.shape[0]:, presentes] = b[:, colunas_b[presentes]]
+    return resultado
+
+
+def _fundir(par: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    return alinhar_perfis(*par)
+
+
+def arvore_guia(sequencias: List[str], k: Optional[int] = None) -> Arvore:
+    """
+    @brief Árvore guia UPGMA a partir da distância de k-meros partilhados.
+
+    @details A distância entre duas sequências é 1 - (k-meros distintos em comum) /
+             (mínimo de k-meros distintos das duas), calculada para todos os pares com
+             um produto de matrizes. A UPGMA guarda o mínimo de cada linha e só recalcula
+             as linhas cujo mínimo apontava para os grupos fundidos.
+
+    @param sequencias Lista de sequências (sem lacunas)
+    @param k Comprimento dos k-meros (por omissão, o maior com no máximo MAXIMO_KMEROS valores)
+    @return Árvore com os índices das sequências nas folhas, por exemplo ((0, 2), 1)
+    """
+    n = len(sequencias)
+    if n == 1:
+        return 0
+    simbolos = sorted(set("".join(sequencias)))
+    if k is None:
+        k = max(1, int(log(MAXIMO_KMEROS) / log(max(2, len(simbolos)))))
+    tabela = {s: i for i, s in enumerate(simbolos)}
+    presencas = np.zeros((n, len(simbolos) ** k), dtype=np.float32)
+    for linha, sequencia in enumerate(sequencias):
+        codigos = np.array([tabela[s] for s in sequencia], dtype=np.int64)
+        if len(codigos) >= k:
+            valores = np.zeros(len(codigos) - k + 1, dtype=np.int64)
+            for p in range(k):
+                valores = valores * len(simbolos) + codigos[p:len(codigos) - k + 1 + p]
+            presencas[linha, valores] = 1
+    distintos = presencas.sum(axis=1)
+    comuns = presencas @ presencas.T
+    distancias = 1 - comuns / np.maximum(np.minimum(distintos[:, None], distintos[None, :]), 1)
+    np.fill_diagonal(distancias, np.inf)
+
+    nos: Dict[int, Arvore] = {i: i for i in range(n)}
+    tamanhos = np.ones(n, dtype=np.float32)
+    minimos = distancias.min(axis=1)
+    argumentos = distancias.argmin(axis=1)
+    for _ in range(n - 1):
+        i = int(minimos.argmin())
+        j = int(argumentos[i])
+        nova = (tamanhos[i] * distancias[i] + tamanhos[j] * distancias[j]) / (tamanhos[i] + tamanhos[j])
+        distancias[j, :] = distancias[:, j] = np.inf
+        nova[[i, j]] = np.inf
+        nova[np.isinf(distancias[i])] = np.inf                         #grupos já fundidos continuam inativos
+        distancias[i, :] = distancias[:, i] = nova
+        nos[i] = (nos[i], nos.pop(j))
+        tamanhos[i] += tamanhos[j]
+        minimos[j] = np.inf
+        desatualizadas = np.flatnonzero((argumentos == i) | (argumentos == j))
+        desatualizadas = desatualizadas[~np.isinf(minimos[desatualizadas])]
+        for linha in np.append(desatualizadas, i):
+            argumentos[linha] = distancias[linha].argmin()
+            minimos[linha] = distancias[linha, argumentos[linha]]
+        melhores = nova < minimos
+        argumentos[melhores] = i
+        minimos[melhores] = nova[melhores]
+    return nos[i]
+
+
+def niveis(arvore: Arvore) -> List[List[Tuple[Arvore, Arvore]]]:
+    """
+    @brief Nós internos agrupados por altura: o nível h só depende de nós de níveis anteriores.
+
+    @return Lista de níveis, cada um com os pares de filhos dos seus nós
+    """
+    resultado: List[List[Tuple[Arvore, Arvore]]] = []
+    alturas: Dict[int, int] = {}
+    pilha = [arvore]                                                #pós-ordem iterativa (árvores em escada são fundas)
+    while pilha:
+        no = pilha[-1]
+        if isinstance(no, int):
+            pilha.pop()
+            continue
+        pendentes = [filho for filho in no if not isinstance(filho, int) and id(filho) not in alturas]
+        if pendentes:
+            pilha.extend(pendentes)
+            continue
+        pilha.pop()
+        h = 1 + max(0 if isinstance(filho, int) else alturas[id(filho)] for filho in no)
+        alturas[id(no)] = h
+        if len(resultado) < h:
+            resultado.append([])
+        resultado[h - 1].append(no)
+    return resultado
+
+
+def _folhas(arvore: Arvore) -> List[int]:
+    folhas, pilha = [], [arvore]
+    while pilha:
+        no = pilha.pop()
+        if isinstance(no, int):
+            folhas.append(no)
+        else:
+            pilha.extend((no[1], no[0]))
+    return folhas
+
+
+@instrumentado()
+def alinhamento_progressivo_arvore(sequencias: List[str], arvore: Optional[Arvore] = None,
+                                   processos: int = 1) -> List[str]:
+    """
+    @brief Alinhamento múltiplo progressivo ao longo de uma árvore guia, com fusões paralelas por nível.
+
+    @param sequencias Lista de sequências a alinhar
+    @param arvore Árvore guia com os índices das sequências (por omissão, arvore_guia(sequencias))
+    @param processos Número de processos para as fusões de cada nível (1 executa no processo atual)
+    @return Sequências alinhadas, pela ordem de entrada
+
+    @exception ValueError Se a lista estiver vazia ou contiver sequências vazias
+    """
+    if not sequencias:
+        raise ValueError("A lista de sequências não pode estar vazia")
+    if not all(sequencias):
+        raise ValueError("As sequências não podem estar vazias")
+    if len(sequencias) < 2:
+        return list(sequencias)
+    if arvore is None:
+        with fase("arvore_guia"):
+            arvore = arvore_guia(sequencias)
+
+    perfis: Dict[int, np.ndarray] = {i: codificar_alinhamento([s]) for i, s in enumerate(sequencias)}
+
+    def perfil(no: Arvore) -> np.ndarray:                           #folhas pelo índice, nós internos pelo id
+        return perfis.pop(no if isinstance(no, int) else id(no))
+
+    executor = None
+    if processos > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(processos)
+    try:
+        with fase("fusoes"):
+            for nivel in niveis(arvore):
+                pares = [(perfil(no[0]), perfil(no[1])) for no in nivel]
+                if executor is None or len(pares) == 1:
+                    fundidos = map(_fundir, pares)
+                else:
+                    fundidos = executor.map(_fundir, pares, chunksize=max(1, len(pares) // (4 * processos)))
+                for no, fundido in zip(nivel, fundidos):
+                    perfis[id(no)] = fundido
+                contar("alinhamento_progressivo_arvore.fusoes", len(pares))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    alinhadas = descodificar_alinhamento(perfil(arvore))
+    resultado = [""] * len(sequencias)
+    for indice, linha in zip(_folhas(arvore), alinhadas):
+        resultado[indice] = linha
+    return resultado
@@ -0,0 +1,135 @@
+
+from typing import List, Tuple
+
+from .instrumentacao import fase, contar, instrumentado
+from .transcricao import Transcricao, operacao_par
+
+@instrumentado()
+def alinhamento_transcricao(seq1: str, seq2: str) -> Transcricao:
+    """!
+    @brief Alinha duas sequências com Needleman-Wunsch e devolve a transcrição de edição (CIGAR).
+    
+    O traceback acrescenta as operações a uma lista e inverte-a no fim, sem construir
+    as sequências com lacunas.
+    
+    @param seq1: Primeira sequência a ser alinhada.
+    @param seq2: Segunda sequência a ser alinhada.
+    @return: Transcricao do alinhamento global, com a respetiva pontuação.
+    @throws ValueError: Se alguma das sequências estiver vazia.
+    """
+    if not seq1 or not seq2:
+        raise ValueError("As sequências não podem estar vazias")
+
+    correspondencia: int = 1
+    nao_correspondencia: int = -1
+    penalizacao_lacuna: int = -1
+
+    n: int = len(seq1) + 1
+    m: int = len(seq2) + 1
+    matriz_pontuacao: List[List[int]] = [[0] * m for _ in range(n)]
+
+    for i in range(n):
+        matriz_pontuacao[i][0] = i * penalizacao_lacuna
+    for j in range(m):
+        matriz_pontuacao[0][j] = j * penalizacao_lacuna
+
+    for i in range(1, n):
+        for j in range(1, m):
+            pontuacao_correspondencia: int = correspondencia if seq1[i - 1] == seq2[j - 1] else nao_correspondencia
+            matriz_pontuacao[i][j] = max(
+                matriz_pontuacao[i - 1][j - 1] + pontuacao_correspondencia,
+                matriz_pontuacao[i - 1][j] + penalizacao_lacuna,
+                matriz_pontuacao[i][j - 1] + penalizacao_lacuna,
+            )
+
+    contar("alinhamento.celulas", len(seq1) * len(seq2))
+
+    operacoes: List[str] = []
+    i, j = len(seq1), len(seq2)
+
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and matriz_pontuacao[i][j] == matriz_pontuacao[i - 1][j - 1] + (
+            correspondencia if seq1[i - 1] == seq2[j - 1] else nao_correspondencia
+        ):
+            operacoes.append(operacao_par(seq1[i - 1], seq2[j - 1]))
+            i -= 1
+            j -= 1
+        elif i > 0 and matriz_pontuacao[i][j] == matriz_pontuacao[i - 1][j] + penalizacao_lacuna:
+            operacoes.append("I")
+            i -= 1
+        else:
+            operacoes.append("D")
+            j -= 1
+
+    operacoes.reverse()
+    return Transcricao.de_operacoes(operacoes, 0, 0, matriz_pontuacao[-1][-1])
+
+def alinhamento(seq1: str, seq2: str) -> Tuple[str, str]:
+    """!
+    @brief Alinha duas sequências utilizando o algoritmo Needleman-Wunsch.
+    
+    Esta função implementa o algoritmo de Needleman-Wunsch para alinhar duas sequências.
+    
+    @param seq1: Primeira sequência a ser alinhada.
+    @param seq2: Segunda sequência a ser alinhada.
+    @return: Um tuplo contendo as duas sequências alinhadas.
+    @throws ValueError: Se alguma das sequências estiver vazia.
+    """
+    return alinhamento_transcricao(seq1, seq2).renderizar(seq1, seq2)
+
+def consenso(seq1: str, seq2: str) -> str:
+    """!
+    @brief Gera a sequência de consenso de duas sequências alinhadas.
+    
+    @param seq1: Primeira sequência alinhada.
+    @param seq2: Segunda sequência alinhada.
+    @return: Sequência de consenso.
+    @throws ValueError: Se as sequências tiverem comprimentos diferentes.
+    """
+    if len(seq1) != len(seq2):
+        raise ValueError("As sequências devem ter o mesmo comprimento")
+
+    consenso_lista: List[str] = []
+    for a, b in zip(seq1, seq2):
+        if a == b:
+            consenso_lista.append(a)
+        elif a == "-" or b == "-":
+            consenso_lista.append("-")
+        else:
+            consenso_lista.append("N") 
+    return "".join(consenso_lista)
+
+@instrumentado()
+def alinhamento_progressivo(sequencias: List[str]) -> List[str]:
+    """!
+    @brief Realiza alinhamento progressivo de uma lista de sequências.
+    
+    @param sequencias: Lista de sequências a serem alinhadas.
+    @return: Lista de sequências alinhadas progressivamente.
+    @throws ValueError: Se a lista de sequências estiver vazia.
+    """
+    if not sequencias:
+        raise ValueError("A lista de sequências não pode estar vazia")
+    if len(sequencias) < 2:
+        return sequencias
+
+    seq1_alinhada, seq2_alinhada = alinhamento(sequencias[0], sequencias[1])
+    alinhamento_multiplo: List[str] = [seq1_alinhada, seq2_alinhada]
+
+    for i in range(2, len(sequencias)):
+        with fase("consenso"):
+            consenso_atual: str = consenso(alinhamento_multiplo[0], alinhamento_multiplo[1])
+            for seq in alinhamento_multiplo[2:]:
+                consenso_atual = consenso(consenso_atual, seq)
+
+        transcricao = alinhamento_transcricao(consenso_atual, sequencias[i])
+
+        with fase("propagacao_lacunas"):
+            # As linhas têm as colunas do consenso, logo recebem as mesmas lacunas que ele
+            alinhamento_multiplo = [transcricao.renderizar_lado(linha) for linha in alinhamento_multiplo]
+            nova_seq_alinhada: str = transcricao.renderizar_lado(sequencias[i], primeira=False)
+        contar("alinhamento_progressivo.colunas_propagadas", transcricao.colunas() * len(alinhamento_multiplo))
+
+        alinhamento_multiplo.append(nova_seq_alinhada)
+
+    return alinhamento_multiplo 
@@ -0,0 +1,234 @@
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .instrumentacao import contar, fase, instrumentado
+
+## @package ancoras
+#  Segmentação de alinhamentos múltiplos longos por âncoras.
+#  Uma âncora é um k-mero que ocorre exatamente uma vez em cada sequência que o
+#  contém e que está presente em pelo menos uma fração mínima das sequências;
+#  k-meros consecutivos em todas as sequências são fundidos numa correspondência
+#  exata mais longa. Das âncoras escolhe-se uma cadeia colinear (a mesma ordem, sem
+#  sobreposição, em todas as sequências) de comprimento total máximo, e as
+#  sequências são cortadas no início e no fim de cada âncora. Os segmentos entre
+#  cortes são alinhados de forma independente (e em paralelo) e concatenados, pelo
+#  que o custo depende do tamanho dos segmentos e não do comprimento total.
+#  Numa sequência que não contém uma âncora da cadeia, os cortes são interpolados
+#  a partir das âncoras vizinhas que ela contém.
+
+K: int = 12
+MAXIMO_ANCORAS: int = 4096
+
+
+class Ancora(NamedTuple):
+    """
+    @brief Correspondência exata partilhada pelas sequências.
+
+    @param posicoes Início da âncora em cada sequência (-1 se a sequência não a contém)
+    @param comprimento Comprimento da correspondência
+    """
+    posicoes: Tuple[int, ...]
+    comprimento: int
+
+
+def _kmeros_unicos(sequencias: List[str], k: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    @brief Valores e posições dos k-meros que ocorrem uma única vez em cada sequência.
+    """
+    simbolos = sorted(set("".join(sequencias)))
+    if len(simbolos) ** k >= 2 ** 63:
+        raise ValueError(f"k = {k} é demasiado grande para um alfabeto de {len(simbolos)} símbolos")
+    tabela = np.zeros(256, dtype=np.int64)
+    tabela[[ord(s) for s in simbolos]] = np.arange(len(simbolos))
+    unicos = []
+    for sequencia in sequencias:
+        codigos = tabela[np.frombuffer(sequencia.encode("latin-1"), dtype=np.uint8)]
+        n = len(codigos) - k + 1
+        if n <= 0:
+            unicos.append((np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)))
+            continue
+        valores = np.zeros(n, dtype=np.int64)
+        for p in range(k):
+            valores = valores * len(simbolos) + codigos[p:p + n]
+        valores, posicoes, contagens = np.unique(valores, return_index=True, return_counts=True)
+        unicos.append((valores[contagens == 1], posicoes[contagens == 1]))
+    return unicos
+
+
+def _cadeia(P: np.ndarray, comprimentos: np.ndarray) -> List[int]:
+    """
+    @brief Cadeia colinear de peso máximo (soma dos comprimentos) por programação dinâmica.
+
+    @details Uma âncora só pode seguir uma cadeia se, em cada sequência que a contém, começar
+             depois do fim da última âncora da cadeia presente nessa sequência (e não apenas
+             da âncora imediatamente anterior, que pode estar ausente).
+
+    @param P Posições (âncoras x sequências, -1 se ausente), ordenadas pela coordenada de referência
+    @param comprimentos Comprimento de cada âncora
+    @return Índices das âncoras da cadeia, por ordem
+    """
+    A = len(P)
+    pontuacao = comprimentos.astype(np.int64).copy()
+    anterior = np.full(A, -1)
+    fins = np.where(P >= 0, P + comprimentos[:, None], 0)          #fim da última âncora presente em cada sequência
+    for i in range(1, A):
+        compativeis = ((fins[:i] <= P[i]) | (P[i] < 0)).all(axis=1)
+        if compativeis.any():
+            candidatos = np.where(compativeis, pontuacao[:i], -1)
+            j = int(candidatos.argmax())
+            pontuacao[i] += candidatos[j]
+            anterior[i] = j
+            fins[i] = np.where(P[i] >= 0, fins[i], fins[j])
+    cadeia = []
+    i = int(pontuacao.argmax())
+    while i >= 0:
+        cadeia.append(i)
+        i = anterior[i]
+    return cadeia[::-1]
+
+
+@instrumentado()
+def encontrar_ancoras(sequencias: List[str], k: int = K, minimo: float = 1.0) -> List[Ancora]:
+    """
+    @brief Encontra uma cadeia colinear de âncoras partilhadas pelas sequências.
+
+    @param sequencias Sequências (sem lacunas)
+    @param k Comprimento mínimo das âncoras
+    @param minimo Fração mínima de sequências que devem conter cada âncora
+    @return Âncoras da cadeia, pela ordem em que ocorrem nas sequências
+    """
+    n = len(sequencias)
+    exigidas = max(1, int(np.ceil(minimo * n)))
+    unicos = _kmeros_unicos(sequencias, k)
+    todos = np.concatenate([valores for valores, _ in unicos])
+    valores, contagens = np.unique(todos, return_counts=True)
+    valores = valores[contagens >= max(2, exigidas)]
+    if len(valores) == 0:
+        return []
+
+    P = np.full((len(valores), n), -1, dtype=np.int64)
+    for s, (proprios, posicoes) in enumerate(unicos):
+        indices = np.searchsorted(proprios, valores)
+        indices = np.minimum(indices, max(len(proprios) - 1, 0))
+        presentes = (proprios[indices] == valores) if len(proprios) else np.zeros(len(valores), dtype=bool)
+        P[presentes, s] = posicoes[indices[presentes]]
+
+    with fase("fusao"):                                            #k-meros seguidos em todas as sequências
+        presentes = P >= 0
+        referencia = np.array([np.median(linha[linha >= 0]) for linha in P])
+        ordem = np.lexsort((P[:, int(presentes.sum(axis=0).argmax())], referencia))
+        P, presentes = P[ordem], presentes[ordem]
+        continua = np.ones(len(P), dtype=bool)
+        continua[1:] = ~((presentes[1:] == presentes[:-1]).all(axis=1)
+                         & ((P[1:] - P[:-1] == 1) | ~presentes[1:]).all(axis=1))
+        inicios = np.flatnonzero(continua)
+        comprimentos = np.diff(np.append(inicios, len(P))) + k - 1
+        P = P[inicios]
+    contar("encontrar_ancoras.candidatas", len(P))
+
+    if len(P) > MAXIMO_ANCORAS:
+        mantidas = np.sort(np.argsort(-comprimentos, kind="stable")[:MAXIMO_ANCORAS])
+        P, comprimentos = P[mantidas], comprimentos[mantidas]
+    with fase("cadeia"):
+        cadeia = _cadeia(P, comprimentos)
+    P, comprimentos = P[cadeia], comprimentos[cadeia]
+    return [Ancora(tuple(int(p) for p in linha), int(c)) for linha, c in zip(P, comprimentos)]
+
+
+def cortes(sequencias: List[str], ancoras: List[Ancora]) -> np.ndarray:
+    """
+    @brief Posições de corte de cada sequência: o início e o fim de cada âncora.
+
+    @details As posições em falta são interpoladas pela coordenada de referência (mediana das
+             posições conhecidas) a partir das âncoras que a sequência contém; os cortes de cada
+             sequência são não decrescentes e estão entre 0 e o seu comprimento.
+
+    @return Matriz (sequências x (2 * âncoras + 2)) com 0 na primeira coluna e o comprimento na última
+    """
+    n, A = len(sequencias), len(ancoras)
+    resultado = np.zeros((n, 2 * A + 2), dtype=np.int64)
+    resultado[:, -1] = [len(s) for s in sequencias]
+    if A == 0:
+        return resultado
+    P = np.array([a.posicoes for a in ancoras], dtype=np.int64)
+    comprimentos = np.array([a.comprimento for a in ancoras], dtype=np.int64)
+    referencia = np.maximum.accumulate(np.array([np.median(linha[linha >= 0]) for linha in P]))
+    for s in range(n):
+        conhecidas = P[:, s] >= 0
+        if conhecidas.any():
+            r, p = referencia[conhecidas], P[conhecidas, s]
+            inicios = np.interp(referencia, r, p)
+            antes, depois = referencia < r[0], referencia > r[-1]
+            inicios[antes] = p[0] - (r[0] - referencia[antes])
+            inicios[depois] = p[-1] + (referencia[depois] - r[-1])
+            inicios[conhecidas] = p
+        else:
+            inicios = referencia
+        resultado[s, 1:-1:2] = np.rint(inicios)
+        resultado[s, 2:-1:2] = np.rint(inicios) + comprimentos
+    resultado[:, 1:-1] = np.clip(resultado[:, 1:-1], 0, resultado[:, -1:])
+    return np.maximum.accumulate(resultado, axis=1)
+
+
+def _alinhar_segmento(argumentos: Tuple[List[str], Callable[[List[str]], List[str]]]) -> List[str]:
+    """
+    @brief Alinha as partes não vazias de um segmento; as vazias ficam só com lacunas.
+    """
+    partes, alinhador = argumentos
+    nao_vazias = [i for i, parte in enumerate(partes) if parte]
+    if not nao_vazias:
+        return partes
+    if len(set(partes)) == 1 or len(nao_vazias) == 1:               #âncora exata ou uma só sequência
+        alinhadas = [partes[i] for i in nao_vazias]
+    else:
+        alinhadas = alinhador([partes[i] for i in nao_vazias])
+    largura = len(alinhadas[0])
+    resultado = ["-" * largura] * len(partes)
+    for i, linha in zip(nao_vazias, alinhadas):
+        resultado[i] = linha
+    return resultado
+
+
+@instrumentado()
+def alinhamento_ancorado(sequencias: List[str], k: int = K, minimo: float = 1.0, processos: int = 1,
+                         alinhador: Optional[Callable[[List[str]], List[str]]] = None) -> List[str]:
+    """
+    @brief Alinhamento múltiplo cortado nas âncoras, com os segmentos alinhados de forma independente.
+
+    @param sequencias Sequências a alinhar
+    @param k Comprimento mínimo das âncoras
+    @param minimo Fração mínima de sequências que devem conter cada âncora
+    @param processos Número de processos para os segmentos (1 executa no processo atual)
+    @param alinhador Função de alinhamento múltiplo de cada segmento, definida ao nível do módulo
+                     (por omissão, alinhamento_progressivo_arvore)
+    @return Sequências alinhadas, pela ordem de entrada
+
+    @exception ValueError Se a lista estiver vazia ou contiver sequências vazias
+    """
+    if not sequencias:
+        raise ValueError("A lista de sequências não pode estar vazia")
+    if not all(sequencias):
+        raise ValueError("As sequências não podem estar vazias")
+    if len(sequencias) < 2:
+        return list(sequencias)
+    if alinhador is None:
+        from .alinhamento_arvore import alinhamento_progressivo_arvore as alinhador
+
+    ancoras = encontrar_ancoras(sequencias, k, minimo)
+    posicoes = cortes(sequencias, ancoras)
+    segmentos = [([s[a:b] for s, a, b in zip(sequencias, posicoes[:, c], posicoes[:, c + 1])], alinhador)
+                 for c in range(posicoes.shape[1] - 1)]
+    contar("alinhamento_ancorado.ancoras", len(ancoras))
+    contar("alinhamento_ancorado.maior_segmento", max(max(map(len, partes)) for partes, _ in segmentos))
+
+    with fase("segmentos"):
+        if processos > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(processos) as executor:
+                alinhados = list(executor.map(_alinhar_segmento, segmentos,
+                                              chunksize=max(1, len(segmentos) // (4 * processos))))
+        else:
+            alinhados = [_alinhar_segmento(segmento) for segmento in segmentos]
+    return ["".join(partes) for partes in zip(*alinhados)]
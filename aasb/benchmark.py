@@ -0,0 +1,315 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from . import (alinhamento_arvore, alinhamento_progressivo, arvore_filogenetica, blast, mapeamento,
+               needleman_wunsch, pwm, sequencias, smith_waterman)
+
+## @package benchmark
+#  Medição de desempenho dos algoritmos do repositório.
+#  Cada caso gera entradas sintéticas com uma semente fixa para vários tamanhos,
+#  mede o tempo de execução (melhor de várias repetições), o pico de memória
+#  (tracemalloc, numa execução à parte para não afetar o tempo) e o número de
+#  células (ou elementos) processadas por segundo. Os resultados são gravados em
+#  JSON e podem ser comparados com uma execução de referência para detetar
+#  regressões.
+
+SEMENTE: int = 2024
+AMINOACIDOS: str = "ACDEFGHIKLMNPQRSTVWY"
+LIMIAR_REGRESSAO: float = 0.25
+
+
+def gerar_adn(n: int, semente: int = SEMENTE) -> str:
+    """
+    @brief Gera uma sequência de DNA aleatória e reprodutível.
+    """
+    return "".join(random.Random(semente).choices("ACGT", k=n))
+
+
+def gerar_proteina(n: int, semente: int = SEMENTE) -> str:
+    """
+    @brief Gera uma sequência proteica aleatória e reprodutível.
+    """
+    return "".join(random.Random(semente).choices(AMINOACIDOS, k=n))
+
+
+def gerar_familia(n: int, quantidade: int, taxa: float = 0.1, semente: int = SEMENTE,
+                  alfabeto: str = "ACGT", ancestral: Optional[str] = None) -> List[str]:
+    """
+    @brief Gera sequências aparentadas, obtidas por mutação de um ancestral comum.
+
+    @details Cada posição do ancestral sofre, com probabilidade `taxa`, uma substituição,
+             uma remoção ou uma inserção, o que produz sequências com comprimentos
+             ligeiramente diferentes, como num alinhamento múltiplo real.
+
+    @param n Comprimento do ancestral.
+    @param quantidade Número de sequências.
+    @param taxa Probabilidade de mutação por posição.
+    @param semente Semente do gerador.
+    @param alfabeto Caracteres permitidos.
+    @param ancestral Sequência ancestral (por omissão, gerada aleatoriamente com comprimento n).
+    @return Lista de sequências.
+    """
+    aleatorio = random.Random(semente)
+    if ancestral is None:
+        ancestral = aleatorio.choices(alfabeto, k=n)
+    familia = []
+    for _ in range(quantidade):
+        sequencia = []
+        for base in ancestral:
+            sorteio = aleatorio.random()
+            if sorteio >= taxa:
+                sequencia.append(base)
+            elif sorteio < taxa / 3:
+                sequencia.append(aleatorio.choice(alfabeto))
+            elif sorteio < 2 * taxa / 3:
+                sequencia.extend((base, aleatorio.choice(alfabeto)))
+        familia.append("".join(sequencia))
+    return familia
+
+
+class Caso(NamedTuple):
+    """
+    @brief Caso de benchmark.
+
+    @param nome Nome do caso (normalmente a função medida)
+    @param tamanhos Tamanhos de entrada a medir
+    @param preparar Função que recebe o tamanho e devolve (função sem argumentos a medir, número de células)
+    """
+    nome: str
+    tamanhos: List[int]
+    preparar: Callable[[int], Tuple[Callable[[], object], int]]
+
+
+def _caso_alinhar(n: int):
+    seq1, seq2 = gerar_proteina(n, SEMENTE), gerar_proteina(n, SEMENTE + 1)
+    return (lambda: needleman_wunsch.alinhar(seq1, seq2)), n * n
+
+
+def _caso_sw(n: int):
+    matriz = [[2 if i == j else -1 for j in range(4)] for i in range(4)]
+    seq1, seq2 = gerar_familia(n, 2)
+
+    def executar():
+        score, trace = smith_waterman.SW(seq1, seq2, matriz, -2)
+        return smith_waterman.reconstruct_SW(seq1, seq2, score, trace)
+    return executar, len(seq1) * len(seq2)
+
+
+def _caso_progressivo(n: int):
+    familia = gerar_familia(n, 5)
+    return (lambda: alinhamento_progressivo.alinhamento_progressivo(familia)), (len(familia) - 1) * n * n
+
+
+def _caso_progressivo_arvore(n: int):
+    familia = gerar_familia(100, n)
+    return (lambda: alinhamento_arvore.alinhamento_progressivo_arvore(familia)), (n - 1) * 100 * 100
+
+
+def _caso_arvore(n: int):
+    familia = gerar_familia(n, 6, taxa=0.2)
+    k = len(familia)
+    return (lambda: arvore_filogenetica.construir_arvore(familia)), k * (k - 1) * n * n
+
+
+def _caso_hits(n: int):
+    seq = gerar_adn(n)
+    query = seq[n // 2:n // 2 + 50]
+
+    def executar():
+        resultado = blast.hits(blast.query_map(query, 11), seq)
+        return [blast.extend_hit_direction(query, seq, hit, 11, 1) for hit in resultado]
+    return executar, len(query) * n
+
+
+def _caso_mapear(n: int):
+    referencia = gerar_adn(200_000)
+    aleatorio = random.Random(SEMENTE)
+    inicios = [aleatorio.randrange(len(referencia) - 100) for _ in range(n)]
+    leituras = [gerar_familia(100, 1, taxa=0.03, semente=SEMENTE + i, ancestral=referencia[p:p + 100])[0]
+                for i, p in enumerate(inicios)]
+    mapeador = mapeamento.Mapeador(referencia)
+    return (lambda: mapeador.mapear(leituras)), sum(map(len, leituras))
+
+
+def _caso_seq_mais_provavel(n: int):
+    sitios = gerar_familia(12, 20, taxa=0.2)
+    sitios = [s[:10].ljust(10, "A") for s in sitios]
+    matriz = pwm.AnalisadorSequencias.pwm(sitios)
+    seq = gerar_adn(n)
+    return (lambda: pwm.AnalisadorSequencias.seq_mais_provavel(seq, matriz)), n * len(matriz)
+
+
+def _caso_biblioteca_motivos(n: int):
+    aleatorio = random.Random(SEMENTE)
+    motivos = {}
+    for i in range(n):
+        L = aleatorio.randint(8, 20)
+        sitios = [s[:L].ljust(L, "A") for s in gerar_familia(L, 10, taxa=0.2, semente=SEMENTE + i)]
+        motivos[f"m{i}"] = pwm.MatrizMotivo.de_sequencias(sitios, pseudocontagem=0.25).normalizar().pssm()
+    limiares = {nome: 0.6 * m.valores.max(axis=1).sum() for nome, m in motivos.items()}
+    biblioteca = pwm.BibliotecaMotivos(motivos, limiares)
+    seq = gerar_adn(100_000)
+    return (lambda: biblioteca.procurar(seq)), n * len(seq)
+
+
+def _caso_sequencias(funcao: str):
+    def preparar(n: int):
+        seq = gerar_adn(n)
+        alvo = getattr(sequencias, funcao)
+        if funcao == "encontrar_orfs":
+            return (lambda: list(alvo(seq))), n
+        return (lambda: alvo(seq)), n
+    return preparar
+
+
+CASOS: Dict[str, Caso] = {c.nome: c for c in [
+    Caso("alinhar", [50, 100, 200], _caso_alinhar),
+    Caso("SW", [50, 100, 200], _caso_sw),
+    Caso("alinhamento_progressivo", [25, 50, 100], _caso_progressivo),
+    Caso("alinhamento_progressivo_arvore", [50, 200, 800], _caso_progressivo_arvore),
+    Caso("construir_arvore", [25, 50, 100], _caso_arvore),
+    Caso("hits", [1000, 4000, 16000], _caso_hits),
+    Caso("mapear", [500, 2000, 8000], _caso_mapear),
+    Caso("biblioteca_motivos", [10, 100, 1000], _caso_biblioteca_motivos),
+    Caso("seq_mais_provavel", [10_000, 100_000, 1_000_000], _caso_seq_mais_provavel),
+    Caso("complemento_inverso", [100_000, 1_000_000, 10_000_000], _caso_sequencias("complemento_inverso")),
+    Caso("dna_para_proteina", [100_000, 1_000_000, 10_000_000], _caso_sequencias("dna_para_proteina")),
+    Caso("traduzir_seis_quadros", [100_000, 1_000_000, 10_000_000], _caso_sequencias("traduzir_seis_quadros")),
+    Caso("encontrar_orfs", [100_000, 1_000_000, 10_000_000], _caso_sequencias("encontrar_orfs")),
+    Caso("contagem_bases", [100_000, 1_000_000, 10_000_000], _caso_sequencias("contagem_bases")),
+]}
+
+
+def medir(funcao: Callable[[], object], repeticoes: int = 3) -> Tuple[float, int]:
+    """
+    @brief Mede o tempo e o pico de memória de uma função.
+
+    @param funcao Função sem argumentos.
+    @param repeticoes Número de execuções cronometradas (é guardado o melhor tempo).
+    @return Tuplo (tempo em segundos, pico de memória em bytes).
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(tempos), pico
+
+
+def executar(nomes: Optional[List[str]] = None, repeticoes: int = 3,
+             escala: float = 1.0) -> Dict[str, object]:
+    """
+    @brief Executa os casos de benchmark para todos os tamanhos.
+
+    @param nomes Casos a executar (todos por omissão).
+    @param repeticoes Número de execuções cronometradas por medição.
+    @param escala Fator aplicado aos tamanhos (por exemplo 0.1 para uma execução rápida).
+    @return Dicionário com informação do sistema e a lista de resultados.
+    """
+    resultados = []
+    for nome in nomes or list(CASOS):
+        caso = CASOS[nome]
+        for tamanho in caso.tamanhos:
+            tamanho = max(1, int(tamanho * escala))
+            funcao, celulas = caso.preparar(tamanho)
+            tempo, pico = medir(funcao, repeticoes)
+            resultados.append({
+                "caso": nome,
+                "tamanho": tamanho,
+                "tempo": tempo,
+                "memoria_pico": pico,
+                "celulas_por_segundo": celulas / tempo if tempo > 0 else None,
+            })
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semente": SEMENTE,
+        "resultados": resultados,
+    }
+
+
+def comparar(atual: Dict[str, object], referencia: Dict[str, object],
+             limiar: float = LIMIAR_REGRESSAO) -> List[Dict[str, object]]:
+    """
+    @brief Compara uma execução com uma execução de referência.
+
+    @param atual Resultados da execução atual (ver executar).
+    @param referencia Resultados de referência.
+    @param limiar Aumento relativo a partir do qual o tempo ou a memória contam como regressão.
+    @return Lista das medições com regressão, com os valores atuais, de referência e a razão.
+    """
+    base = {(r["caso"], r["tamanho"]): r for r in referencia["resultados"]}
+    regressoes = []
+    for r in atual["resultados"]:
+        anterior = base.get((r["caso"], r["tamanho"]))
+        if anterior is None:
+            continue
+        for metrica in ("tempo", "memoria_pico"):
+            if anterior[metrica] and r[metrica] > anterior[metrica] * (1 + limiar):
+                regressoes.append({"caso": r["caso"], "tamanho": r["tamanho"], "metrica": metrica,
+                                   "atual": r[metrica], "referencia": anterior[metrica],
+                                   "razao": r[metrica] / anterior[metrica]})
+    return regressoes
+
+
+def imprimir(resultados: Dict[str, object]) -> None:
+    """
+    @brief Imprime os resultados numa tabela.
+    """
+    print(f"{'caso':<24}{'tamanho':>10}{'tempo (s)':>12}{'pico (KiB)':>12}{'células/s':>14}")
+    for r in resultados["resultados"]:
+        celulas = r["celulas_por_segundo"]
+        print(f"{r['caso']:<24}{r['tamanho']:>10}{r['tempo']:>12.4f}{r['memoria_pico'] / 1024:>12.1f}"
+              f"{celulas if celulas is not None else float('nan'):>14.3g}")
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """
+    @brief Ponto de entrada da linha de comandos.
+
+    @return 1 se houver regressões face à referência, 0 caso contrário.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de análise de sequências.")
+    parser.add_argument("casos", nargs="*", help=f"casos a executar (todos por omissão): {', '.join(CASOS)}")
+    parser.add_argument("--saida", help="ficheiro JSON onde gravar os resultados")
+    parser.add_argument("--referencia", help="ficheiro JSON de uma execução anterior para comparar")
+    parser.add_argument("--limiar", type=float, default=LIMIAR_REGRESSAO,
+                        help="aumento relativo considerado regressão (predefinido: %(default)s)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--escala", type=float, default=1.0, help="fator aplicado aos tamanhos")
+    opcoes = parser.parse_args(argumentos)
+    desconhecidos = [c for c in opcoes.casos if c not in CASOS]
+    if desconhecidos:
+        parser.error(f"casos desconhecidos: {', '.join(desconhecidos)}")
+
+    resultados = executar(opcoes.casos or None, opcoes.repeticoes, opcoes.escala)
+    imprimir(resultados)
+    if opcoes.saida:
+        with open(opcoes.saida, "w") as ficheiro:
+            json.dump(resultados, ficheiro, indent=2)
+
+    if opcoes.referencia:
+        with open(opcoes.referencia) as ficheiro:
+            regressoes = comparar(resultados, json.load(ficheiro), opcoes.limiar)
+        for r in regressoes:
+            print(f"REGRESSÃO {r['caso']} (n={r['tamanho']}) {r['metrica']}: "
+                  f"{r['referencia']:.4g} -> {r['atual']:.4g} ({r['razao']:.2f}x)")
+        return 1 if regressoes else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
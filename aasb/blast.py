@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import List, Dict, Tuple, TYPE_CHECKING
+
+from .instrumentacao import contar, instrumentado
+
+if TYPE_CHECKING:
+    from .indice_sufixos import IndiceSufixos
+
+DEBUG: bool = False  
+
+## @package sequence_analysis
+#  Módulo para análise de sequências biológicas.
+#  Este módulo inclui funções para mapear substrings numa sequência,
+#  encontrar hits entre sequências e estender alinhamentos.
+
+@instrumentado()
+def query_map(seq: str, window_size: int) -> Dict[str, List[int]]:
+    """
+    @brief Cria um mapa de substrings e suas posições na sequência.
+
+    @param seq Sequência de entrada.
+    @param window_size Tamanho da janela para substrings.
+    @return Dicionário com substrings como chaves e listas de posições como valores.
+    """
+    res = defaultdict(list)
+    size = len(seq)
+    for position in range(size - window_size + 1):
+        subseq = seq[position:position + window_size]
+        res[subseq].append(position)
+        if DEBUG:
+            print(f"Substring encontrada: {subseq} na posição {position}")
+    if DEBUG:
+        print("Mapa de substrings criado:", dict(res))
+    contar("blast.palavras", len(res))
+    return res
+
+def get_all_positions(subseq: str, seq: str) -> List[int]:
+    """
+    @brief Encontra todas as posições de uma substring numa sequência.
+
+    @param subseq Substring a ser encontrada.
+    @param seq Sequência onde será feita a busca.
+    @return Lista de posições onde a substring ocorre.
+    """
+    return [i for i in range(len(seq) - len(subseq) + 1) if seq[i:i + len(subseq)] == subseq]
+
+@instrumentado()
+def hits(qm: Dict[str, List[int]], seq: str) -> List[Tuple[int, int]]:
+    """
+    @brief Identifica hits entre duas sequências.
+
+    @param qm Mapa de substrings gerado pela função query_map.
+    @param seq Sequência para comparação.
+    @return Lista de tuplas (posição na query, posição na sequência).
+    """
+    res = []
+    for subseq, positions_query in qm.items():
+        for pos_query in positions_query:
+            for pos_seq in get_all_positions(subseq, seq):
+                res.append((pos_query, pos_seq))
+    contar("blast.sementes", len(res))
+    return res
+
+@instrumentado()
+def hits_indexados(query: str, seq: str, window_size: int) -> List[Tuple[int, int]]:
+    """
+    @brief Identifica hits entre duas sequências de DNA usando índices de k-meros.
+
+    @details Equivalente a hits(query_map(query, window_size), seq), mas cada sequência
+             é indexada uma única vez com k-meros de 2 bits (ver kmeros.indice_posicoes)
+             e as palavras comuns são obtidas por interseção dos índices, em vez de
+             procurar cada palavra da query em toda a sequência. Janelas com caracteres
+             fora de ACGT são ignoradas.
+
+    @param query Sequência da query.
+    @param seq Sequência para comparação.
+    @param window_size Tamanho das palavras (até 32).
+    @return Lista de tuplas (posição na query, posição na sequência), ordenada.
+    """
+    import numpy as np
+    from .kmeros import indice_posicoes
+
+    kmeros_q, inicios_q, posicoes_q = indice_posicoes(query, window_size)
+    kmeros_s, inicios_s, posicoes_s = indice_posicoes(seq, window_size)
+    _, comuns_q, comuns_s = np.intersect1d(kmeros_q, kmeros_s, assume_unique=True, return_indices=True)
+    res = []
+    for a, b in zip(comuns_q, comuns_s):
+        lista_seq = posicoes_s[inicios_s[b]:inicios_s[b + 1]].tolist()
+        for pos_query in posicoes_q[inicios_q[a]:inicios_q[a + 1]].tolist():
+            res.extend((pos_query, pos_seq) for pos_seq in lista_seq)
+    res.sort()
+    if DEBUG:
+        print("Hits indexados encontrados:", res)
+    contar("blast.sementes", len(res))
+    return res
+
+@instrumentado()
+def hits_mem(query: str, indice: IndiceSufixos, min_size: int = 20) -> List[Tuple[int, int, int]]:
+    """
+    @brief Identifica hits de comprimento variável com correspondências exatas maximais (MEMs).
+
+    @details Em vez de palavras de tamanho fixo, cada hit é uma correspondência exata que
+             não pode ser estendida em nenhum sentido, obtida por pesquisa no índice de
+             sufixos da referência (ver indice_sufixos.IndiceSufixos.correspondencias_maximas).
+
+    @param query Sequência da query.
+    @param indice Índice de sufixos da referência.
+    @param min_size Comprimento mínimo dos hits.
+    @return Lista de tuplas (posição na query, posição na referência, comprimento).
+    """
+    res = [tuple(mem) for mem in indice.correspondencias_maximas(query, min_size)]
+    if DEBUG:
+        print("Hits MEM encontrados:", res)
+    contar("blast.sementes", len(res))
+    return res
+
+@instrumentado()
+def extend_hit_direction(query: str, seq: str, hit: Tuple[int, int], window_size: int, direction: int) -> Tuple[int, int, int, int]:
+    """
+    @brief Estende um alinhamento numa direção.
+
+    @param query Sequência da query.
+    @param seq Sequência de referência.
+    @param hit Tupla com posições iniciais (query, sequência).
+    @param window_size Tamanho da janela inicial.
+    @param direction Direção da extensão (+1 para frente, -1 para trás).
+    @return Tupla com posição inicial na query, posição inicial na sequência,
+            tamanho do alinhamento e número de caracteres iguais.
+    """
+    pos_query, pos_seq = hit
+    match_size = window_size
+    equal_chars = window_size
+
+    while 0 <= pos_query + direction < len(query) and 0 <= pos_seq + direction < len(seq):
+        pos_query += direction
+        pos_seq += direction
+        if query[pos_query] == seq[pos_seq]:
+            equal_chars += 1
+        else:
+            if equal_chars < (match_size + 1) // 2:
+                break
+        match_size += 1
+
+    contar("blast.extensoes")
+    contar("blast.posicoes_estendidas", match_size - window_size)
+    start_query = pos_query - (match_size - 1) * direction
+    start_seq = pos_seq - (match_size - 1) * direction
+    return start_query, start_seq, match_size, equal_chars
+
+if __name__ == "__main__":
+    query = "AATATAT"
+    seq = "AATATGTTATATAATAATATTT"
+
+    window_size = 3
+    qm = query_map(query, window_size)
+
+    hits_result = hits(qm, seq)
+    print("Hits encontrados:", hits_result)
+
+    for hit in hits_result:
+        result = extend_hit_direction(query, seq, hit, window_size, direction=1)
+        print("Extensão do hit:", hit, "->", result)
+
@@ -0,0 +1,401 @@
+from typing import Iterator, Tuple, List, Dict, Optional, NamedTuple
+import mmap
+import os
+
+## @package fasta
+#  Módulo de leitura de ficheiros de sequências FASTA e FASTQ.
+#  Oferece três modos de acesso: geradores de registos para leitura sequencial,
+#  leitura em blocos de tamanho fixo (memória constante mesmo com linhas enormes)
+#  e acesso aleatório através de um índice de posições compatível com o .fai do
+#  samtools, com o ficheiro mapeado em memória (mmap).
+
+TAMANHO_LEITURA: int = 1 << 20
+ESPACOS: bytes = b" \t\r\n"
+
+
+class Registo(NamedTuple):
+    """
+    @brief Registo de um ficheiro FASTA ou FASTQ.
+
+    @param identificador Primeira palavra do cabeçalho
+    @param descricao Restante texto do cabeçalho
+    @param sequencia Sequência (sem mudanças de linha)
+    @param qualidade Qualidades FASTQ (None em FASTA)
+    """
+    identificador: str
+    descricao: str
+    sequencia: str
+    qualidade: Optional[str] = None
+
+
+class EntradaIndice(NamedTuple):
+    """
+    @brief Linha de um índice .fai (FASTA) ou .fai de FASTQ (com posição das qualidades).
+
+    @param nome Identificador do registo
+    @param comprimento Número de bases
+    @param posicao Posição (em bytes) da primeira base no ficheiro
+    @param bases_linha Número de bases por linha
+    @param bytes_linha Número de bytes por linha, incluindo a mudança de linha
+    @param posicao_qualidade Posição da primeira qualidade (só em FASTQ)
+    """
+    nome: str
+    comprimento: int
+    posicao: int
+    bases_linha: int
+    bytes_linha: int
+    posicao_qualidade: Optional[int] = None
+
+
+def _identificador(cabecalho: bytes) -> str:
+    """
+    @brief Extrai o identificador (primeira palavra) de uma linha de cabeçalho.
+    """
+    palavras = bytes(cabecalho).split()
+    return palavras[0].decode("utf-8", "replace") if palavras else ""
+
+
+def ler_blocos_fasta(caminho: str, tamanho_bloco: int = 1 << 20,
+                     sobreposicao: int = 0) -> Iterator[Tuple[str, int, str]]:
+    """
+    @brief Lê um ficheiro FASTA em blocos de sequência de tamanho fixo.
+
+    @details Cada bloco tem no máximo tamanho_bloco + sobreposicao caracteres e o
+             bloco seguinte do mesmo registo começa tamanho_bloco posições depois,
+             repetindo os últimos `sobreposicao` caracteres. Com sobreposicao = L - 1,
+             cada janela de comprimento L aparece por inteiro em exatamente um bloco
+             como janela a começar nas primeiras tamanho_bloco posições.
+
+    @param caminho Caminho do ficheiro FASTA.
+    @param tamanho_bloco Número de posições novas em cada bloco.
+    @param sobreposicao Número de caracteres repetidos do bloco anterior.
+    @return Gerador de tuplos (identificador, posição inicial no registo, bloco).
+    """
+    assert tamanho_bloco > 0, "O tamanho do bloco deve ser positivo!"
+    limite = tamanho_bloco + sobreposicao
+
+    identificador = None
+    cabecalho = bytearray()
+    em_cabecalho = False
+    inicio_linha = True
+    buffer = bytearray()
+    posicao = 0
+
+    def esvaziar(final: bool):
+        nonlocal buffer, posicao
+        while len(buffer) >= limite:
+            yield identificador, posicao, buffer[:limite].decode("ascii", "replace")
+            del buffer[:tamanho_bloco]
+            posicao += tamanho_bloco
+        if final and (len(buffer) > sobreposicao or (posicao == 0 and buffer)):
+            yield identificador, posicao, buffer.decode("ascii", "replace")
+
+    with open(caminho, "rb") as ficheiro:
+        while True:
+            dados = ficheiro.read(TAMANHO_LEITURA)
+            if not dados:
+                break
+            linhas = dados.split(b"\n")
+            for i, linha in enumerate(linhas):
+                termina = i < len(linhas) - 1          # esta parte termina numa mudança de linha
+                if inicio_linha and linha.startswith(b">"):
+                    if identificador is not None:
+                        yield from esvaziar(final=True)
+                    buffer, posicao = bytearray(), 0
+                    cabecalho = bytearray(linha[1:])
+                    em_cabecalho = True
+                elif em_cabecalho:
+                    cabecalho += linha
+                elif identificador is not None:
+                    buffer += linha.translate(None, ESPACOS)
+                    yield from esvaziar(final=False)
+                if em_cabecalho and termina:
+                    identificador = _identificador(cabecalho)
+                    em_cabecalho = False
+                if termina or linha:
+                    inicio_linha = termina
+        if em_cabecalho:
+            identificador = _identificador(cabecalho)
+        if identificador is not None:
+            yield from esvaziar(final=True)
+
+
+def _cabecalho(linha: bytes) -> Tuple[str, str]:
+    """
+    @brief Separa uma linha de cabeçalho (sem o '>' ou '@') em identificador e descrição.
+    """
+    partes = linha.decode("utf-8", "replace").strip().split(None, 1)
+    if not partes:
+        return "", ""
+    return partes[0], partes[1] if len(partes) > 1 else ""
+
+
+def ler_fasta(caminho: str) -> Iterator[Registo]:
+    """
+    @brief Lê um ficheiro FASTA registo a registo.
+
+    @param caminho Caminho do ficheiro FASTA.
+    @return Gerador de registos; só o registo atual é mantido em memória.
+    """
+    identificador = descricao = None
+    partes: List[bytes] = []
+    with open(caminho, "rb") as ficheiro:
+        for linha in ficheiro:
+            if linha.startswith(b">"):
+                if identificador is not None:
+                    yield Registo(identificador, descricao, b"".join(partes).decode("ascii", "replace"))
+                identificador, descricao = _cabecalho(linha[1:])
+                partes = []
+            elif identificador is not None:
+                partes.append(linha.translate(None, ESPACOS))
+    if identificador is not None:
+        yield Registo(identificador, descricao, b"".join(partes).decode("ascii", "replace"))
+
+
+def ler_fastq(caminho: str) -> Iterator[Registo]:
+    """
+    @brief Lê um ficheiro FASTQ (quatro linhas por registo) registo a registo.
+
+    @param caminho Caminho do ficheiro FASTQ.
+    @return Gerador de registos com sequência e qualidades.
+    @exception ValueError Se o ficheiro não respeitar o formato FASTQ.
+    """
+    with open(caminho, "rb") as ficheiro:
+        while True:
+            cabecalho = ficheiro.readline()
+            if not cabecalho:
+                return
+            if not cabecalho.strip():
+                continue
+            sequencia = ficheiro.readline().strip()
+            separador = ficheiro.readline()
+            qualidade = ficheiro.readline().strip()
+            if not cabecalho.startswith(b"@") or not separador.startswith(b"+"):
+                raise ValueError(f"Registo FASTQ inválido: {cabecalho[:50]!r}")
+            if len(sequencia) != len(qualidade):
+                raise ValueError(f"Sequência e qualidade com comprimentos diferentes: {cabecalho[:50]!r}")
+            identificador, descricao = _cabecalho(cabecalho[1:])
+            yield Registo(identificador, descricao, sequencia.decode("ascii", "replace"),
+                          qualidade.decode("ascii", "replace"))
+
+
+def ler_sequencias(caminho: str) -> Iterator[Registo]:
+    """
+    @brief Lê um ficheiro FASTA ou FASTQ, detetando o formato pelo primeiro carácter.
+
+    @param caminho Caminho do ficheiro.
+    @return Gerador de registos.
+    @exception ValueError Se o formato não for reconhecido.
+    """
+    with open(caminho, "rb") as ficheiro:
+        primeiro = ficheiro.read(1)
+    if primeiro == b">":
+        return ler_fasta(caminho)
+    if primeiro == b"@":
+        return ler_fastq(caminho)
+    if not primeiro:
+        return iter(())
+    raise ValueError(f"Formato de ficheiro desconhecido: {caminho}")
+
+
+def _fim_sem_espacos(dados, inicio: int, fim: int) -> int:
+    """
+    @brief Recua `fim` enquanto os bytes anteriores forem mudanças de linha ou espaços.
+    """
+    while fim > inicio and dados[fim - 1] in ESPACOS:
+        fim -= 1
+    return fim
+
+
+def _entrada_fasta(dados, nome: str, inicio: int, fim: int) -> EntradaIndice:
+    """
+    @brief Cria a entrada do índice para a sequência que ocupa dados[inicio:fim].
+
+    @details Tal como o .fai, assume que todas as linhas do registo, exceto a última,
+             têm o mesmo número de bases.
+    """
+    fim = _fim_sem_espacos(dados, inicio, fim)
+    fim_linha = dados.find(b"\n", inicio, fim)
+    if fim_linha < 0:
+        return EntradaIndice(nome, fim - inicio, inicio, fim - inicio, fim - inicio + 1)
+    bases_linha = _fim_sem_espacos(dados, inicio, fim_linha) - inicio
+    bytes_linha = fim_linha + 1 - inicio
+    total = fim - inicio
+    completas, resto = divmod(total, bytes_linha)
+    return EntradaIndice(nome, completas * bases_linha + min(resto, bases_linha),
+                         inicio, bases_linha, bytes_linha)
+
+
+def indexar(caminho: str) -> List[EntradaIndice]:
+    """
+    @brief Constrói o índice de posições de um ficheiro FASTA ou FASTQ.
+
+    @details O ficheiro é mapeado em memória e, em FASTA, só os cabeçalhos são
+             procurados; o comprimento de cada registo é deduzido do tamanho em bytes e
+             da largura das linhas, sem percorrer as bases.
+
+    @param caminho Caminho do ficheiro.
+    @return Lista de entradas do índice, pela ordem do ficheiro.
+    @exception ValueError Se o formato não for reconhecido.
+    """
+    if os.path.getsize(caminho) == 0:
+        return []
+    entradas = []
+    with open(caminho, "rb") as ficheiro, \
+            mmap.mmap(ficheiro.fileno(), 0, access=mmap.ACCESS_READ) as dados:
+        if dados[:1] == b">":
+            posicao = 0
+            while posicao < len(dados):
+                fim_cabecalho = dados.find(b"\n", posicao)
+                if fim_cabecalho < 0:
+                    fim_cabecalho = len(dados)
+                nome, _ = _cabecalho(dados[posicao + 1:fim_cabecalho])
+                seguinte = dados.find(b"\n>", fim_cabecalho)
+                fim = len(dados) if seguinte < 0 else seguinte + 1
+                entradas.append(_entrada_fasta(dados, nome, min(fim_cabecalho + 1, fim), fim))
+                posicao = fim
+        elif dados[:1] == b"@":
+            posicao = 0
+            while posicao < len(dados):
+                linhas = []
+                for _ in range(4):
+                    fim_linha = dados.find(b"\n", posicao)
+                    fim_linha = len(dados) if fim_linha < 0 else fim_linha
+                    linhas.append((posicao, fim_linha))
+                    posicao = fim_linha + 1
+                (c0, c1), (s0, s1), _, (q0, _) = linhas
+                nome, _ = _cabecalho(dados[c0 + 1:c1])
+                comprimento = _fim_sem_espacos(dados, s0, s1) - s0
+                entradas.append(EntradaIndice(nome, comprimento, s0, comprimento, s1 + 1 - s0, q0))
+        else:
+            raise ValueError(f"Formato de ficheiro desconhecido: {caminho}")
+    return entradas
+
+
+def escrever_indice(entradas: List[EntradaIndice], caminho_indice: str):
+    """
+    @brief Escreve um índice no formato .fai (5 colunas em FASTA, 6 em FASTQ).
+
+    @param entradas Entradas do índice.
+    @param caminho_indice Caminho do ficheiro de índice.
+    """
+    with open(caminho_indice, "w") as ficheiro:
+        for e in entradas:
+            colunas = list(e) if e.posicao_qualidade is not None else list(e)[:5]
+            ficheiro.write("\t".join(map(str, colunas)) + "\n")
+
+
+def ler_indice(caminho_indice: str) -> List[EntradaIndice]:
+    """
+    @brief Lê um índice no formato .fai.
+
+    @param caminho_indice Caminho do ficheiro de índice.
+    @return Lista de entradas do índice.
+    """
+    entradas = []
+    with open(caminho_indice) as ficheiro:
+        for linha in ficheiro:
+            if linha.strip():
+                nome, *numeros = linha.rstrip("\n").split("\t")
+                entradas.append(EntradaIndice(nome, *map(int, numeros)))
+    return entradas
+
+
+class FicheiroIndexado:
+    """
+    @brief Acesso aleatório a registos de um FASTA ou FASTQ através de um índice .fai e de mmap.
+
+    @details Ao abrir, o índice é lido de `caminho.fai` (ou construído e gravado, se não
+             existir ou estiver desatualizado) e o ficheiro é mapeado em memória. Obter
+             uma região lê apenas as páginas que a contêm.
+    """
+
+    def __init__(self, caminho: str, caminho_indice: Optional[str] = None):
+        """
+        @brief Abre um ficheiro indexado.
+
+        @param caminho Caminho do ficheiro FASTA ou FASTQ.
+        @param caminho_indice Caminho do índice (por omissão, caminho + ".fai").
+        """
+        self.caminho = caminho
+        caminho_indice = caminho_indice or caminho + ".fai"
+        if os.path.exists(caminho_indice) and \
+                os.path.getmtime(caminho_indice) >= os.path.getmtime(caminho):
+            entradas = ler_indice(caminho_indice)
+        else:
+            entradas = indexar(caminho)
+            try:
+                escrever_indice(entradas, caminho_indice)
+            except OSError:
+                pass
+        self.indice: Dict[str, EntradaIndice] = {e.nome: e for e in entradas}
+        self._ficheiro = open(caminho, "rb")
+        self._dados = mmap.mmap(self._ficheiro.fileno(), 0, access=mmap.ACCESS_READ) \
+            if os.path.getsize(caminho) else b""
+
+    def __enter__(self) -> "FicheiroIndexado":
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        """
+        @brief Liberta o mapeamento em memória e fecha o ficheiro.
+        """
+        if isinstance(self._dados, mmap.mmap):
+            self._dados.close()
+        self._ficheiro.close()
+
+    def __len__(self) -> int:
+        return len(self.indice)
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self.indice
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.indice)
+
+    def comprimento(self, nome: str) -> int:
+        """
+        @brief Devolve o número de bases de um registo.
+        """
+        return self.indice[nome].comprimento
+
+    def _ler(self, posicao: int, entrada: EntradaIndice, inicio: int, fim: int) -> str:
+        """
+        @brief Lê as posições [inicio, fim) de um bloco de linhas que começa em `posicao`.
+        """
+        if fim <= inicio:
+            return ""
+        b0 = posicao + (inicio // entrada.bases_linha) * entrada.bytes_linha + inicio % entrada.bases_linha
+        b1 = posicao + ((fim - 1) // entrada.bases_linha) * entrada.bytes_linha + (fim - 1) % entrada.bases_linha + 1
+        return self._dados[b0:b1].translate(None, ESPACOS).decode("ascii", "replace")
+
+    def obter(self, nome: str, inicio: int = 0, fim: Optional[int] = None) -> str:
+        """
+        @brief Obtém a subsequência [inicio, fim) de um registo (coordenadas base 0).
+
+        @param nome Identificador do registo.
+        @param inicio Posição inicial.
+        @param fim Posição final, exclusiva (por omissão, o fim do registo).
+        @return Subsequência pedida.
+        @exception KeyError Se o registo não existir.
+        """
+        entrada = self.indice[nome]
+        fim = entrada.comprimento if fim is None else min(fim, entrada.comprimento)
+        return self._ler(entrada.posicao, entrada, max(inicio, 0), fim)
+
+    def qualidade(self, nome: str) -> str:
+        """
+        @brief Obtém as qualidades de um registo FASTQ.
+
+        @exception ValueError Se o ficheiro não for FASTQ.
+        """
+        entrada = self.indice[nome]
+        if entrada.posicao_qualidade is None:
+            raise ValueError("O ficheiro não tem qualidades (não é FASTQ)")
+        return self._ler(entrada.posicao_qualidade, entrada, 0, entrada.comprimento)
+
+    def __getitem__(self, nome: str) -> str:
+        return self.obter(nome)
@@ -0,0 +1,218 @@
+from typing import Dict, List, Optional, Tuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .blosum import Blosum62
+from .instrumentacao import contar, fase, instrumentado
+from .transcricao import Transcricao
+
+## @package frente_onda
+#  Alinhamento global (Needleman-Wunsch com Blosum62 e gap linear, como alinhar())
+#  de sequências muito longas, por blocos em frente de onda.
+#  A matriz é dividida em blocos de BLOCO x BLOCO células. Um bloco só depende da
+#  última linha do bloco de cima e da última coluna do bloco da esquerda, pelo que
+#  os blocos de cada anti-diagonal podem ser calculados em paralelo. Essas linhas e
+#  colunas de fronteira ficam em memória partilhada (multiprocessing.shared_memory)
+#  e servem também de pontos de controlo: o traceback recalcula apenas os blocos
+#  por onde o caminho passa, guardando as direções de um bloco de cada vez.
+#  A memória é O((n/BLOCO + m/BLOCO) * (n + m) + BLOCO^2) em vez de O(n * m).
+#  Dentro de um bloco cada linha é calculada de forma vetorizada; o movimento
+#  horizontal é resolvido com um máximo acumulado. Em caso de empate as direções
+#  seguem a mesma ordem de alinhar() (diagonal, cima, esquerda), pelo que o
+#  alinhamento obtido é o mesmo.
+
+BLOCO: int = 2048
+
+DIAGONAL, CIMA, ESQUERDA = 0, 1, 2
+
+_contexto: Dict[str, object] = {}
+
+
+def _tabela_blosum() -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    @brief Índice de cada símbolo da Blosum62 e a matriz de substituição correspondente.
+    """
+    tabela = Blosum62().tab
+    simbolos = list(tabela)
+    matriz = np.array([[tabela[a][b] for b in simbolos] for a in simbolos], dtype=np.int32)
+    return {s: i for i, s in enumerate(simbolos)}, matriz
+
+
+def _codificar(sequencia: str, indices: Dict[str, int]) -> np.ndarray:
+    """
+    @brief Índices das letras de uma sequência na Blosum62 (símbolos desconhecidos contam como X).
+    """
+    desconhecido = indices["X"]
+    return np.array([indices.get(c, desconhecido) for c in sequencia.upper()], dtype=np.intp)
+
+
+def preencher_bloco(substituicoes: np.ndarray, topo: np.ndarray, esquerda: np.ndarray, gap: int,
+                    direcoes: bool = False) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    @brief Calcula um bloco da matriz de programação dinâmica a partir das suas fronteiras.
+
+    @param substituicoes Pontuações de substituição do bloco, forma (h, w)
+    @param topo Linha acima do bloco, incluindo o canto (w + 1 valores)
+    @param esquerda Coluna à esquerda do bloco, incluindo o canto (h + 1 valores)
+    @param gap Penalização por gap (negativa)
+    @param direcoes Se True, devolve também as direções de todas as células
+    @return Tuplo (última linha (w + 1), última coluna (h + 1), direções (h, w) ou None)
+    """
+    h, w = substituicoes.shape
+    deslocamento = gap * np.arange(w + 1, dtype=np.int32)
+    linha = topo.astype(np.int32)
+    direita = np.empty(h + 1, dtype=np.int32)
+    direita[0] = linha[-1]
+    codigos = np.empty((h, w), dtype=np.uint8) if direcoes else None
+    for i in range(h):
+        diagonal = linha[:-1] + substituicoes[i]
+        cima = linha[1:] + gap
+        V = np.maximum(diagonal, cima)
+        nova = np.empty(w + 1, dtype=np.int32)
+        nova[0] = esquerda[i + 1]
+        nova[1:] = V
+        nova = np.maximum.accumulate(nova - deslocamento) + deslocamento   #esquerda: max_t V[t] + gap*(j - t)
+        if direcoes:
+            codigo = np.where(diagonal >= cima, DIAGONAL, CIMA).astype(np.uint8)
+            codigo[nova[1:] > V] = ESQUERDA
+            codigos[i] = codigo
+        direita[i + 1] = nova[-1]
+        linha = nova
+    return linha, direita, codigos
+
+
+def _limites(indice: int, bloco: int, comprimento: int) -> Tuple[int, int]:
+    return indice * bloco, min((indice + 1) * bloco, comprimento)
+
+
+def _inicializar(nomes: Tuple[str, str], formas: Tuple[Tuple[int, int], Tuple[int, int]],
+                 seq1: np.ndarray, seq2: np.ndarray, matriz: np.ndarray, gap: int, bloco: int) -> None:
+    """
+    @brief Liga um processo de trabalho às fronteiras em memória partilhada.
+    """
+    memorias = [shared_memory.SharedMemory(name=nome) for nome in nomes]
+    _contexto.update(memorias=memorias, seq1=seq1, seq2=seq2, matriz=matriz, gap=gap, bloco=bloco,
+                     linhas=np.ndarray(formas[0], dtype=np.int32, buffer=memorias[0].buf),
+                     colunas=np.ndarray(formas[1], dtype=np.int32, buffer=memorias[1].buf))
+
+
+def _calcular_bloco(I: int, J: int) -> None:
+    """
+    @brief Calcula o bloco (I, J) e escreve a sua última linha e última coluna nas fronteiras.
+    """
+    c = _contexto
+    seq1, seq2, bloco = c["seq1"], c["seq2"], c["bloco"]
+    r0, r1 = _limites(I, bloco, len(seq2))
+    c0, c1 = _limites(J, bloco, len(seq1))
+    linhas, colunas = c["linhas"], c["colunas"]
+    substituicoes = c["matriz"][seq2[r0:r1, None], seq1[None, c0:c1]]
+    fundo, direita, _ = preencher_bloco(substituicoes, linhas[I, c0:c1 + 1], colunas[J, r0:r1 + 1], c["gap"])
+    linhas[I + 1, c0:c1 + 1] = fundo
+    colunas[J + 1, r0:r1 + 1] = direita
+
+
+def _preencher(nI: int, nJ: int, processos: int, inicializacao: tuple) -> None:
+    """
+    @brief Calcula todos os blocos, em paralelo por dependências (frente de onda) se processos > 1.
+    """
+    if processos <= 1:
+        _inicializar(*inicializacao)
+        try:
+            for I in range(nI):
+                for J in range(nJ):
+                    _calcular_bloco(I, J)
+        finally:
+            for memoria in _contexto.pop("memorias"):
+                memoria.close()
+            _contexto.clear()
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    with ProcessPoolExecutor(processos, initializer=_inicializar, initargs=inicializacao) as executor:
+        feitos = set()
+        pendentes = {executor.submit(_calcular_bloco, 0, 0): (0, 0)}
+        while pendentes:
+            concluidos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                I, J = pendentes.pop(futuro)
+                futuro.result()
+                feitos.add((I, J))
+                for a, b in ((I + 1, J), (I, J + 1)):                #bloco pronto quando cima e esquerda estão feitos
+                    if a < nI and b < nJ and (a == 0 or (a - 1, b) in feitos) and (b == 0 or (a, b - 1) in feitos):
+                        pendentes[executor.submit(_calcular_bloco, a, b)] = (a, b)
+
+
+@instrumentado()
+def alinhar_frente_onda(seq1: str, seq2: str, gap: int = -8, bloco: int = BLOCO,
+                        processos: int = 1) -> Transcricao:
+    """
+    @brief Alinhamento global de sequências longas por blocos em frente de onda.
+
+    @details Produz o mesmo alinhamento e pontuação que alinhar() seguido de
+             transcrever_alinhamento(), sem guardar a matriz completa. Com processos > 1 os
+             blocos independentes são calculados em paralelo; o traceback é sequencial e
+             recalcula apenas os blocos atravessados pelo caminho.
+
+    @param seq1 Primeira sequência (colunas da matriz)
+    @param seq2 Segunda sequência (linhas da matriz)
+    @param gap Penalização por gap (valor predefinido: -8)
+    @param bloco Lado de cada bloco em células
+    @param processos Número de processos para o preenchimento
+    @return Transcricao do alinhamento global (I: carater só de seq1, D: carater só de seq2)
+
+    @exception ValueError Se alguma das sequências for vazia
+    """
+    if not seq1 or not seq2:
+        raise ValueError("As sequências de entrada não podem ser vazias")
+    indices, matriz = _tabela_blosum()
+    codigos1, codigos2 = _codificar(seq1, indices), _codificar(seq2, indices)
+    n1, n2 = len(seq1), len(seq2)
+    nI, nJ = -(-n2 // bloco), -(-n1 // bloco)
+    formas = ((nI + 1, n1 + 1), (nJ + 1, n2 + 1))
+    memorias = [shared_memory.SharedMemory(create=True, size=max(1, a * b * 4)) for a, b in formas]
+    try:
+        linhas = np.ndarray(formas[0], dtype=np.int32, buffer=memorias[0].buf)
+        colunas = np.ndarray(formas[1], dtype=np.int32, buffer=memorias[1].buf)
+        linhas[0] = gap * np.arange(n1 + 1)
+        colunas[0] = gap * np.arange(n2 + 1)
+        with fase("preenchimento"):
+            _preencher(nI, nJ, processos,
+                       (tuple(m.name for m in memorias), formas, codigos1, codigos2, matriz, gap, bloco))
+        contar("alinhar_frente_onda.celulas", n1 * n2)
+        contar("alinhar_frente_onda.blocos", nI * nJ)
+
+        with fase("traceback"):
+            pontuacao = int(linhas[nI, n1])
+            operacoes: List[str] = []
+            r, c = n2, n1
+            while r > 0 and c > 0:
+                I, J = (r - 1) // bloco, (c - 1) // bloco
+                r0, _ = _limites(I, bloco, n2)
+                c0, _ = _limites(J, bloco, n1)
+                substituicoes = matriz[codigos2[r0:r, None], codigos1[None, c0:c]]
+                _, _, direcoes = preencher_bloco(substituicoes, linhas[I, c0:c + 1], colunas[J, r0:r + 1],
+                                                 gap, direcoes=True)
+                contar("alinhar_frente_onda.blocos_recalculados")
+                direcoes = direcoes.tolist()
+                while r > r0 and c > c0:
+                    direcao = direcoes[r - 1 - r0][c - 1 - c0]
+                    if direcao == DIAGONAL:
+                        r -= 1
+                        c -= 1
+                        operacoes.append("=" if seq1[c] == seq2[r] else "X")
+                    elif direcao == CIMA:
+                        r -= 1
+                        operacoes.append("D")
+                    else:
+                        c -= 1
+                        operacoes.append("I")
+            operacoes.extend("I" * c)
+            operacoes.extend("D" * r)
+            operacoes.reverse()
+        return Transcricao.de_operacoes(operacoes, 0, 0, pontuacao)
+    finally:
+        for memoria in memorias:
+            memoria.close()
+            memoria.unlink()
@@ -0,0 +1,323 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from bisect import bisect_right
+from itertools import chain
+import mmap
+import os
+
+import numpy as np
+
+from .fasta import ler_sequencias
+
+## @package indice_sufixos
+#  Índice de sufixos (suffix array) para procura exata sobre referências grandes.
+#  O array de sufixos é construído por duplicação de prefixos com operações
+#  vetorizadas e as consultas são pesquisas binárias (O(m log n)) que funcionam
+#  para padrões de qualquer comprimento. O índice é guardado em disco e, ao ser
+#  carregado, o texto e o array são mapeados em memória, pelo que abrir uma
+#  referência grande não obriga a lê-la.
+
+SEPARADOR: bytes = b"$"
+INTERVALO_DIRETO: int = 16
+
+
+class CorrespondenciaMaxima(NamedTuple):
+    """
+    @brief Correspondência exata maximal (MEM) entre uma query e a referência.
+
+    @param pos_query Posição de início na query
+    @param pos_ref Posição de início no texto da referência
+    @param comprimento Comprimento da correspondência
+    """
+    pos_query: int
+    pos_ref: int
+    comprimento: int
+
+
+def construir_sufixos(texto: bytes) -> np.ndarray:
+    """
+    @brief Constrói o array de sufixos de um texto por duplicação de prefixos.
+
+    @details Na iteração com passo h, cada sufixo é ordenado pelo par (ordem dos
+             primeiros h caracteres, ordem dos h caracteres seguintes), combinado numa
+             única chave inteira. Termina quando todas as ordens são distintas, ou seja,
+             após O(log n) ordenações. Um sufixo que é prefixo de outro fica antes dele.
+
+    @param texto Texto a indexar.
+    @return Array com as posições iniciais dos sufixos por ordem lexicográfica.
+    """
+    n = len(texto)
+    tipo = np.int32 if n < np.iinfo(np.int32).max else np.int64
+    if n == 0:
+        return np.empty(0, dtype=tipo)
+    ordens = np.frombuffer(texto, dtype=np.uint8).astype(np.int64) + 1
+    maximo = int(ordens.max())
+    sufixos = np.argsort(ordens, kind="stable")
+    h = 1
+    while h < n:
+        segunda = np.zeros(n, dtype=np.int64)
+        segunda[:n - h] = ordens[h:]
+        chaves = ordens * (maximo + 1) + segunda
+        sufixos = np.argsort(chaves, kind="stable")
+        ordenadas = chaves[sufixos]
+        novas = np.empty(n, dtype=np.int64)
+        novas[sufixos] = np.cumsum(np.concatenate([[1], ordenadas[1:] != ordenadas[:-1]]))
+        ordens, maximo = novas, int(novas[sufixos[-1]])
+        if maximo == n:
+            break
+        h *= 2
+    return sufixos.astype(tipo)
+
+
+class IndiceSufixos:
+    """
+    @brief Índice de sufixos sobre uma ou mais sequências de referência.
+
+    @details As sequências são concatenadas, separadas por SEPARADOR, para que uma
+             correspondência nunca atravesse duas sequências. As posições devolvidas
+             são posições no texto concatenado; coordenadas() converte-as em
+             (nome da sequência, posição local).
+    """
+
+    def __init__(self, texto, sufixos: np.ndarray, nomes: List[str], inicios: List[int]):
+        """
+        @brief Cria o índice a partir de um texto e do respetivo array de sufixos.
+
+        @param texto Texto concatenado (bytes ou mmap).
+        @param sufixos Array de sufixos do texto.
+        @param nomes Nome de cada sequência.
+        @param inicios Posição de início de cada sequência no texto.
+        """
+        self.texto = texto
+        self.sufixos = sufixos
+        self.nomes = nomes
+        self.inicios = inicios
+        self._mapa: Optional[mmap.mmap] = None
+
+    @classmethod
+    def construir(cls, sequencias: Union[str, Dict[str, str], Iterable[Tuple[str, str]]]) -> "IndiceSufixos":
+        """
+        @brief Constrói o índice em memória.
+
+        @param sequencias Uma sequência, um dicionário {nome: sequência} ou pares (nome, sequência).
+        @return Índice construído.
+        """
+        if isinstance(sequencias, str):
+            sequencias = [("seq", sequencias)]
+        elif isinstance(sequencias, dict):
+            sequencias = sequencias.items()
+        nomes, inicios, partes, posicao = [], [], [], 0
+        for nome, sequencia in sequencias:
+            nomes.append(nome)
+            inicios.append(posicao)
+            partes.append(sequencia.upper().encode("ascii"))
+            posicao += len(sequencia) + len(SEPARADOR)
+        texto = SEPARADOR.join(partes)
+        return cls(texto, construir_sufixos(texto), nomes, inicios)
+
+    @classmethod
+    def de_fasta(cls, caminho: str) -> "IndiceSufixos":
+        """
+        @brief Constrói o índice com todas as sequências de um ficheiro FASTA ou FASTQ.
+        """
+        return cls.construir((r.identificador, r.sequencia) for r in ler_sequencias(caminho))
+
+    def guardar(self, prefixo: str):
+        """
+        @brief Guarda o índice em disco.
+
+        @details São escritos três ficheiros: `prefixo.seq` (texto concatenado),
+                 `prefixo.sa.npy` (array de sufixos) e `prefixo.nomes` (nome e início de
+                 cada sequência, separados por tabulação).
+
+        @param prefixo Caminho base dos ficheiros.
+        """
+        with open(prefixo + ".seq", "wb") as ficheiro:
+            ficheiro.write(self.texto)
+        np.save(prefixo + ".sa.npy", self.sufixos)
+        with open(prefixo + ".nomes", "w") as ficheiro:
+            for nome, inicio in zip(self.nomes, self.inicios):
+                ficheiro.write(f"{nome}\t{inicio}\n")
+
+    @classmethod
+    def carregar(cls, prefixo: str) -> "IndiceSufixos":
+        """
+        @brief Abre um índice guardado com guardar(), mapeando o texto e o array em memória.
+
+        @param prefixo Caminho base dos ficheiros.
+        @return Índice pronto a consultar; deve ser fechado com fechar() (ou usado com `with`).
+        """
+        nomes, inicios = [], []
+        with open(prefixo + ".nomes") as ficheiro:
+            for linha in ficheiro:
+                nome, inicio = linha.rstrip("\n").split("\t")
+                nomes.append(nome)
+                inicios.append(int(inicio))
+        sufixos = np.load(prefixo + ".sa.npy", mmap_mode="r")
+        mapa = None
+        if os.path.getsize(prefixo + ".seq"):
+            with open(prefixo + ".seq", "rb") as ficheiro:
+                mapa = mmap.mmap(ficheiro.fileno(), 0, access=mmap.ACCESS_READ)
+        indice = cls(mapa if mapa is not None else b"", sufixos, nomes, inicios)
+        indice._mapa = mapa
+        return indice
+
+    def __enter__(self) -> "IndiceSufixos":
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        """
+        @brief Liberta o texto mapeado em memória (se o índice foi carregado do disco).
+        """
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self.sufixos = None
+
+    def __len__(self) -> int:
+        return len(self.texto)
+
+    def _limite(self, padrao: bytes, superior: bool) -> int:
+        """
+        @brief Pesquisa binária do primeiro sufixo cujo prefixo é >= (ou > se superior) o padrão.
+        """
+        texto, sufixos, m = self.texto, self.sufixos, len(padrao)
+        lo, hi = 0, len(sufixos)
+        while lo < hi:
+            meio = (lo + hi) // 2
+            inicio = int(sufixos[meio])
+            prefixo = texto[inicio:inicio + m]
+            if prefixo < padrao or (superior and prefixo == padrao):
+                lo = meio + 1
+            else:
+                hi = meio
+        return lo
+
+    def intervalo(self, padrao: Union[str, bytes]) -> Tuple[int, int]:
+        """
+        @brief Intervalo [inicio, fim) do array de sufixos cujos sufixos começam pelo padrão.
+        """
+        if isinstance(padrao, str):
+            padrao = padrao.upper().encode("ascii")
+        return self._limite(padrao, False), self._limite(padrao, True)
+
+    def contar(self, padrao: Union[str, bytes]) -> int:
+        """
+        @brief Número de ocorrências exatas do padrão na referência, em O(m log n).
+        """
+        inicio, fim = self.intervalo(padrao)
+        return fim - inicio
+
+    def localizar(self, padrao: Union[str, bytes]) -> List[int]:
+        """
+        @brief Posições (no texto concatenado) de todas as ocorrências do padrão, por ordem crescente.
+        """
+        inicio, fim = self.intervalo(padrao)
+        return sorted(int(p) for p in self.sufixos[inicio:fim])
+
+    def coordenadas(self, posicao: int) -> Tuple[str, int]:
+        """
+        @brief Converte uma posição do texto concatenado em (nome da sequência, posição local).
+        """
+        i = bisect_right(self.inicios, posicao) - 1
+        return self.nomes[i], posicao - self.inicios[i]
+
+    def _refinar(self, inicio: int, fim: int, profundidade: int, caracter: int) -> Tuple[int, int]:
+        """
+        @brief Restringe um intervalo de sufixos que partilham `profundidade` caracteres
+               aos que têm `caracter` na posição seguinte.
+        """
+        texto, sufixos, n = self.texto, self.sufixos, len(self.texto)
+
+        def chave(j: int) -> int:
+            p = int(sufixos[j]) + profundidade
+            return texto[p] if p < n else -1
+
+        lo, hi = inicio, fim
+        while lo < hi:
+            meio = (lo + hi) // 2
+            if chave(meio) < caracter:
+                lo = meio + 1
+            else:
+                hi = meio
+        novo_inicio, hi = lo, fim
+        while lo < hi:
+            meio = (lo + hi) // 2
+            if chave(meio) <= caracter:
+                lo = meio + 1
+            else:
+                hi = meio
+        return novo_inicio, lo
+
+    def _prefixo_comum(self, q: bytes, a: int, b: int) -> int:
+        """
+        @brief Comprimento do prefixo comum de q[a:] e texto[b:], comparando blocos de tamanho crescente.
+        """
+        texto = self.texto
+        limite = min(len(q) - a, len(texto) - b)
+        n, passo = 0, 16
+        while n < limite:
+            k = min(passo, limite - n)
+            if q[a + n:a + n + k] == texto[b + n:b + n + k]:
+                n += k
+                passo *= 2
+                continue
+            lo, hi = 0, k - 1
+            while lo < hi:
+                meio = (lo + hi + 1) // 2
+                if q[a + n:a + n + meio] == texto[b + n:b + n + meio]:
+                    lo = meio
+                else:
+                    hi = meio - 1
+            return n + lo
+        return n
+
+    def correspondencias_maximas(self, query: str, minimo: int = 20,
+                                 maximo_ocorrencias: Optional[int] = None) -> List[CorrespondenciaMaxima]:
+        """
+        @brief Encontra as correspondências exatas maximais (MEMs) entre a query e a referência.
+
+        @details Para cada posição i da query parte-se do intervalo de sufixos que começam
+                 por query[i:i + minimo] e estende-se um caracter de cada vez. Os sufixos
+                 que saem do intervalo ao passar do comprimento l para l + 1 (ou no fim da
+                 query) são as ocorrências cuja correspondência não pode ser estendida para
+                 a direita; são reportadas se também não puderem ser estendidas para a
+                 esquerda (caso contrário já estão contidas numa correspondência de i - 1).
+                 Quando restam poucos sufixos no intervalo (INTERVALO_DIRETO), cada um é
+                 estendido diretamente por comparação de blocos com a query.
+
+        @param query Sequência a comparar com a referência.
+        @param minimo Comprimento mínimo das correspondências.
+        @param maximo_ocorrencias Ignora correspondências com mais ocorrências do que este valor (repetições).
+        @return Lista de CorrespondenciaMaxima, ordenada por posição na query e na referência.
+        """
+        assert minimo > 0, "O comprimento mínimo deve ser positivo"
+        q = query.upper().encode("ascii")
+        m, texto, sufixos = len(q), self.texto, self.sufixos
+        resultados = []
+        for i in range(m - minimo + 1):
+            inicio, fim = self.intervalo(q[i:i + minimo])
+            comprimento = minimo
+            while inicio < fim:
+                if fim - inicio <= INTERVALO_DIRETO and \
+                        (maximo_ocorrencias is None or fim - inicio <= maximo_ocorrencias):
+                    for j in range(inicio, fim):
+                        p = int(sufixos[j])
+                        if i == 0 or p == 0 or texto[p - 1] != q[i - 1]:
+                            extensao = self._prefixo_comum(q, i + comprimento, p + comprimento)
+                            resultados.append(CorrespondenciaMaxima(i, p, comprimento + extensao))
+                    break
+                if i + comprimento < m:
+                    novo_inicio, novo_fim = self._refinar(inicio, fim, comprimento, q[i + comprimento])
+                else:
+                    novo_inicio = novo_fim = inicio
+                if maximo_ocorrencias is None or fim - inicio <= maximo_ocorrencias:
+                    for j in chain(range(inicio, novo_inicio), range(novo_fim, fim)):
+                        p = int(sufixos[j])
+                        if i == 0 or p == 0 or texto[p - 1] != q[i - 1]:
+                            resultados.append(CorrespondenciaMaxima(i, p, comprimento))
+                inicio, fim, comprimento = novo_inicio, novo_fim, comprimento + 1
+        resultados.sort()
+        return resultados
@@ -0,0 +1,189 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import defaultdict
+from contextlib import nullcontext
+from functools import wraps
+import marshal
+import pstats
+import time
+
+## @package instrumentacao
+#  Instrumentação leve dos algoritmos: tempos por fase e contadores.
+#  Desativada por omissão; nesse estado fase() devolve um contexto nulo partilhado
+#  e contar() retorna imediatamente, pelo que o custo é uma chamada de função por
+#  fase (nunca por célula). Com a instrumentação ativa, as fases aninhadas formam
+#  caminhos ("alinhar/preenchimento") e os resultados podem ser exportados como
+#  relatório ou como estatísticas no formato do cProfile/pstats.
+#  O estado é global ao processo e não é partilhado entre threads.
+
+ATIVA: bool = False
+
+_NULA = nullcontext()
+_pilha: List[list] = []
+_fases: Dict[str, List[float]] = {}
+_contadores: Dict[str, int] = defaultdict(int)
+
+
+def ativar(limpar_dados: bool = True) -> None:
+    """
+    @brief Ativa a instrumentação.
+
+    @param limpar_dados Se True, descarta as medições anteriores.
+    """
+    global ATIVA
+    if limpar_dados:
+        limpar()
+    ATIVA = True
+
+
+def desativar() -> None:
+    """
+    @brief Desativa a instrumentação (as medições feitas mantêm-se).
+    """
+    global ATIVA
+    ATIVA = False
+
+
+def limpar() -> None:
+    """
+    @brief Descarta todas as medições.
+    """
+    _pilha.clear()
+    _fases.clear()
+    _contadores.clear()
+
+
+class _Fase:
+    """
+    @brief Contexto que mede uma fase e a regista sob o caminho das fases em curso.
+    """
+    __slots__ = ("nome",)
+
+    def __init__(self, nome: str):
+        self.nome = nome
+
+    def __enter__(self):
+        caminho = f"{_pilha[-1][0]}/{self.nome}" if _pilha else self.nome
+        _pilha.append([caminho, time.perf_counter(), 0.0])
+        return self
+
+    def __exit__(self, *excecao):
+        caminho, inicio, filhos = _pilha.pop()
+        duracao = time.perf_counter() - inicio
+        registo = _fases.setdefault(caminho, [0, 0.0, 0.0])
+        registo[0] += 1
+        registo[1] += duracao
+        registo[2] += duracao - filhos
+        if _pilha:
+            _pilha[-1][2] += duracao
+        return False
+
+
+def fase(nome: str):
+    """
+    @brief Devolve um contexto que mede o tempo de uma fase.
+
+    @details Utilização: `with fase("preenchimento"): ...`. Sem instrumentação ativa
+             devolve um contexto nulo.
+
+    @param nome Nome da fase.
+    """
+    if not ATIVA:
+        return _NULA
+    return _Fase(nome)
+
+
+def instrumentado(nome: Optional[str] = None) -> Callable:
+    """
+    @brief Decorador que mede cada chamada da função como uma fase.
+
+    @param nome Nome da fase (nome da função por omissão).
+    """
+    def decorador(funcao: Callable) -> Callable:
+        rotulo = nome or funcao.__name__
+
+        @wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if not ATIVA:
+                return funcao(*args, **kwargs)
+            with _Fase(rotulo):
+                return funcao(*args, **kwargs)
+        return envolvida
+    return decorador
+
+
+def contar(nome: str, valor: int = 1) -> None:
+    """
+    @brief Soma `valor` ao contador `nome` (sem efeito com a instrumentação desativada).
+    """
+    if ATIVA:
+        _contadores[nome] += valor
+
+
+def relatorio() -> Dict[str, Dict]:
+    """
+    @brief Devolve as medições num dicionário serializável (por exemplo em JSON).
+
+    @return {"fases": {caminho: {"chamadas", "tempo_total", "tempo_proprio"}}, "contadores": {nome: valor}}
+    """
+    return {
+        "fases": {caminho: {"chamadas": int(chamadas), "tempo_total": total, "tempo_proprio": proprio}
+                  for caminho, (chamadas, total, proprio) in _fases.items()},
+        "contadores": dict(_contadores),
+    }
+
+
+def imprimir_relatorio() -> None:
+    """
+    @brief Imprime as fases (por caminho) e os contadores.
+    """
+    print(f"{'fase':<48}{'chamadas':>10}{'total (s)':>12}{'própria (s)':>13}")
+    for caminho in sorted(_fases):
+        chamadas, total, proprio = _fases[caminho]
+        print(f"{caminho:<48}{int(chamadas):>10}{total:>12.6f}{proprio:>13.6f}")
+    for nome in sorted(_contadores):
+        print(f"{nome:<48}{_contadores[nome]:>10}")
+
+
+def _chave(caminho: str) -> Tuple[str, int, str]:
+    return ("<fase>", 0, caminho)
+
+
+def estatisticas() -> Dict[Tuple[str, int, str], tuple]:
+    """
+    @brief Converte as fases no dicionário usado internamente pelo cProfile/pstats.
+
+    @details Cada fase é uma "função" (ficheiro "<fase>", linha 0, nome = caminho) com
+             (chamadas primitivas, chamadas, tempo próprio, tempo acumulado, chamadores),
+             em que o chamador é a fase mãe.
+    """
+    resultado = {}
+    for caminho, (chamadas, total, proprio) in _fases.items():
+        chamadas = int(chamadas)
+        mae = caminho.rpartition("/")[0]
+        chamadores = {_chave(mae): (chamadas, chamadas, proprio, total)} if mae else {}
+        resultado[_chave(caminho)] = (chamadas, chamadas, proprio, total, chamadores)
+    return resultado
+
+
+class _Perfil:
+    """
+    @brief Objeto com a interface esperada por pstats.Stats (create_stats e stats).
+    """
+
+    def create_stats(self):
+        self.stats = estatisticas()
+
+
+def obter_pstats() -> pstats.Stats:
+    """
+    @brief Devolve as fases como pstats.Stats (permite sort_stats, print_stats, print_callers, ...).
+    """
+    return pstats.Stats(_Perfil())
+
+
+def exportar_pstats(caminho: str) -> None:
+    """
+    @brief Grava as fases num ficheiro legível por pstats.Stats(caminho), snakeviz, etc.
+    """
+    with open(caminho, "wb") as ficheiro:
+        marshal.dump(estatisticas(), ficheiro)
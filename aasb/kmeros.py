@@ -0,0 +1,274 @@
+from typing import Dict, Iterable, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .sequencias import ADNCompacto, BASES_ADN, codigos_bases
+
+## @package kmeros
+#  Contagem de k-meros de DNA com codificação de 2 bits por base.
+#  Cada k-mero (k <= 32) é representado por um inteiro de 64 bits, calculado para
+#  todas as posições com deslocamentos e OR sucessivos (rolling) sobre a sequência
+#  codificada. As contagens são obtidas ordenando os inteiros (np.unique), sem
+#  criar uma string por k-mero.
+
+K_MAXIMO: int = 32
+
+
+def codificar_kmero(kmero: str) -> int:
+    """
+    @brief Converte um k-mero no seu inteiro de 2 bits por base (A=0, C=1, G=2, T=3).
+
+    @param kmero K-mero composto por A, C, G e T.
+    @return Inteiro que representa o k-mero.
+    @exception ValueError Se o k-mero tiver caracteres fora de ACGT.
+    """
+    valor = 0
+    for base in kmero.upper():
+        if base not in BASES_ADN:
+            raise ValueError(f"Base inválida no k-mero: {base}")
+        valor = (valor << 2) | BASES_ADN.index(base)
+    return valor
+
+
+def descodificar_kmero(valor: int, k: int) -> str:
+    """
+    @brief Converte um inteiro de 2 bits por base no k-mero correspondente.
+
+    @param valor Inteiro que representa o k-mero.
+    @param k Comprimento do k-mero.
+    @return K-mero em letras maiúsculas.
+    """
+    return "".join(BASES_ADN[(int(valor) >> (2 * (k - 1 - i))) & 3] for i in range(k))
+
+
+def kmeros_inteiros(sequencia, k: int, canonicos: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    @brief Calcula o inteiro de todos os k-meros válidos de uma sequência.
+
+    @details O valor de cada janela é construído com k operações vetorizadas
+             (valor = (valor << 2) | base seguinte) sobre a sequência inteira. O k-mero
+             canónico é o menor entre o k-mero e o seu complemento inverso, cujo valor é
+             construído da mesma forma a partir das bases complementares. Janelas com
+             caracteres fora de ACGT são descartadas.
+
+    @param sequencia Uma string ou ADNCompacto.
+    @param k Comprimento dos k-meros (1 a 32).
+    @param canonicos Se True, devolve os k-meros canónicos.
+    @return Tuplo (posições das janelas válidas, valores uint64 dos k-meros).
+    """
+    assert 0 < k <= K_MAXIMO, f"k deve estar entre 1 e {K_MAXIMO}"
+    codigos = codigos_bases(sequencia)
+    m = len(codigos) - k + 1
+    if m <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint64)
+
+    invalidos = np.concatenate([[0], np.cumsum(codigos == 4)])
+    validas = np.flatnonzero(invalidos[k:] - invalidos[:-k] == 0)
+
+    bases = np.minimum(codigos, 3).astype(np.uint64)
+    valores = np.zeros(m, dtype=np.uint64)
+    for j in range(k):
+        valores = (valores << np.uint64(2)) | bases[j:j + m]
+    if canonicos:
+        complementos = np.uint64(3) - bases
+        inversos = np.zeros(m, dtype=np.uint64)
+        for j in range(k):
+            inversos |= complementos[j:j + m] << np.uint64(2 * j)
+        valores = np.minimum(valores, inversos)
+    return validas, valores[validas]
+
+
+class ContagemKmeros:
+    """
+    @brief Tabela compacta de contagens de k-meros.
+
+    @details Guarda os k-meros distintos como um array ordenado de inteiros uint64 e as
+             respetivas contagens num array paralelo; a consulta de um k-mero é uma
+             pesquisa binária.
+    """
+
+    def __init__(self, k: int, kmeros: np.ndarray, contagens: np.ndarray, canonicos: bool = True):
+        """
+        @brief Cria uma tabela a partir de arrays já ordenados.
+
+        @param k Comprimento dos k-meros.
+        @param kmeros Valores distintos dos k-meros, por ordem crescente.
+        @param contagens Número de ocorrências de cada k-mero.
+        @param canonicos Se os k-meros são canónicos.
+        """
+        self.k = k
+        self.kmeros = kmeros
+        self.contagens = contagens
+        self.canonicos = canonicos
+
+    @classmethod
+    def de_valores(cls, k: int, valores: np.ndarray, canonicos: bool = True) -> "ContagemKmeros":
+        """
+        @brief Conta valores de k-meros por ordenação (np.unique).
+        """
+        kmeros, contagens = np.unique(valores, return_counts=True)
+        return cls(k, kmeros, contagens.astype(np.int64), canonicos)
+
+    @classmethod
+    def juntar(cls, tabelas: List["ContagemKmeros"]) -> "ContagemKmeros":
+        """
+        @brief Junta várias tabelas do mesmo k, somando as contagens dos k-meros comuns.
+        """
+        kmeros = np.concatenate([t.kmeros for t in tabelas])
+        contagens = np.concatenate([t.contagens for t in tabelas])
+        unicos, inversos = np.unique(kmeros, return_inverse=True)
+        return cls(tabelas[0].k, unicos, np.bincount(inversos, weights=contagens).astype(np.int64),
+                   tabelas[0].canonicos)
+
+    def __len__(self) -> int:
+        return len(self.kmeros)
+
+    def total(self) -> int:
+        """
+        @brief Número total de k-meros contados (com repetições).
+        """
+        return int(self.contagens.sum())
+
+    def contagem(self, kmero: str) -> int:
+        """
+        @brief Número de ocorrências de um k-mero (do seu canónico, se a tabela for canónica).
+
+        @param kmero K-mero a consultar.
+        @return Número de ocorrências (0 se não existir).
+        """
+        assert len(kmero) == self.k, f"O k-mero deve ter comprimento {self.k}"
+        valor = codificar_kmero(kmero)
+        if self.canonicos:
+            valor = min(valor, codificar_kmero(_complemento_inverso(kmero)))
+        i = int(np.searchsorted(self.kmeros, np.uint64(valor)))
+        if i < len(self.kmeros) and int(self.kmeros[i]) == valor:
+            return int(self.contagens[i])
+        return 0
+
+    def mais_frequentes(self, n: int = 10) -> List[Tuple[str, int]]:
+        """
+        @brief Devolve os n k-meros mais frequentes, por ordem decrescente de contagem.
+        """
+        ordem = np.argsort(-self.contagens, kind="stable")[:n]
+        return [(descodificar_kmero(self.kmeros[i], self.k), int(self.contagens[i])) for i in ordem]
+
+    def para_dicionario(self) -> Dict[str, int]:
+        """
+        @brief Converte a tabela num dicionário {k-mero: contagem} (para tabelas pequenas).
+        """
+        return {descodificar_kmero(v, self.k): int(c) for v, c in zip(self.kmeros.tolist(), self.contagens)}
+
+    def espectro(self) -> np.ndarray:
+        """
+        @brief Calcula o espectro de k-meros.
+
+        @return Array em que a posição i é o número de k-meros distintos com i ocorrências.
+        """
+        return np.bincount(self.contagens) if len(self.contagens) else np.zeros(1, dtype=np.int64)
+
+    def exportar_espectro(self, caminho: str):
+        """
+        @brief Escreve o espectro num ficheiro de texto com linhas "ocorrências<TAB>k-meros distintos".
+
+        @details Só são escritas as linhas com pelo menos um k-mero, como no histograma do Jellyfish.
+        """
+        espectro = self.espectro()
+        with open(caminho, "w") as ficheiro:
+            for ocorrencias in np.flatnonzero(espectro):
+                ficheiro.write(f"{ocorrencias}\t{espectro[ocorrencias]}\n")
+
+
+def _complemento_inverso(kmero: str) -> str:
+    """
+    @brief Complemento inverso de um k-mero (só ACGT).
+    """
+    return kmero.upper()[::-1].translate(str.maketrans("ACGT", "TGCA"))
+
+
+def _contar_lote(sequencias: List, k: int, canonicos: bool) -> ContagemKmeros:
+    """
+    @brief Conta os k-meros de um lote de sequências.
+    """
+    tabelas = [ContagemKmeros.de_valores(k, kmeros_inteiros(sequencia, k, canonicos)[1], canonicos)
+               for sequencia in sequencias]
+    return ContagemKmeros.juntar(tabelas) if len(tabelas) != 1 else tabelas[0]
+
+
+def _repartir(sequencias: List, k: int, partes: int) -> List[List]:
+    """
+    @brief Reparte as sequências em lotes de comprimento semelhante.
+
+    @details O conjunto das sequências é cortado de ceil(total / partes) em ceil(total / partes)
+             posições; um pedaço inclui as k - 1 bases seguintes, pelo que cada janela pertence
+             a um só pedaço.
+    """
+    tamanho = max(1, -(-sum(len(s) for s in sequencias) // partes))
+    lotes: List[List] = [[] for _ in range(partes)]
+    acumulado = 0
+    for sequencia in sequencias:
+        inicio = 0
+        while True:
+            fim = min(len(sequencia), inicio + tamanho - acumulado % tamanho)
+            lotes[min(acumulado // tamanho, partes - 1)].append(sequencia[inicio:fim + k - 1])
+            acumulado += fim - inicio
+            if fim >= len(sequencia) - k + 1:
+                break
+            inicio = fim
+    return [lote for lote in lotes if lote]
+
+
+def contar_kmeros(sequencias: Iterable, k: int, canonicos: bool = True,
+                  processos: int = 1) -> ContagemKmeros:
+    """
+    @brief Conta os k-meros de um conjunto de sequências.
+
+    @details Com vários processos, as sequências (as longas em pedaços sobrepostos em
+             k - 1 bases) são repartidas em lotes de comprimento semelhante; cada processo
+             recebe e codifica apenas o seu lote, e as tabelas parciais são somadas no fim.
+
+    @param sequencias Sequência ou lista de sequências (strings ou ADNCompacto).
+    @param k Comprimento dos k-meros (1 a 32).
+    @param canonicos Se True, conta k-meros canónicos (agrupa cada k-mero com o complemento inverso).
+    @param processos Número de processos.
+    @return Tabela de contagens.
+    """
+    sequencias = [sequencias] if isinstance(sequencias, (str, ADNCompacto)) else list(sequencias)
+    if not sequencias:
+        return ContagemKmeros(k, np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64), canonicos)
+    if processos <= 1:
+        return _contar_lote(sequencias, k, canonicos)
+
+    lotes = _repartir(sequencias, k, processos)
+    with ProcessPoolExecutor(max_workers=min(processos, len(lotes))) as executor:
+        partes = list(executor.map(_contar_lote, lotes, [k] * len(lotes), [canonicos] * len(lotes)))
+    return ContagemKmeros.juntar(partes)
+
+
+def indice_posicoes(sequencia, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    @brief Constrói um índice k-mero -> posições (não canónico) em formato compacto.
+
+    @details As posições são ordenadas pelo valor do k-mero; as posições do k-mero
+             kmeros[i] são posicoes[inicios[i]:inicios[i + 1]], por ordem crescente.
+
+    @param sequencia Uma string ou ADNCompacto.
+    @param k Comprimento dos k-meros.
+    @return Tuplo (kmeros distintos, inícios de cada grupo com len(kmeros) + 1 entradas, posições).
+    """
+    posicoes, valores = kmeros_inteiros(sequencia, k)
+    ordem = np.argsort(valores, kind="stable")
+    kmeros, inicios = np.unique(valores[ordem], return_index=True)
+    return kmeros, np.append(inicios, len(ordem)), posicoes[ordem]
+
+
+def distancia_jaccard(a: ContagemKmeros, b: ContagemKmeros) -> float:
+    """
+    @brief Distância de Jaccard entre os conjuntos de k-meros de duas tabelas.
+
+    @return 1 - |A ∩ B| / |A ∪ B| (0 para conjuntos iguais, 1 para disjuntos).
+    """
+    assert a.k == b.k, "As tabelas devem usar o mesmo k"
+    comuns = len(np.intersect1d(a.kmeros, b.kmeros, assume_unique=True))
+    uniao = len(a) + len(b) - comuns
+    return 1.0 - comuns / uniao if uniao else 0.0
@@ -0,0 +1,514 @@
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+import argparse
+import json
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+## @package linha_comandos
+#  Linha de comandos para processamento em lote (`python -m aasb <subcomando> ...`).
+#  Os ficheiros FASTA/FASTQ são lidos registo a registo e agrupados em lotes, que
+#  são distribuídos por um conjunto de processos. Cada resultado é escrito numa
+#  linha JSON assim que o respetivo lote termina (a ordem de saída pode diferir da
+#  de entrada; cada linha identifica o seu registo). No fim é apresentado o débito
+#  na saída de erro. Os módulos de cada subcomando só são importados quando o
+#  subcomando é usado, e o estado pesado (índices, matrizes, referências) é criado
+#  uma vez por processo pela respetiva função de inicialização.
+
+LOTE: int = 32
+
+Trabalho = Tuple[str, object]
+
+_estado: Dict[str, object] = {}
+
+
+class Subcomando(NamedTuple):
+    """
+    @brief Funções que implementam um subcomando de lote.
+
+    @param iniciar Prepara o estado de um processo a partir dos parâmetros (ou None)
+    @param processar Recebe um lote de pares (identificador, dados) e devolve a lista de resultados
+    @param lote Número de registos por lote predefinido do subcomando
+    """
+    iniciar: Optional[Callable[[Dict[str, object]], None]]
+    processar: Callable[[List[Trabalho]], List[Dict[str, object]]]
+    lote: int = LOTE
+
+
+def _por_registo(processar: Callable[[str, object], List[Dict[str, object]]]) -> Callable:
+    """
+    @brief Adapta uma função que processa um registo a um lote de registos.
+    """
+    def processar_lote(lote: List[Trabalho]) -> List[Dict[str, object]]:
+        return [resultado for identificador, dados in lote for resultado in processar(identificador, dados)]
+
+    return processar_lote
+
+
+def _ler(caminho: str):
+    """
+    @brief Gerador de registos de um ficheiro FASTA/FASTQ ("-" lê FASTA da entrada padrão).
+    """
+    from .fasta import ler_fasta, ler_sequencias
+
+    return ler_fasta("/dev/stdin") if caminho == "-" else ler_sequencias(caminho)
+
+
+def _registos(caminhos: List[str]) -> Iterator[Trabalho]:
+    """
+    @brief Um trabalho por registo: (identificador, sequência).
+    """
+    for caminho in caminhos:
+        for registo in _ler(caminho):
+            yield registo.identificador, registo.sequencia
+
+
+def _ficheiros(caminhos: List[str]) -> Iterator[Trabalho]:
+    """
+    @brief Um trabalho por ficheiro: (caminho, lista de (identificador, sequência)).
+    """
+    for caminho in caminhos:
+        yield caminho, [(r.identificador, r.sequencia) for r in _ler(caminho)]
+
+
+def _tamanho(dados: object) -> int:
+    """
+    @brief Número de resíduos de um trabalho.
+    """
+    return len(dados) if isinstance(dados, str) else sum(len(s) for _, s in dados)
+
+
+def _traduzir(identificador: str, sequencia: str) -> List[Dict[str, object]]:
+    from .sequencias import dna_para_proteina, traduzir_seis_quadros
+
+    if _estado["seis_quadros"]:
+        return [{"id": identificador, "quadros": traduzir_seis_quadros(sequencia, _estado["tabela"])}]
+    return [{"id": identificador, "proteina": dna_para_proteina(sequencia, _estado["tabela"])}]
+
+
+def _orfs(identificador: str, sequencia: str) -> List[Dict[str, object]]:
+    from .sequencias import encontrar_orfs
+
+    return [{"id": identificador, **orf._asdict()}
+            for orf in encontrar_orfs(sequencia, _estado["comprimento_minimo"], _estado["tabela"])]
+
+
+def _iniciar_alinhamento(parametros: Dict[str, object]) -> None:
+    _estado["referencias"] = [(r.identificador, r.sequencia) for r in _ler(parametros["referencia"])]
+
+
+def alinhar_par(seq1: str, seq2: str, metodo: str = "global", gap: Optional[int] = None,
+                igual: int = 2, diferente: int = -1):
+    """
+    @brief Alinha duas sequências com Needleman-Wunsch (Blosum62) ou Smith-Waterman (DNA).
+
+    @param metodo "global" ou "local"
+    @param gap Penalização por gap (-8 no global e -2 no local por omissão)
+    @param igual Pontuação de bases iguais (apenas local)
+    @param diferente Pontuação de bases diferentes (apenas local)
+    @return Transcricao do alinhamento (no local, a do primeiro máximo da matriz)
+    """
+    if metodo == "global":
+        from .needleman_wunsch import alinhar_transcricao
+
+        return alinhar_transcricao(seq1, seq2, -8 if gap is None else gap)
+    if metodo != "local":
+        raise ValueError(f"Método de alinhamento desconhecido: {metodo}")
+    from .smith_waterman import BASES, SW, transcricoes_SW
+
+    seq1, seq2 = seq1.upper(), seq2.upper()
+    matriz = [[igual if a == b else diferente for b in BASES] for a in BASES]
+    score, trace = SW(seq1, seq2, matriz, -2 if gap is None else gap)
+    return transcricoes_SW(seq1, seq2, score, trace)[0]
+
+
+def resultado_alinhamento(transcricao, seq1: str, seq2: str, renderizar: bool = False) -> Dict[str, object]:
+    """
+    @brief Campos de saída de um alinhamento: CIGAR, coordenadas, pontuação e, se pedido, as sequências com lacunas.
+    """
+    resultado = transcricao._asdict()
+    if renderizar:
+        resultado["alinhamento"] = list(transcricao.renderizar(seq1.upper(), seq2.upper()))
+    return resultado
+
+
+def matriz_motivo(sitios: List[str], pseudocontagem: float = 0.5):
+    """
+    @brief PSSM (log-odds contra fundo uniforme) a partir dos sítios de um motivo.
+
+    @return MatrizMotivo com a PSSM
+    """
+    from .pwm import MatrizMotivo
+
+    return MatrizMotivo.de_sequencias([s.upper() for s in sitios], pseudocontagem=pseudocontagem).normalizar().pssm()
+
+
+def _alinhar(identificador: str, sequencia: str) -> List[Dict[str, object]]:
+    resultados = []
+    for nome, referencia in _estado["referencias"]:
+        transcricao = alinhar_par(sequencia, referencia, _estado["metodo"], _estado["gap"],
+                                  _estado["igual"], _estado["diferente"])
+        resultados.append({"id": identificador, "referencia": nome,
+                           **resultado_alinhamento(transcricao, sequencia, referencia, _estado["renderizar"])})
+    return resultados
+
+
+def _msa(caminho: str, registos: List[Tuple[str, str]]) -> List[Dict[str, object]]:
+    sequencias = [s for _, s in registos]
+    if _estado.get("arvore"):
+        from .alinhamento_arvore import alinhamento_progressivo_arvore as alinhador
+    else:
+        from .alinhamento_progressivo import alinhamento_progressivo as alinhador
+
+    if not registos:
+        alinhadas = []
+    elif _estado.get("ancoras"):
+        from .ancoras import alinhamento_ancorado
+
+        alinhadas = alinhamento_ancorado(sequencias, _estado["ancoras"], alinhador=alinhador)
+    else:
+        alinhadas = alinhador(sequencias)
+    return [{"ficheiro": caminho,
+             "alinhamento": [{"id": i, "sequencia": s} for (i, _), s in zip(registos, alinhadas)]}]
+
+
+def _arvore(caminho: str, registos: List[Tuple[str, str]]) -> List[Dict[str, object]]:
+    from .arvore_filogenetica import construir_arvore
+
+    nomes = {}
+    for identificador, sequencia in registos:
+        nomes.setdefault(sequencia, []).append(identificador)
+    arvore = construir_arvore(list(nomes)) if registos else ""
+    arvore = re.sub(r"[^(),]+", lambda m: "|".join(nomes[m.group(0)]), arvore)    #sequências -> identificadores
+    return [{"ficheiro": caminho, "arvore": arvore}]
+
+
+def _iniciar_pesquisa_motivo(parametros: Dict[str, object]) -> None:
+    with open(parametros["motivo"]) as ficheiro:
+        primeiro = ficheiro.read(1)
+    if primeiro == ">":
+        sitios = [r.sequencia for r in _ler(parametros["motivo"])]
+    else:
+        with open(parametros["motivo"]) as ficheiro:
+            sitios = [linha.strip() for linha in ficheiro if linha.strip()]
+    _estado["pssm"] = pssm = matriz_motivo(sitios, parametros["pseudocontagem"])
+    _estado["limiar"] = parametros["limiar"] if parametros["limiar"] is not None \
+        else pssm.limiar_pvalor(parametros["pvalor"])
+
+
+def _pesquisar_motivo(identificador: str, sequencia: str) -> List[Dict[str, object]]:
+    if _estado["antecipar"]:
+        ocorrencias, _ = _estado["pssm"].procurar_antecipando(sequencia, _estado["limiar"], _estado["ambas_cadeias"])
+    else:
+        ocorrencias = _estado["pssm"].procurar(sequencia, _estado["limiar"], ambas_cadeias=_estado["ambas_cadeias"])
+    return [{"id": identificador, "posicao": o.posicao, "cadeia": o.cadeia, "pontuacao": o.pontuacao}
+            for o in ocorrencias]
+
+
+def _iniciar_pesquisa(parametros: Dict[str, object]) -> None:
+    from .indice_sufixos import IndiceSufixos
+
+    _estado["indice"] = IndiceSufixos.carregar(parametros["indice"])
+
+
+def _pesquisar(identificador: str, sequencia: str) -> List[Dict[str, object]]:
+    from .blast import hits_mem
+
+    indice = _estado["indice"]
+    resultados = []
+    for pos_query, pos_ref, comprimento in hits_mem(sequencia, indice, _estado["minimo"]):
+        nome, posicao = indice.coordenadas(pos_ref)
+        resultados.append({"id": identificador, "referencia": nome, "pos_query": pos_query,
+                           "pos_ref": posicao, "comprimento": comprimento})
+    return resultados
+
+
+def _iniciar_mapeamento(parametros: Dict[str, object]) -> None:
+    from .mapeamento import Mapeador
+
+    _estado["mapeador"] = Mapeador.de_fasta(parametros["referencia"], k=parametros["k"], banda=parametros["banda"])
+
+
+def _mapear(lote: List[Trabalho]) -> List[Dict[str, object]]:
+    resultados = []
+    for mapeamento in _estado["mapeador"].mapear(lote, _estado["distancia_maxima"]):
+        if mapeamento is not None:
+            resultados.append({"id": mapeamento.leitura, "referencia": mapeamento.referencia,
+                               "posicao": mapeamento.posicao, "cadeia": mapeamento.cadeia,
+                               "distancia": mapeamento.distancia, "votos": mapeamento.votos,
+                               "cigar": mapeamento.transcricao.cigar})
+    return resultados
+
+
+SUBCOMANDOS: Dict[str, Subcomando] = {
+    "translate": Subcomando(None, _por_registo(_traduzir)),
+    "orfs": Subcomando(None, _por_registo(_orfs)),
+    "align": Subcomando(_iniciar_alinhamento, _por_registo(_alinhar)),
+    "msa": Subcomando(None, _por_registo(_msa)),
+    "tree": Subcomando(None, _por_registo(_arvore)),
+    "scan": Subcomando(_iniciar_pesquisa_motivo, _por_registo(_pesquisar_motivo)),
+    "search": Subcomando(_iniciar_pesquisa, _por_registo(_pesquisar)),
+    "map": Subcomando(_iniciar_mapeamento, _mapear, 2048),                  #vetorizado sobre o lote inteiro
+}
+
+
+def _inicializar(comando: str, parametros: Dict[str, object]) -> None:
+    """
+    @brief Prepara o estado de um processo para um subcomando.
+    """
+    _estado.clear()
+    _estado.update(parametros)
+    if SUBCOMANDOS[comando].iniciar is not None:
+        SUBCOMANDOS[comando].iniciar(parametros)
+
+
+def _processar_lote(comando: str, lote: List[Trabalho]) -> List[Dict[str, object]]:
+    """
+    @brief Processa um lote de trabalhos (executado nos processos de trabalho).
+    """
+    return SUBCOMANDOS[comando].processar(lote)
+
+
+def executar(comando: str, parametros: Dict[str, object], trabalhos: Iterable[Trabalho],
+             saida: TextIO, processos: int = 1, lote: int = LOTE) -> Dict[str, float]:
+    """
+    @brief Executa um subcomando sobre todos os trabalhos e escreve os resultados em JSON Lines.
+
+    @details Os trabalhos são agrupados em lotes para reduzir a comunicação entre
+             processos. Com vários processos, são mantidos no máximo 2 lotes por
+             processo em curso, pelo que a memória não depende do tamanho da entrada.
+
+    @param comando Nome do subcomando (ver SUBCOMANDOS).
+    @param parametros Parâmetros do subcomando (têm de ser serializáveis com pickle).
+    @param trabalhos Pares (identificador, dados).
+    @param saida Ficheiro de texto onde escrever os resultados.
+    @param processos Número de processos (1 executa no processo atual).
+    @param lote Número de trabalhos por lote.
+    @return Débito: registos, resíduos, resultados, tempo e taxas por segundo.
+    """
+    inicio = time.perf_counter()
+    contagens = {"registos": 0, "residuos": 0, "resultados": 0}
+
+    def lotes() -> Iterator[List[Trabalho]]:
+        atual = []
+        for trabalho in trabalhos:
+            contagens["registos"] += 1
+            contagens["residuos"] += _tamanho(trabalho[1])
+            atual.append(trabalho)
+            if len(atual) == lote:
+                yield atual
+                atual = []
+        if atual:
+            yield atual
+
+    def escrever(resultados: List[Dict[str, object]]) -> None:
+        for resultado in resultados:
+            saida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+        saida.flush()
+        contagens["resultados"] += len(resultados)
+
+    if processos <= 1:
+        _inicializar(comando, parametros)
+        for atual in lotes():
+            escrever(_processar_lote(comando, atual))
+    else:
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        with ProcessPoolExecutor(processos, initializer=_inicializar, initargs=(comando, parametros)) as executor:
+            pendentes = set()
+            for atual in lotes():
+                if len(pendentes) >= 2 * processos:
+                    concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in concluidos:
+                        escrever(futuro.result())
+                pendentes.add(executor.submit(_processar_lote, comando, atual))
+            while pendentes:
+                concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in concluidos:
+                    escrever(futuro.result())
+
+    tempo = time.perf_counter() - inicio
+    return {**contagens, "tempo": tempo,
+            "registos_por_segundo": contagens["registos"] / tempo if tempo > 0 else 0.0,
+            "residuos_por_segundo": contagens["residuos"] / tempo if tempo > 0 else 0.0}
+
+
+def _complemento_inverso(opcoes: argparse.Namespace) -> int:
+    from .sequencias import complemento_inverso
+
+    sequencias = opcoes.sequencias or [linha.strip() for linha in sys.stdin if linha.strip()]
+    for sequencia in sequencias:
+        print(complemento_inverso(sequencia))
+    return 0
+
+
+def _parametros(opcoes: argparse.Namespace) -> Tuple[Dict[str, object], Optional[str]]:
+    """
+    @brief Converte as opções em parâmetros do subcomando.
+
+    @return Tuplo (parâmetros, pasta temporária a apagar no fim ou None).
+    """
+    comando, temporaria = opcoes.comando, None
+    if comando in ("translate", "orfs"):
+        parametros = {"tabela": opcoes.tabela}
+        if comando == "translate":
+            parametros["seis_quadros"] = opcoes.seis_quadros
+        else:
+            parametros["comprimento_minimo"] = opcoes.comprimento_minimo
+    elif comando == "align":
+        parametros = {"referencia": opcoes.referencia, "metodo": opcoes.metodo, "gap": opcoes.gap,
+                      "igual": opcoes.igual, "diferente": opcoes.diferente, "renderizar": opcoes.renderizar}
+    elif comando == "scan":
+        parametros = {"motivo": opcoes.motivo, "limiar": opcoes.limiar, "pvalor": opcoes.pvalor,
+                      "pseudocontagem": opcoes.pseudocontagem, "ambas_cadeias": not opcoes.so_direta,
+                      "antecipar": opcoes.antecipar}
+    elif comando == "search":
+        indice = opcoes.indice
+        if indice is None:
+            from .indice_sufixos import IndiceSufixos
+
+            temporaria = tempfile.mkdtemp(prefix="aasb-")                       #partilhado pelos processos via mmap
+            indice = f"{temporaria}/referencia"
+            IndiceSufixos.de_fasta(opcoes.referencia).guardar(indice)
+        parametros = {"indice": indice, "minimo": opcoes.minimo}
+    elif comando == "msa":
+        parametros = {"arvore": opcoes.arvore, "ancoras": opcoes.ancoras}
+    elif comando == "map":
+        parametros = {"referencia": opcoes.referencia, "k": opcoes.k, "banda": opcoes.banda,
+                      "distancia_maxima": opcoes.distancia_maxima}
+    else:
+        parametros = {}
+    return parametros, temporaria
+
+
+def _lote(opcoes: argparse.Namespace) -> int:
+    parametros, temporaria = _parametros(opcoes)
+    trabalhos = _ficheiros(opcoes.entradas) if opcoes.comando in ("msa", "tree") else _registos(opcoes.entradas)
+    saida = open(opcoes.saida, "w") if opcoes.saida else sys.stdout
+    try:
+        debito = executar(opcoes.comando, parametros, trabalhos, saida, opcoes.processos,
+                          opcoes.lote or SUBCOMANDOS[opcoes.comando].lote)
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+        if temporaria is not None:
+            shutil.rmtree(temporaria, ignore_errors=True)
+    if not opcoes.silencioso:
+        print(f"{debito['registos']} registos ({debito['residuos']} resíduos) -> {debito['resultados']} resultados "
+              f"em {debito['tempo']:.3f} s: {debito['registos_por_segundo']:.1f} registos/s, "
+              f"{debito['residuos_por_segundo']:.0f} resíduos/s", file=sys.stderr)
+    return 0
+
+
+def _servir(opcoes: argparse.Namespace) -> int:
+    import asyncio
+    from .servico import servir
+
+    indices = dict(indice.split("=", 1) for indice in opcoes.indice)
+    asyncio.run(servir(opcoes.socket, opcoes.porta, processos=opcoes.processos, lote=opcoes.lote,
+                       espera=opcoes.espera / 1000, indices=indices, limite=int(opcoes.limite * 2**20)))
+    return 0
+
+
+def _opcoes_lote(parser: argparse.ArgumentParser, entradas: str) -> None:
+    parser.add_argument("entradas", nargs="+", metavar="FICHEIRO", help=entradas)
+    parser.add_argument("-p", "--processos", type=int, default=1, help="número de processos (predefinido: 1)")
+    parser.add_argument("--lote", type=int, help="registos por lote (predefinido: depende do subcomando)")
+    parser.add_argument("-o", "--saida", help="ficheiro de saída JSON Lines (predefinido: saída padrão)")
+    parser.add_argument("-q", "--silencioso", action="store_true", help="não apresentar o débito no fim")
+    parser.set_defaults(funcao=_lote)
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """
+    @brief Cria o parser da linha de comandos com todos os subcomandos.
+    """
+    parser = argparse.ArgumentParser(prog="python -m aasb",
+                                     description="Algoritmos para Análise de Sequências Biológicas.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    fasta = "ficheiros FASTA/FASTQ ('-' para a entrada padrão)"
+
+    complemento = subcomandos.add_parser("complemento_inverso", help="complemento inverso de sequências de DNA")
+    complemento.add_argument("sequencias", nargs="*", help="sequências (por omissão lidas da entrada padrão)")
+    complemento.set_defaults(funcao=_complemento_inverso)
+
+    traducao = subcomandos.add_parser("translate", help="tradução de DNA em proteína")
+    _opcoes_lote(traducao, fasta)
+    traducao.add_argument("--tabela", type=int, default=1, help="código genético do NCBI (predefinido: 1)")
+    traducao.add_argument("--seis-quadros", action="store_true", help="traduzir os seis quadros de leitura")
+
+    orfs = subcomandos.add_parser("orfs", help="Open Reading Frames nas duas cadeias")
+    _opcoes_lote(orfs, fasta)
+    orfs.add_argument("--tabela", type=int, default=1, help="código genético do NCBI (predefinido: 1)")
+    orfs.add_argument("--comprimento-minimo", type=int, default=30, help="aminoácidos (predefinido: 30)")
+
+    alinhamento = subcomandos.add_parser("align", help="alinhamento de cada registo com cada referência")
+    _opcoes_lote(alinhamento, fasta)
+    alinhamento.add_argument("-r", "--referencia", required=True, help="FASTA com as sequências de referência")
+    alinhamento.add_argument("--metodo", choices=["global", "local"], default="global",
+                             help="global: Needleman-Wunsch com Blosum62; local: Smith-Waterman para DNA")
+    alinhamento.add_argument("--gap", type=int, default=None, help="penalização por gap (-8 global, -2 local)")
+    alinhamento.add_argument("--igual", type=int, default=2, help="pontuação de bases iguais (local)")
+    alinhamento.add_argument("--diferente", type=int, default=-1, help="pontuação de bases diferentes (local)")
+    alinhamento.add_argument("--renderizar", action="store_true",
+                             help="incluir as sequências com lacunas além do CIGAR")
+
+    msa = subcomandos.add_parser("msa", help="alinhamento múltiplo progressivo (um por ficheiro)")
+    _opcoes_lote(msa, "ficheiros FASTA, cada um alinhado em conjunto")
+    msa.add_argument("--arvore", action="store_true",
+                     help="fundir perfis ao longo de uma árvore guia (UPGMA de k-meros) em vez de por ordem")
+    msa.add_argument("--ancoras", type=int, metavar="K",
+                     help="cortar as sequências em âncoras exatas de pelo menos K resíduos e alinhar os segmentos")
+
+    arvore = subcomandos.add_parser("tree", help="árvore filogenética (uma por ficheiro)")
+    _opcoes_lote(arvore, "ficheiros FASTA, cada um com as sequências de uma árvore")
+
+    motivo = subcomandos.add_parser("scan", help="pesquisa de um motivo (PSSM) nas duas cadeias")
+    _opcoes_lote(motivo, fasta)
+    motivo.add_argument("-m", "--motivo", required=True, help="sítios do motivo (FASTA ou um por linha)")
+    criterio = motivo.add_mutually_exclusive_group()
+    criterio.add_argument("--limiar", type=float, help="pontuação mínima")
+    criterio.add_argument("--pvalor", type=float, default=1e-4, help="P-valor máximo (predefinido: %(default)s)")
+    motivo.add_argument("--pseudocontagem", type=float, default=0.5)
+    motivo.add_argument("--so-direta", action="store_true", help="pesquisar apenas a cadeia direta")
+    motivo.add_argument("--antecipar", action="store_true",
+                        help="abandonar cada janela assim que já não pode atingir o limiar")
+
+    pesquisa = subcomandos.add_parser("search", help="correspondências exatas maximais contra uma referência")
+    _opcoes_lote(pesquisa, fasta)
+    referencia = pesquisa.add_mutually_exclusive_group(required=True)
+    referencia.add_argument("-r", "--referencia", help="FASTA da referência (indexado antes da pesquisa)")
+    referencia.add_argument("-i", "--indice", help="prefixo de um índice guardado com IndiceSufixos.guardar")
+    pesquisa.add_argument("--minimo", type=int, default=20, help="comprimento mínimo (predefinido: 20)")
+
+    mapeamento = subcomandos.add_parser("map", help="mapeamento de leituras curtas (melhor posição por leitura)")
+    _opcoes_lote(mapeamento, fasta)
+    mapeamento.add_argument("-r", "--referencia", required=True, help="FASTA da referência")
+    mapeamento.add_argument("-k", type=int, default=15, help="comprimento das sementes (predefinido: %(default)s)")
+    mapeamento.add_argument("--banda", type=int, default=8, help="indels máximos em relação à diagonal (predefinido: %(default)s)")
+    mapeamento.add_argument("--distancia-maxima", type=int, help="distância de edição máxima para reportar")
+
+    servico = subcomandos.add_parser("servir", help="serviço local (JSON Lines) com micro-lotes de pedidos")
+    endereco = servico.add_mutually_exclusive_group(required=True)
+    endereco.add_argument("--socket", help="caminho do socket Unix")
+    endereco.add_argument("--porta", type=int, help="porta TCP em 127.0.0.1")
+    servico.add_argument("-p", "--processos", type=int, default=1, help="número de processos (predefinido: 1)")
+    servico.add_argument("--lote", type=int, default=16, help="pedidos por micro-lote (predefinido: %(default)s)")
+    servico.add_argument("--espera", type=float, default=2.0,
+                         help="espera máxima por pedidos para completar um lote, em ms (predefinido: %(default)s)")
+    servico.add_argument("--limite", type=float, default=64,
+                         help="tamanho máximo de uma linha de pedido, em MiB (predefinido: %(default)s)")
+    servico.add_argument("--indice", action="append", default=[], metavar="NOME=PREFIXO",
+                         help="índice de sufixos disponível para pedidos search (repetível)")
+    servico.set_defaults(funcao=_servir)
+    return parser
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """
+    @brief Ponto de entrada da linha de comandos.
+    """
+    opcoes = criar_parser().parse_args(argumentos)
+    return opcoes.funcao(opcoes)
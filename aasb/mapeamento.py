@@ -0,0 +1,299 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .kmeros import indice_posicoes, kmeros_inteiros
+from .sequencias import codigos_bases
+from .transcricao import Transcricao
+
+## @package mapeamento
+#  Mapeamento de leituras curtas contra uma referência.
+#  A referência é indexada uma vez (k-mero -> posições). Os k-meros de cada leitura,
+#  nas duas cadeias, votam na diagonal (posição na referência - posição na leitura)
+#  onde ocorrem; as diagonais mais votadas são candidatas e cada candidata é
+#  verificada com um alinhamento semi-global em banda (distância de edição, lacunas
+#  nas pontas da referência sem custo). A verificação é vetorizada sobre um lote de
+#  candidatas com o mesmo comprimento de leitura: cada linha da programação dinâmica
+#  é calculada para todas de uma vez, e o movimento horizontal é resolvido com um
+#  mínimo acumulado. Só a melhor candidata de cada leitura faz traceback.
+
+K: int = 15
+BANDA: int = 8
+CANDIDATOS: int = 3
+LOTE: int = 4096
+
+_INFINITO = np.int32(1 << 28)
+_DESCONHECIDA_LEITURA = 5                  #nunca igual a uma base da referência (0-4)
+_ADN = np.frombuffer(b"ACGTN", dtype=np.uint8)
+
+Leitura = Union[str, Tuple[str, str]]
+
+
+class Mapeamento(NamedTuple):
+    """
+    @brief Melhor posição de uma leitura na referência.
+
+    @param leitura Identificador da leitura (índice na lista se não tiver nome)
+    @param referencia Nome da sequência de referência
+    @param posicao Início do alinhamento na referência (0-based, cadeia direta)
+    @param cadeia "+" ou "-" (a leitura alinha pelo complemento inverso)
+    @param distancia Distância de edição do alinhamento
+    @param votos Número de k-meros que votaram na diagonal escolhida
+    @param transcricao Transcricao (leitura na cadeia indicada vs referência; pontuação = -distância)
+    """
+    leitura: Union[str, int]
+    referencia: str
+    posicao: int
+    cadeia: str
+    distancia: int
+    votos: int
+    transcricao: Transcricao
+
+
+def _codigos_leitura(sequencia: str) -> np.ndarray:
+    codigos = codigos_bases(sequencia).astype(np.uint8)
+    codigos[codigos == 4] = _DESCONHECIDA_LEITURA
+    return codigos
+
+
+def _complemento_inverso_codigos(codigos: np.ndarray) -> np.ndarray:
+    inverso = codigos[::-1].copy()
+    bases = inverso < 4
+    inverso[bases] = 3 - inverso[bases]
+    return inverso
+
+
+def alinhar_em_banda(leituras: np.ndarray, janelas: np.ndarray, banda: int,
+                     inicio_valido: np.ndarray, fim_valido: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    @brief Alinhamento semi-global em banda de um lote de leituras do mesmo comprimento.
+
+    @details A célula (i, k) corresponde a alinhar os primeiros i carateres da leitura terminando
+             na posição i + k da janela, k = 0..2*banda. Na linha 0 todas as células válidas valem 0
+             (início livre na referência) e o resultado é o mínimo da última linha (fim livre).
+             As direções são guardadas numa matriz de bytes: 0 (igual), 1 (substituição),
+             2 (inserção na leitura), mais 4 se a célula vier da esquerda (deleção).
+
+    @param leituras Códigos das leituras, forma (B, m)
+    @param janelas Códigos da referência, forma (B, m + 2*banda)
+    @param banda Desvio máximo, em cada sentido, da diagonal da candidata
+    @param inicio_valido Menor k em que o alinhamento pode começar (antes disso está fora da referência)
+    @param fim_valido Maior posição final (i + k) dentro da referência
+    @return Tuplo (distâncias (B,), k final (B,), direções (B, m, 2*banda+1))
+    """
+    B, m = leituras.shape
+    largura = 2 * banda + 1
+    ks = np.arange(largura, dtype=np.int32)
+    fora = ks[None, :] > (fim_valido[:, None])
+    H = np.where((ks[None, :] >= inicio_valido[:, None]) & ~fora, 0, _INFINITO).astype(np.int32)
+    direcoes = np.empty((B, m, largura), dtype=np.uint8)
+    cima = np.full((B, largura), _INFINITO, dtype=np.int32)
+    for i in range(1, m + 1):
+        diferente = leituras[:, i - 1, None] != janelas[:, i - 1:i - 1 + largura]
+        diagonal = H + diferente
+        cima[:, :-1] = H[:, 1:] + 1
+        V = np.minimum(diagonal, cima)
+        codigo = np.where(diagonal <= cima, diferente, np.uint8(2)).astype(np.uint8)
+        novo = np.minimum.accumulate(V - ks, axis=1) + ks                    #horizontal: min_t V[t] + (k - t)
+        codigo |= (novo < V).astype(np.uint8) << 2
+        novo[ks[None, :] + i > fim_valido[:, None]] = _INFINITO
+        direcoes[:, i - 1] = codigo
+        H = novo
+    finais = np.argmin(H, axis=1)
+    return H[np.arange(B), finais], finais, direcoes
+
+
+def _traceback(direcoes: bytes, largura: int, m: int, k: int) -> Tuple[List[Tuple[str, int]], int]:
+    """
+    @brief Corridas de operações do alinhamento em banda (pela ordem do alinhamento) e k na linha 0.
+
+    @param direcoes Direções de uma candidata, (m, largura) contíguas
+    """
+    corridas: List[Tuple[str, int]] = []
+    anterior, n, i = "", 0, m
+    while i > 0:
+        codigo = direcoes[(i - 1) * largura + k]
+        if codigo & 4:
+            operacao = "D"
+            k -= 1
+        elif codigo == 2:
+            operacao = "I"
+            i -= 1
+            k += 1
+        else:
+            operacao = "X" if codigo else "="
+            i -= 1
+        if operacao == anterior:
+            n += 1
+        else:
+            if n:
+                corridas.append((anterior, n))
+            anterior, n = operacao, 1
+    if n:
+        corridas.append((anterior, n))
+    corridas.reverse()
+    return corridas, k
+
+
+class Mapeador:
+    """
+    @brief Índice de k-meros de uma ou mais referências para mapear leituras curtas.
+    """
+
+    def __init__(self, referencias: Union[str, Dict[str, str], Iterable[Tuple[str, str]]], k: int = K,
+                 banda: int = BANDA, candidatos: int = CANDIDATOS, min_votos: int = 2,
+                 max_ocorrencias: int = 64):
+        """
+        @param referencias Sequência, dicionário nome -> sequência ou pares (nome, sequência)
+        @param k Comprimento dos k-meros usados como sementes (até 32)
+        @param banda Desvio máximo (indels acumulados) em relação à diagonal candidata
+        @param candidatos Número máximo de diagonais verificadas por leitura
+        @param min_votos Número mínimo de k-meros numa diagonal para ser candidata
+        @param max_ocorrencias K-meros com mais ocorrências na referência são ignorados
+        """
+        if isinstance(referencias, str):
+            referencias = {"referencia": referencias}
+        pares = list(referencias.items() if isinstance(referencias, dict) else referencias)
+        self.k, self.banda, self.candidatos = k, banda, candidatos
+        self.min_votos, self.max_ocorrencias = min_votos, max_ocorrencias
+        self.nomes = [nome for nome, _ in pares]
+        texto = "N".join(seq for _, seq in pares)          #N separa referências: nenhum k-mero as atravessa
+        comprimentos = np.array([len(seq) for _, seq in pares], dtype=np.int64)
+        self.inicios = np.concatenate([[0], np.cumsum(comprimentos + 1)[:-1]])
+        self.fins = self.inicios + comprimentos
+        self.codigos = codigos_bases(texto).astype(np.uint8)
+        self.kmeros, self._grupos, self.posicoes = indice_posicoes(texto, k)
+
+    @classmethod
+    def de_fasta(cls, caminho: str, **opcoes) -> "Mapeador":
+        """
+        @brief Indexa todas as sequências de um ficheiro FASTA.
+        """
+        from .fasta import ler_sequencias
+
+        return cls([(r.identificador, r.sequencia) for r in ler_sequencias(caminho)], **opcoes)
+
+    def _sementes(self, leituras: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        @brief Votação por diagonal das sementes de todas as leituras (e complementos inversos).
+
+        @return Tuplo (índice de consulta, diagonal central, votos) das candidatas selecionadas;
+                a consulta 2*r é a leitura r e 2*r+1 o seu complemento inverso.
+        """
+        consultas = [c for codigos in leituras for c in (codigos, _complemento_inverso_codigos(codigos))]
+        comprimentos = np.array([len(c) + 1 for c in consultas], dtype=np.int64)
+        inicios = np.concatenate([[0], np.cumsum(comprimentos)[:-1]])
+        texto = np.full(int(comprimentos.sum()), 4, dtype=np.uint8)
+        for inicio, c in zip(inicios, consultas):
+            texto[inicio:inicio + len(c)] = np.minimum(c, 4)
+        posicoes, valores = kmeros_inteiros(_ADN[texto].tobytes().decode("ascii"), self.k)
+        if len(valores) == 0 or len(self.kmeros) == 0:
+            return (np.empty(0, dtype=np.int64),) * 3
+
+        indices = np.minimum(np.searchsorted(self.kmeros, valores), len(self.kmeros) - 1)
+        contagens = np.where(self.kmeros[indices] == valores,
+                             self._grupos[indices + 1] - self._grupos[indices], 0)
+        usar = (contagens > 0) & (contagens <= self.max_ocorrencias)
+        if not usar.any():
+            return (np.empty(0, dtype=np.int64),) * 3
+        posicoes, indices, contagens = posicoes[usar], indices[usar], contagens[usar]
+        consulta = np.searchsorted(inicios, posicoes, side="right") - 1
+        locais = posicoes - inicios[consulta]
+
+        total = int(contagens.sum())                                    #expande cada semente nas suas ocorrências
+        desvios = np.arange(total) - np.repeat(np.cumsum(contagens) - contagens, contagens)
+        ocorrencias = self.posicoes[np.repeat(self._grupos[indices], contagens) + desvios]
+        consulta, diagonais = np.repeat(consulta, contagens), ocorrencias - np.repeat(locais, contagens)
+
+        caixas = np.floor_divide(diagonais, max(self.banda, 1))
+        caixas -= caixas.min()
+        chaves, inversos, votos = np.unique(consulta * (int(caixas.max()) + 1) + caixas,
+                                            return_inverse=True, return_counts=True)
+        centros = np.rint(np.bincount(inversos, weights=diagonais) / votos).astype(np.int64)
+        consulta = chaves // (int(caixas.max()) + 1)
+
+        leitura = consulta // 2
+        ordem = np.lexsort((-votos, leitura))
+        leitura, votos, consulta, centros = leitura[ordem], votos[ordem], consulta[ordem], centros[ordem]
+        primeiro = np.searchsorted(leitura, leitura)
+        manter = (np.arange(len(leitura)) - primeiro < self.candidatos) & (votos >= self.min_votos)
+        return consulta[manter], centros[manter], votos[manter]
+
+    def mapear(self, leituras: Iterable[Leitura], distancia_maxima: Optional[int] = None,
+               lote: int = LOTE) -> List[Optional[Mapeamento]]:
+        """
+        @brief Mapeia leituras e devolve a melhor posição de cada uma (ou None se não mapear).
+
+        @param leituras Sequências ou pares (identificador, sequência)
+        @param distancia_maxima Distância de edição máxima aceite (sem limite por omissão)
+        @param lote Número máximo de candidatas alinhadas em simultâneo (limita a memória)
+        @return Lista com um Mapeamento ou None por leitura, pela ordem de entrada
+        """
+        pares = [(i, l) if isinstance(l, str) else l for i, l in enumerate(leituras)]
+        codigos = [_codigos_leitura(seq) for _, seq in pares]
+        consultas, centros, votos = self._sementes(codigos)
+
+        n = len(pares)
+        melhor_distancia = np.full(n, _INFINITO, dtype=np.int64)
+        melhor_votos = np.zeros(n, dtype=np.int64)
+        melhores: Dict[int, Tuple[int, int, bytes]] = {}                    #leitura -> (candidata, k final, direções)
+        inicios_janela = centros - self.banda
+        comprimentos = np.array([len(codigos[c // 2]) for c in consultas], dtype=np.int64)
+        largura = 2 * self.banda + 1
+        for m in np.unique(comprimentos):
+            grupo = np.flatnonzero(comprimentos == m)
+            for bloco in range(0, len(grupo), lote):
+                selecao = grupo[bloco:bloco + lote]
+                distancias, finais, direcoes = self._verificar(int(m), consultas[selecao],
+                                                               inicios_janela[selecao], codigos)
+                leituras_bloco = consultas[selecao] // 2
+                ordem = np.lexsort((-votos[selecao], distancias, leituras_bloco))   #melhor de cada leitura no bloco
+                primeiras = ordem[np.r_[True, np.diff(leituras_bloco[ordem]) != 0]]
+                leitura = leituras_bloco[primeiras]
+                melhora = (distancias[primeiras] < melhor_distancia[leitura]) | \
+                          ((distancias[primeiras] == melhor_distancia[leitura]) &
+                           (votos[selecao][primeiras] > melhor_votos[leitura]))
+                for j in primeiras[melhora].tolist():
+                    melhores[int(leituras_bloco[j])] = (int(selecao[j]), int(finais[j]), direcoes[j].tobytes())
+                melhor_distancia[leitura[melhora]] = distancias[primeiras][melhora]
+                melhor_votos[leitura[melhora]] = votos[selecao][primeiras][melhora]
+
+        resultados: List[Optional[Mapeamento]] = [None] * n
+        aceites = [l for l in melhores if melhor_distancia[l] < _INFINITO and
+                   (distancia_maxima is None or melhor_distancia[l] <= distancia_maxima)]
+        tracebacks = [_traceback(melhores[l][2], largura, len(codigos[l]), melhores[l][1]) for l in aceites]
+        inicios = np.array([inicios_janela[melhores[l][0]] + k for l, (_, k) in zip(aceites, tracebacks)],
+                           dtype=np.int64)
+        referencias = np.searchsorted(self.inicios, inicios, side="right") - 1
+        locais = (inicios - self.inicios[referencias]).tolist()
+        for l, (corridas, _), referencia, local in zip(aceites, tracebacks, referencias.tolist(), locais):
+            distancia, candidata = int(melhor_distancia[l]), melhores[l][0]
+            transcricao = Transcricao.de_corridas(corridas, 0, local, -distancia)
+            resultados[l] = Mapeamento(pares[l][0], self.nomes[referencia], local,
+                                       "-" if consultas[candidata] % 2 else "+", distancia,
+                                       int(votos[candidata]), transcricao)
+        return resultados
+
+    def _verificar(self, m: int, consultas: np.ndarray, inicios_janela: np.ndarray,
+                   codigos: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        @brief Extrai as janelas da referência e alinha em banda um bloco de candidatas de comprimento m.
+        """
+        banda = self.banda
+        leituras = np.stack([codigos[c // 2] if c % 2 == 0 else _complemento_inverso_codigos(codigos[c // 2])
+                             for c in consultas])
+        meio = np.clip(inicios_janela + banda + m // 2, 0, len(self.codigos) - 1)
+        referencia = np.searchsorted(self.inicios, meio, side="right") - 1
+        inicio_valido = np.maximum(self.inicios[referencia] - inicios_janela, 0)
+        fim_valido = self.fins[referencia] - inicios_janela
+        posicoes = inicios_janela[:, None] + np.arange(m + 2 * banda)
+        dentro = (posicoes >= 0) & (posicoes < len(self.codigos))
+        janelas = np.where(dentro, self.codigos[np.clip(posicoes, 0, len(self.codigos) - 1)], np.uint8(4))
+        return alinhar_em_banda(leituras, janelas, banda, inicio_valido, fim_valido)
+
+    def mapear_leitura(self, sequencia: str, distancia_maxima: Optional[int] = None) -> Optional[Mapeamento]:
+        """
+        @brief Mapeia uma única leitura.
+        """
+        return self.mapear([sequencia], distancia_maxima)[0]
+
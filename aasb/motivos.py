@@ -0,0 +1,206 @@
+from typing import List, Dict, Optional, NamedTuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .pwm import AnalisadorSequencias, MatrizMotivo, codificar
+
+## @package motivos
+#  Descoberta de motivos de novo por amostragem de Gibbs.
+#  O modelo do motivo é a tabela de contagens/PWM/PSSM de AnalisadorSequencias,
+#  mantida como MatrizMotivo e atualizada incrementalmente a cada sítio alterado.
+
+
+class MotivoDescoberto(NamedTuple):
+    """
+    @brief Resultado de uma execução de descoberta de motivos.
+
+    @param posicoes Posição do sítio escolhido em cada sequência
+    @param sitios Subsequências correspondentes às posições
+    @param pwm Position Weight Matrix dos sítios (ver AnalisadorSequencias.pwm)
+    @param pontuacao Soma das pontuações log-odds dos sítios sob a sua própria PSSM
+    """
+    posicoes: List[int]
+    sitios: List[str]
+    pwm: List[Dict[str, float]]
+    pontuacao: float
+
+
+class AmostradorGibbs:
+    """
+    @brief Amostrador de Gibbs para encontrar um motivo de comprimento fixo (um sítio por sequência).
+
+    @details Em cada iteração, cada sequência é retirada do modelo (subtraindo as
+             contagens do seu sítio), todas as janelas dessa sequência são pontuadas
+             com a PSSM das restantes e é sorteada uma nova posição com probabilidade
+             proporcional à razão de verosimilhanças. As contagens do novo sítio são
+             então somadas, sem recalcular a tabela completa.
+    """
+
+    def __init__(self, sequencias: List[str], comprimento: int,
+                 alfabeto: str = AnalisadorSequencias.ALFABETO_ADN,
+                 pseudocontagem: float = 0.5, semente: Optional[int] = None):
+        """
+        @brief Prepara o amostrador e sorteia as posições iniciais.
+
+        @param sequencias Sequências onde procurar o motivo
+        @param comprimento Comprimento do motivo
+        @param alfabeto Conjunto de caracteres permitidos
+        @param pseudocontagem Pseudocontagem usada na PWM
+        @param semente Semente do gerador aleatório
+
+        @throws AssertionError se houver menos de duas sequências ou alguma for mais curta que o motivo
+        """
+        assert len(sequencias) >= 2, "São necessárias pelo menos duas sequências!"
+        assert all(len(s) >= comprimento for s in sequencias), \
+            "As sequências devem ser pelo menos tão longas como o motivo!"
+        self.sequencias = [s.upper() for s in sequencias]
+        self.comprimento = comprimento
+        self.alfabeto = alfabeto
+        self.pseudocontagem = pseudocontagem
+        self.aleatorio = np.random.default_rng(semente)
+
+        self.codigos = [codificar(s, alfabeto) for s in self.sequencias]
+        A = len(alfabeto)
+        todos = np.concatenate(self.codigos)
+        fundo = np.bincount(todos, minlength=A + 1)[:A] + pseudocontagem
+        self.fundo = fundo / fundo.sum()
+
+        self.posicoes = [int(self.aleatorio.integers(len(s) - comprimento + 1)) for s in self.sequencias]
+        self.contagens = MatrizMotivo.de_sequencias(self.sitios(), alfabeto).valores
+        self._colunas = np.arange(comprimento)
+
+    def sitios(self) -> List[str]:
+        """
+        @brief Devolve as subsequências nas posições atuais.
+        """
+        L = self.comprimento
+        return [s[p:p + L] for s, p in zip(self.sequencias, self.posicoes)]
+
+    def _atualizar(self, i: int, sinal: int):
+        """
+        @brief Soma (sinal = 1) ou subtrai (sinal = -1) as contagens do sítio da sequência i.
+        """
+        p = self.posicoes[i]
+        sitio = self.codigos[i][p:p + self.comprimento]
+        validos = sitio < len(self.alfabeto)
+        np.add.at(self.contagens, (self._colunas[validos], sitio[validos]), sinal)
+
+    def _pssm(self, contagens: np.ndarray, total: int) -> MatrizMotivo:
+        """
+        @brief Calcula a PSSM (log2) a partir de uma tabela de contagens com `total` sítios.
+        """
+        A = len(self.alfabeto)
+        pwm = (contagens + self.pseudocontagem) / (total + A * self.pseudocontagem)
+        return MatrizMotivo(np.log2(pwm / self.fundo), self.alfabeto)
+
+    def pontuacao(self) -> float:
+        """
+        @brief Soma das pontuações log-odds dos sítios atuais sob a PSSM de todos os sítios.
+        """
+        pssm = self._pssm(self.contagens, len(self.sequencias))
+        tabela = np.hstack([pssm.valores, np.full((self.comprimento, 1), -np.inf)])
+        sitios = np.stack([c[p:p + self.comprimento] for c, p in zip(self.codigos, self.posicoes)])
+        return float(tabela[self._colunas, sitios].sum())
+
+    def iterar(self):
+        """
+        @brief Executa uma passagem de amostragem por todas as sequências, em ordem aleatória.
+        """
+        N = len(self.sequencias)
+        for i in self.aleatorio.permutation(N):
+            self._atualizar(i, -1)
+            pontuacoes = self._pssm(self.contagens, N - 1).pontuar(self.codigos[i])
+            pesos = np.exp2(pontuacoes - pontuacoes.max()) if np.isfinite(pontuacoes.max()) \
+                else np.ones(len(pontuacoes))
+            pesos[~np.isfinite(pesos)] = 0
+            self.posicoes[i] = int(self.aleatorio.choice(len(pesos), p=pesos / pesos.sum()))
+            self._atualizar(i, 1)
+
+    def deslocar_fase(self, maximo: Optional[int] = None):
+        """
+        @brief Testa deslocar todos os sítios em bloco e mantém o melhor deslocamento.
+
+        @details Evita que o amostrador fique preso numa versão desfasada do motivo
+                 (por exemplo, o motivo verdadeiro deslocado uma posição).
+
+        @param maximo Deslocamento máximo em cada sentido (metade do motivo por omissão)
+        """
+        if maximo is None:
+            maximo = self.comprimento // 2
+        originais = list(self.posicoes)
+        melhor, melhor_pontuacao = originais, self.pontuacao()
+        for d in range(-maximo, maximo + 1):
+            deslocadas = [p + d for p in originais]
+            if d == 0 or not all(0 <= p <= len(s) - self.comprimento
+                                 for p, s in zip(deslocadas, self.sequencias)):
+                continue
+            self.posicoes = deslocadas
+            self.contagens = MatrizMotivo.de_sequencias(self.sitios(), self.alfabeto).valores
+            pontuacao = self.pontuacao()
+            if pontuacao > melhor_pontuacao:
+                melhor, melhor_pontuacao = deslocadas, pontuacao
+        self.posicoes = melhor
+        self.contagens = MatrizMotivo.de_sequencias(self.sitios(), self.alfabeto).valores
+
+    def executar(self, iteracoes: int = 200) -> MotivoDescoberto:
+        """
+        @brief Executa o amostrador e devolve a melhor configuração encontrada.
+
+        @param iteracoes Número de passagens por todas as sequências
+
+        @return MotivoDescoberto com a configuração de maior pontuação
+        """
+        melhor_pontuacao = self.pontuacao()
+        melhores_posicoes = list(self.posicoes)
+        for _ in range(iteracoes):
+            self.iterar()
+            self.deslocar_fase()
+            atual = self.pontuacao()
+            if atual > melhor_pontuacao:
+                melhor_pontuacao, melhores_posicoes = atual, list(self.posicoes)
+
+        self.posicoes = melhores_posicoes
+        self.contagens = MatrizMotivo.de_sequencias(self.sitios(), self.alfabeto).valores
+        sitios = self.sitios()
+        tipo = "ADN" if self.alfabeto == AnalisadorSequencias.ALFABETO_ADN else "PROTEINA"
+        return MotivoDescoberto(melhores_posicoes, sitios,
+                                AnalisadorSequencias.pwm(sitios, tipo, self.pseudocontagem),
+                                melhor_pontuacao)
+
+
+def _executar_reinicio(sequencias: List[str], comprimento: int, alfabeto: str,
+                       pseudocontagem: float, iteracoes: int, semente: int) -> MotivoDescoberto:
+    """
+    @brief Executa um reinício independente do amostrador (usado pelos processos de trabalho).
+    """
+    amostrador = AmostradorGibbs(sequencias, comprimento, alfabeto, pseudocontagem, semente)
+    return amostrador.executar(iteracoes)
+
+
+def descobrir_motivo(sequencias: List[str], comprimento: int,
+                     alfabeto: str = AnalisadorSequencias.ALFABETO_ADN,
+                     reinicios: int = 8, iteracoes: int = 200, pseudocontagem: float = 0.5,
+                     processos: Optional[int] = None, semente: int = 0) -> MotivoDescoberto:
+    """
+    @brief Descobre um motivo de novo com vários reinícios aleatórios do amostrador de Gibbs.
+
+    @param sequencias Sequências onde procurar o motivo
+    @param comprimento Comprimento do motivo
+    @param alfabeto Conjunto de caracteres permitidos
+    @param reinicios Número de reinícios independentes
+    @param iteracoes Número de passagens por reinício
+    @param pseudocontagem Pseudocontagem usada na PWM
+    @param processos Número de processos (None usa todos os núcleos; 1 executa no processo atual)
+    @param semente Semente base; o reinício r usa semente + r
+
+    @return Melhor MotivoDescoberto entre todos os reinícios
+    """
+    argumentos = [(sequencias, comprimento, alfabeto, pseudocontagem, iteracoes, semente + r)
+                  for r in range(reinicios)]
+    if processos == 1 or reinicios == 1:
+        resultados = [_executar_reinicio(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = list(executor.map(_executar_reinicio, *zip(*argumentos)))
+    return max(resultados, key=lambda r: r.pontuacao)
@@ -0,0 +1,166 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .blosum import Blosum62
+
+## @package pontuacao_msa
+#  Pontuação de alinhamentos múltiplos a partir das contagens de símbolos por coluna.
+#  Com c_a o número de sequências com o símbolo a numa coluna, a soma dos pares
+#  (sum-of-pairs) da coluna é (c · M · c - Σ_a c_a M_aa) / 2, o que custa O(|Σ|²)
+#  por coluna em vez de O(k²) para k sequências. A lacuna '-' é um símbolo da
+#  matriz M: lacuna contra resíduo vale gap e lacuna contra lacuna vale 0.
+#  Quando uma linha é realinhada, só as colunas em que ela muda são atualizadas,
+#  em O(|Σ|) por coluna.
+
+Matriz = Dict[str, Dict[str, int]]
+
+LACUNA: str = "-"
+
+
+def matriz_identidade(alfabeto: str, igual: int = 1, diferente: int = -1) -> Matriz:
+    """
+    @brief Matriz de substituição com uma pontuação para símbolos iguais e outra para diferentes.
+
+    @details Com os valores predefinidos corresponde às pontuações de alinhamento_progressivo().
+    """
+    return {a: {b: igual if a == b else diferente for b in alfabeto} for a in alfabeto}
+
+
+class PontuacaoMSA:
+    """
+    @brief Soma dos pares, entropia e conservação por coluna de um alinhamento múltiplo.
+
+    @details Os símbolos que não estão na matriz contam como "X" quando a matriz o tem
+             (como na Blosum62); caso contrário são rejeitados.
+    """
+
+    def __init__(self, alinhamento: List[str], matriz: Optional[Matriz] = None, gap: int = -8):
+        """
+        @brief Conta os símbolos de cada coluna e calcula as pontuações de todas as colunas.
+
+        @param alinhamento Sequências alinhadas, todas com o mesmo comprimento
+        @param matriz Matriz de substituição como dicionário de dicionários (por omissão, Blosum62)
+        @param gap Pontuação de um par lacuna/resíduo (valor predefinido: -8, como em alinhar())
+
+        @exception ValueError Se o alinhamento estiver vazio, as linhas tiverem comprimentos diferentes
+                              ou houver símbolos desconhecidos
+        """
+        if not alinhamento:
+            raise ValueError("O alinhamento não pode estar vazio")
+        if len({len(linha) for linha in alinhamento}) != 1:
+            raise ValueError("Todas as linhas do alinhamento devem ter o mesmo comprimento")
+        matriz = Blosum62().tab if matriz is None else matriz
+        self.simbolos: List[str] = [s for s in matriz if s != LACUNA] + [LACUNA]
+        S = len(self.simbolos)
+        self.M = np.zeros((S, S), dtype=np.int64)
+        for i, a in enumerate(self.simbolos[:-1]):
+            for j, b in enumerate(self.simbolos[:-1]):
+                self.M[i, j] = matriz[a][b]
+        self.M[-1, :-1] = self.M[:-1, -1] = gap
+
+        self._tabela = np.full(256, -1, dtype=np.int64)
+        for i, s in enumerate(self.simbolos):
+            self._tabela[ord(s)] = i
+            if s.isalpha():
+                self._tabela[ord(s.lower())] = i
+
+        self.codigos = np.stack([self._codificar(linha) for linha in alinhamento])
+        L = self.codigos.shape[1]
+        self.contagens = np.zeros((L, S), dtype=np.int64)
+        for s in range(S):
+            self.contagens[:, s] = (self.codigos == s).sum(axis=0)
+        self._colunas = self._soma_pares(self.contagens)
+        self._total = int(self._colunas.sum())
+        self._entropias = self._entropia(self.contagens)
+
+    def _codificar(self, linha: str) -> np.ndarray:
+        codigos = self._tabela[np.frombuffer(linha.encode("latin-1"), dtype=np.uint8)]
+        if (codigos < 0).any():
+            if "X" not in self.simbolos:
+                desconhecidos = sorted({c for c, v in zip(linha, codigos) if v < 0})
+                raise ValueError(f"Símbolos desconhecidos: {''.join(desconhecidos)}")
+            codigos[codigos < 0] = self.simbolos.index("X")
+        return codigos
+
+    def _soma_pares(self, contagens: np.ndarray) -> np.ndarray:
+        return (np.einsum("ls,st,lt->l", contagens, self.M, contagens) - contagens @ np.diag(self.M)) // 2
+
+    def _entropia(self, contagens: np.ndarray) -> np.ndarray:
+        residuos = contagens[:, :-1]
+        totais = residuos.sum(axis=1, keepdims=True)
+        p = residuos / np.maximum(totais, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -np.where(p > 0, p * np.log2(p), 0.0).sum(axis=1)
+
+    def __len__(self) -> int:
+        return self.codigos.shape[1]
+
+    def soma_pares(self) -> int:
+        """
+        @brief Pontuação sum-of-pairs do alinhamento (soma das colunas).
+        """
+        return self._total
+
+    def soma_pares_colunas(self) -> np.ndarray:
+        """
+        @brief Pontuação sum-of-pairs de cada coluna.
+        """
+        return self._colunas.copy()
+
+    def entropia(self) -> np.ndarray:
+        """
+        @brief Entropia de Shannon (bits) dos resíduos de cada coluna, ignorando as lacunas.
+        """
+        return self._entropias.copy()
+
+    def conservacao(self) -> np.ndarray:
+        """
+        @brief Conservação de cada coluna em [0, 1].
+
+        @details 1 - H / log2(|Σ|), multiplicado pela fração de sequências sem lacuna na
+                 coluna: uma coluna só com um resíduo vale 1 e uma coluna só de lacunas vale 0.
+        """
+        k = self.codigos.shape[0]
+        ocupacao = 1 - self.contagens[:, -1] / k
+        return (1 - self._entropias / np.log2(len(self.simbolos) - 1)) * ocupacao
+
+    def substituir_linha(self, indice: int, linha: str) -> int:
+        """
+        @brief Substitui uma linha (por exemplo, realinhada contra as restantes) e atualiza as pontuações.
+
+        @details Em cada coluna alterada, a contribuição do símbolo antigo a é Σ_b c_b M_ab - M_aa;
+                 retira-se essa contribuição, atualizam-se as contagens e soma-se a do símbolo novo.
+
+        @param indice Índice da linha no alinhamento
+        @param linha Nova linha, com o mesmo comprimento do alinhamento
+        @return Nova pontuação sum-of-pairs
+
+        @exception ValueError Se a linha tiver um comprimento diferente
+        """
+        if len(linha) != len(self):
+            raise ValueError("A linha deve ter o comprimento do alinhamento")
+        novos = self._codificar(linha)
+        colunas = np.flatnonzero(novos != self.codigos[indice])
+        if len(colunas) == 0:
+            return self._total
+        antigos, novos_alterados = self.codigos[indice, colunas], novos[colunas]
+        contagens = self.contagens[colunas]
+        retirar = (contagens * self.M[antigos]).sum(axis=1) - self.M[antigos, antigos]
+        contagens[np.arange(len(colunas)), antigos] -= 1
+        somar = (contagens * self.M[novos_alterados]).sum(axis=1)
+        contagens[np.arange(len(colunas)), novos_alterados] += 1
+
+        self.contagens[colunas] = contagens
+        self._colunas[colunas] += somar - retirar
+        self._total += int((somar - retirar).sum())
+        self._entropias[colunas] = self._entropia(contagens)
+        self.codigos[indice] = novos
+        return self._total
+
+
+def soma_pares(alinhamento: List[str], matriz: Optional[Matriz] = None, gap: int = -8) -> int:
+    """
+    @brief Pontuação sum-of-pairs de um alinhamento múltiplo (ver PontuacaoMSA).
+    """
+    return PontuacaoMSA(alinhamento, matriz, gap).soma_pares()
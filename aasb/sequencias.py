@@ -0,0 +1,791 @@
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Dict, Iterator, NamedTuple, Optional, Union
+
+from ._preguicoso import importar_preguicoso
+
+np = importar_preguicoso("numpy", globals(), "np")                             #NumPy só é importado quando é usado
+
+BASES_ADN = "ACGT"
+COMPLEMENTOS_IUPAC = {"A": "T", "C": "G", "G": "C", "T": "A", "N": "N", "R": "Y", "Y": "R",
+                      "S": "S", "W": "W", "K": "M", "M": "K", "B": "V", "V": "B", "D": "H", "H": "D"}
+
+_COMPLEMENTO = str.maketrans("ACGTacgt", "TGCATGCA")
+_BASES_VALIDAS = frozenset(BASES_ADN)
+
+@lru_cache(maxsize=None)
+def _codigo_base() -> np.ndarray:
+    """
+    @brief Tabela byte -> código de 2 bits (255 = ambíguo), construída no primeiro uso.
+    """
+    tabela = np.full(256, 255, dtype=np.uint8)
+    for i, b in enumerate(BASES_ADN):
+        tabela[ord(b)] = tabela[ord(b.lower())] = i
+    return tabela
+
+@lru_cache(maxsize=None)
+def _inverte_byte() -> np.ndarray:
+    """
+    @brief Tabela que inverte a ordem das 4 bases de um byte, construída no primeiro uso.
+    """
+    return np.array([((b & 3) << 6) | (((b >> 2) & 3) << 4) | (((b >> 4) & 3) << 2) | (b >> 6)
+                     for b in range(256)], dtype=np.uint8)
+
+## Tabelas de código genético do NCBI, com os aminoácidos dos 64 codões pela ordem TCAG
+TABELAS_NCBI = {
+    1: "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",   #padrão
+    2: "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG",   #mitocondrial de vertebrados
+    3: "FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG",   #mitocondrial de levedura
+    4: "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",   #mitocondrial de fungos, protozoários e Mycoplasma
+    5: "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG",   #mitocondrial de invertebrados
+    6: "FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",   #nuclear de ciliados
+    9: "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",   #mitocondrial de equinodermes
+    10: "FFLLSSSSYY**CCCWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",  #nuclear de Euplotes
+    11: "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",  #bactérias, arqueias e plastídeos
+    12: "FFLLSSSSYY**CC*WLLLSPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",  #nuclear alternativo de leveduras
+    13: "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSGGVVVVAAAADDEEGGGG",  #mitocondrial de ascídias
+    14: "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",  #mitocondrial alternativo de platelmintas
+}
+
+## Código genético padrão como dicionário codão -> aminoácido ('_' nos codões de paragem), derivado de TABELAS_NCBI[1]
+CODIGO_GENETICO = {"TCAG"[i // 16] + "TCAG"[i // 4 % 4] + "TCAG"[i % 4]: "_" if aminoacido == "*" else aminoacido
+                   for i, aminoacido in enumerate(TABELAS_NCBI[1])}
+
+def _compilar_tabela(aminoacidos: str) -> np.ndarray:
+    """
+    @brief Converte uma tabela TCAG do NCBI num array indexado por 16*b1 + 4*b2 + b3 (códigos ACGT).
+
+    @details A entrada 64 corresponde a codões com caracteres inválidos. Tal como em
+             CODIGO_GENETICO, os codões de paragem e os inválidos são traduzidos para '_'.
+    """
+    tabela = np.full(65, ord("_"), dtype=np.uint8)
+    for i, aminoacido in enumerate(aminoacidos):
+        b1, b2, b3 = ("TCAG"[i // 16], "TCAG"[i // 4 % 4], "TCAG"[i % 4])
+        indice = 16 * BASES_ADN.index(b1) + 4 * BASES_ADN.index(b2) + BASES_ADN.index(b3)
+        tabela[indice] = ord("_" if aminoacido == "*" else aminoacido)
+    return tabela
+
+@lru_cache(maxsize=None)
+def _tabela_traducao(tabela: int) -> np.ndarray:
+    """
+    @brief Tabela de tradução compilada do código genético `tabela`, calculada uma vez por código.
+
+    @exception KeyError Se o número não corresponder a nenhuma tabela de TABELAS_NCBI.
+    """
+    return _compilar_tabela(TABELAS_NCBI[tabela])
+
+_CODAO_INICIO = 16 * 0 + 4 * 3 + 2                                             #índice do codão ATG
+
+def validacao_dna(sequencia: str) -> str:
+    """
+    @brief Verifica se uma sequência fornecida é uma sequência válida de DNA.
+
+    @details Uma sequência de DNA é considerada válida se:
+             - Não estiver vazia.
+             - Contiver apenas os caracteres 'A', 'T', 'C' e 'G', que representam as bases azotadas do DNA.
+
+    @param sequencia Uma string representando a sequência de DNA a ser validada.
+
+    @return Uma string indicando se a sequência é válida ou não.
+            - "É uma sequência válida de DNA" se todos os critérios forem atendidos.
+            - "Não é uma sequência válida de DNA" caso contrário.
+
+    @note A validação é insensível a maiúsculas e minúsculas, pois a sequência é convertida para letras maiúsculas antes da verificação.
+
+    @code
+    // Exemplos de uso:
+    validacao_dna("ATCG"); // Retorna "É uma sequência válida de DNA"
+    validacao_dna("atcg"); // Retorna "É uma sequência válida de DNA"
+    validacao_dna("ATXG"); // Retorna "Não é uma sequência válida de DNA"
+    validacao_dna("");     // Retorna "Não é uma sequência válida de DNA"
+    @endcode
+    """
+    if not dna_valido(sequencia):                        #averigua se está vazia ou tem caracteres fora de ACGT
+        return "Não é uma sequência válida de DNA"
+    return "É uma sequência válida de DNA"
+
+def dna_valido(sequencia: Union[str, "ADNCompacto"]) -> bool:
+    """
+    @brief Indica se uma sequência é DNA válido (não vazia e só com A, C, G e T).
+
+    @details Em vez de percorrer os caracteres um a um, apaga todas as bases válidas
+             com bytes.translate e verifica se sobrou algum carácter.
+
+    @param sequencia Uma string ou ADNCompacto.
+
+    @return True se a sequência for válida, False caso contrário.
+
+    @code
+    // Exemplos de uso:
+    dna_valido("ATCG"); // Retorna True
+    dna_valido("ATXG"); // Retorna False
+    @endcode
+    """
+    if isinstance(sequencia, ADNCompacto):
+        return len(sequencia) > 0 and not sequencia._excecoes_locais()
+    return bool(sequencia) and not sequencia.encode("ascii", "replace").translate(None, b"ACGTacgt")
+
+def codigos_bases(sequencia: Union[str, "ADNCompacto"]) -> np.ndarray:
+    """
+    @brief Converte uma sequência em códigos 0-3 (A, C, G, T), com 4 para qualquer outro carácter.
+    """
+    if isinstance(sequencia, ADNCompacto):
+        return sequencia.codigos()
+    codigos = _codigo_base()[np.frombuffer(sequencia.encode("ascii", "replace"), dtype=np.uint8)]
+    return np.minimum(codigos, 4)
+
+def contagem_bases(sequencia: Union[str, "ADNCompacto"]) -> Dict[str, int]:
+    """
+    @brief Conta as ocorrências de A, C, G e T numa sequência e devolve o resultado.
+
+    @details A contagem é feita numa única passagem vetorizada (np.bincount) sobre a
+             sequência codificada. Caracteres fora de ACGT são ignorados.
+
+    @param sequencia Uma string (insensível a maiúsculas) ou ADNCompacto.
+
+    @return Dicionário {'A': n, 'C': n, 'G': n, 'T': n}.
+
+    @code
+    // Exemplos de uso:
+    contagem_bases("ATCGATCGN"); // Retorna {'A': 2, 'C': 2, 'G': 2, 'T': 2}
+    @endcode
+    """
+    contagens = np.bincount(codigos_bases(sequencia), minlength=5)
+    return {base: int(contagens[i]) for i, base in enumerate(BASES_ADN)}
+
+def frequencias_bases(sequencia: Union[str, "ADNCompacto"]) -> Dict[str, float]:
+    """
+    @brief Calcula a frequência de A, C, G e T relativamente ao comprimento da sequência.
+
+    @param sequencia Uma string (insensível a maiúsculas) ou ADNCompacto.
+
+    @return Dicionário com a frequência de cada base (0 para sequências vazias).
+    """
+    tamanho = len(sequencia)
+    return {base: (n / tamanho if tamanho > 0 else 0) for base, n in contagem_bases(sequencia).items()}
+
+class PerfilGC(NamedTuple):
+    """
+    @brief Perfis de conteúdo GC e desvio GC ao longo de uma sequência.
+
+    @param posicoes Posição inicial de cada janela.
+    @param gc Fração de G + C entre as bases ACGT de cada janela (nan se não houver nenhuma).
+    @param desvio Desvio GC (G - C) / (G + C) de cada janela (nan se G + C = 0).
+    """
+    posicoes: np.ndarray
+    gc: np.ndarray
+    desvio: np.ndarray
+
+def perfil_gc(sequencia: Union[str, "ADNCompacto"], janela: int, passo: Optional[int] = None) -> PerfilGC:
+    """
+    @brief Calcula o conteúdo GC e o desvio GC em janelas deslizantes numa única passagem.
+
+    @details A sequência é dividida em blocos de mdc(janela, passo) bases, cujas contagens
+             de G, C e bases válidas são obtidas de uma vez. As contagens de cada janela
+             são diferenças de somas acumuladas dos blocos, pelo que o custo não depende
+             do número de janelas sobrepostas. Só são devolvidas janelas completas.
+
+    @param sequencia Uma string (insensível a maiúsculas) ou ADNCompacto.
+    @param janela Tamanho de cada janela.
+    @param passo Distância entre inícios de janelas consecutivas (por omissão, igual à janela).
+
+    @return PerfilGC com as posições, o conteúdo GC e o desvio GC de cada janela.
+
+    @code
+    // Exemplos de uso:
+    perfil_gc("GGGGCCAT", 4).gc;      // Retorna array([1. , 0.5])
+    perfil_gc("GGGGCCAT", 4).desvio;  // Retorna array([1., -1.])
+    @endcode
+    """
+    passo = janela if passo is None else passo
+    assert janela > 0 and passo > 0, "A janela e o passo devem ser positivos"
+
+    codigos = codigos_bases(sequencia)
+    bloco = math.gcd(janela, passo)
+    blocos = codigos[:len(codigos) // bloco * bloco].reshape(-1, bloco)
+    acumulado = {}
+    for nome, mascara in (("G", blocos == 2), ("C", blocos == 1), ("validas", blocos < 4)):
+        acumulado[nome] = np.concatenate([[0], np.cumsum(mascara.sum(axis=1, dtype=np.int64))])
+
+    n_janelas = max((len(codigos) - janela) // passo + 1, 0)
+    inicio = np.arange(n_janelas) * (passo // bloco)
+    fim = inicio + janela // bloco
+    g, c, validas = (acumulado[x][fim] - acumulado[x][inicio] for x in ("G", "C", "validas"))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gc = np.where(validas > 0, (g + c) / validas, np.nan)
+        desvio = np.where(g + c > 0, (g - c) / (g + c), np.nan)
+    return PerfilGC(inicio * bloco, gc, desvio)
+
+def contar_bases(sequencia: str):
+    """
+    @brief Conta as ocorrências de cada base nitrogenada (A, C, G, T) em uma sequência de DNA e exibe os resultados.
+
+    @details A função percorre a sequência fornecida, converte todos os caracteres para maiúsculas,
+             e contabiliza a frequência de cada base nitrogenada válida ('A', 'C', 'G', 'T').
+             Bases não reconhecidas são ignoradas.
+
+    @param sequencia Uma string representando a sequência de DNA a ser analisada.
+
+    @return Nenhum valor é retornado, mas os resultados são exibidos no formato:
+            - A: número de ocorrências de adenina
+            - C: número de ocorrências de citosina
+            - G: número de ocorrências de guanina
+            - T: número de ocorrências de timina
+
+    @note Esta função diferencia apenas as bases nitrogenadas padrão. Qualquer caractere fora de 'A', 'C', 'G', 'T' será ignorado.
+
+    @code
+    // Exemplos de uso:
+    contar_bases("ATCGATCG");
+    // Saída:
+    // A: 2
+    // C: 2
+    // G: 2
+    // T: 2
+
+    contar_bases("ATXG");
+    // Saída:
+    // A: 1
+    // C: 0
+    // G: 1
+    // T: 1
+    @endcode
+    """
+    bases = contagem_bases(sequencia)                   #contar as ocorrências de cada base
+    
+    for base, quantidade in bases.items():              #imprimir o número de cada base
+        print(f"{base}: {quantidade}")
+
+def frequencia_bases(sequencia: str):
+    """
+    @brief Calcula e exibe a frequência de cada base azotada (A, C, G, T) em uma sequência de DNA.
+
+    @details A função percorre a sequência fornecida, converte todos os caracteres para maiúsculas,
+             e calcula a frequência de cada base nitrogenada válida ('A', 'C', 'G', 'T').
+             Bases não reconhecidas são ignoradas na contagem.
+
+    @param sequencia Uma string representando a sequência de DNA a ser analisada.
+
+    @return Nenhum valor é retornado, mas as frequências são exibidas no formato:
+            - A: frequência de adenina
+            - C: frequência de citosina
+            - G: frequência de guanina
+            - T: frequência de timina
+
+    @note Se a sequência estiver vazia, as frequências serão exibidas como 0.00 para todas as bases.
+
+    @code
+    // Exemplos de uso:
+    frequencia_bases("ATCGATCG");
+    // Saída:
+    // A: 0.25
+    // C: 0.25
+    // G: 0.25
+    // T: 0.25
+
+    frequencia_bases("AATTGG");
+    // Saída:
+    // A: 0.33
+    // C: 0.00
+    // G: 0.33
+    // T: 0.33
+
+    frequencia_bases("");
+    // Saída:
+    // A: 0.00
+    // C: 0.00
+    // G: 0.00
+    // T: 0.00
+    @endcode
+    """
+    for base, frequencia in frequencias_bases(sequencia).items():        #imprimir a frequência de cada base
+        print(f"{base}: {frequencia:.2f}")
+
+def complemento_inverso(sequencia: str) -> str:
+    """
+    @brief Calcula o complemento inverso de uma sequência de DNA.
+
+    @details A função recebe uma sequência de DNA, inverte a ordem das bases,
+             e substitui cada base pela sua base complementar de acordo com as seguintes regras:
+             - 'A' é complementada por 'T'.
+             - 'T' é complementada por 'A'.
+             - 'C' é complementada por 'G'.
+             - 'G' é complementada por 'C'.
+
+    @param sequencia Uma string representando a sequência de DNA a ser processada.
+
+    @return Uma string contendo o complemento inverso da sequência fornecida.
+
+    @note A função é insensível a maiúsculas e minúsculas, pois converte a sequência para letras maiúsculas antes do processamento.
+
+    @code
+    // Exemplos de uso:
+    complemento_inverso("ATCG");
+    // Retorna: "CGAT"
+
+    complemento_inverso("aatt");
+    // Retorna: "AATT"
+
+    complemento_inverso("");
+    // Retorna: ""
+    @endcode
+    """
+    if isinstance(sequencia, ADNCompacto):                                  #sequências compactas usam operações de bits
+        return sequencia.complemento_inverso()
+
+    complemento = sequencia[::-1].translate(_COMPLEMENTO)                   #inverte e complementa numa só passagem (tabela pré-compilada)
+
+    if not _BASES_VALIDAS.issuperset(complemento):
+        raise KeyError(next(base for base in complemento.upper() if base not in _BASES_VALIDAS))
+
+    return complemento
+
+def dna_para_rna(sequencia: str) -> str:
+    """
+    @brief Converte uma sequência de DNA em uma cadeia de RNA correspondente.
+
+    @details A função recebe uma sequência de DNA, converte todas as letras para maiúsculas 
+             e substitui cada ocorrência de Timina ('T') pelo Uracilo ('U'), gerando a sequência de RNA.
+
+    @param sequencia Uma string representando a sequência de DNA a ser convertida.
+
+    @return Uma string contendo a cadeia de RNA correspondente à sequência de DNA fornecida.
+
+    @note A função é insensível a maiúsculas e minúsculas, pois converte a sequência para letras maiúsculas antes do processamento.
+
+    @code
+    // Exemplos de uso:
+    dna_para_rna("ATCG");
+    // Retorna: "AUCG"
+
+    dna_para_rna("aattccgg");
+    // Retorna: "AAUUCCGG"
+
+    dna_para_rna("");
+    // Retorna: ""
+    @endcode
+    """
+    rna = sequencia.upper().replace("T", "U")        #mete a sequência em maiúsculas e substitui a Timina por Uracilo
+    
+    return rna
+
+def dividir_codoes(sequencia: str) -> list[str]:
+    """
+    @brief Divide uma sequência de DNA em uma lista de codões.
+
+    @details A função recebe uma sequência de DNA, converte todas as letras para maiúsculas,
+             e divide a sequência em blocos de três nucleotídeos (codões). Apenas blocos completos
+             com exatamente três nucleotídeos são incluídos na lista de saída.
+
+    @param sequencia Uma string representando a sequência de DNA a ser dividida em codões.
+
+    @return Uma lista de strings, onde cada string é um codão (grupo de 3 nucleotídeos) da sequência.
+
+    @note Sequências com comprimento não múltiplo de 3 terão os nucleotídeos restantes ignorados.
+
+    @code
+    // Exemplos de uso:
+    dividir_codoes("ATCGTACGAT");
+    // Retorna: ["ATC", "GTA", "CGA"]
+
+    dividir_codoes("AATTGG");
+    // Retorna: ["AAT", "TGG"]
+
+    dividir_codoes("AATTC");
+    // Retorna: ["AAT"]
+
+    dividir_codoes("");
+    // Retorna: []
+    @endcode
+    """
+    seq_maiusculas = sequencia.upper()             #mete a sequência em maiúsculas
+    codoes = []                                    #lista vazia para armazenar os codões
+    
+    for i in range(0, len(seq_maiusculas), 3):     #percorre a sequência de em passos de 3
+        codao = seq_maiusculas[i:i+3]              #pega o codão de 3 nucleotídeos
+        if len(codao) == 3:                        #adiciona o codão à lista se tiver 3 nucleotídeos
+            codoes.append(codao)
+    
+    return codoes
+
+def dna_para_proteina(sequencia: str, tabela: int = 1) -> str:
+    """
+    @brief Converte uma sequência de DNA em uma cadeia de aminoácidos que formam uma proteína.
+
+    @details A função utiliza o código genético padrão para traduzir a sequência de DNA em uma sequência de aminoácidos.
+             Cada tripla de nucleotídeos (codão) é mapeada para seu respectivo aminoácido. 
+             Codões de parada (TAA, TAG, TGA) são representados pelo caractere '_'. 
+             Se um codão não for reconhecido, ele também será traduzido para '_'.
+
+    @param sequencia Uma string representando a sequência de DNA a ser traduzida.
+    @param tabela Número da tabela de código genético do NCBI (1 = código padrão).
+
+    @return Uma string contendo a sequência de aminoácidos correspondente.
+
+    @note A função ignora nucleotídeos extras no final da sequência que não formam um codão completo.
+
+    @code
+    // Exemplos de uso:
+    dna_para_proteina("ATGTTCGAA");
+    // Retorna: "MF_"
+
+    dna_para_proteina("ATGAAATAA");
+    // Retorna: "MK_"
+
+    dna_para_proteina("");
+    // Retorna: ""
+    @endcode
+    """
+    codoes = _indices_codoes(codigos_bases(sequencia))[::3]                         #índice (0-63) de cada codão; 64 = inválido
+
+    resultado = _tabela_traducao(tabela)[codoes].tobytes().decode("ascii")       #tradução de todos os codões por consulta à tabela
+
+    if len(sequencia) % 3:                                                            #codão incompleto no fim
+        resultado += "_"
+
+    return resultado
+
+def _indices_codoes(codigos: np.ndarray) -> np.ndarray:
+    """
+    @brief Calcula o índice (16*b1 + 4*b2 + b3) do codão que começa em cada posição.
+
+    @param codigos Sequência em códigos 0-3 (4 = carácter inválido).
+
+    @return Array com len(codigos) - 2 índices; codões com caracteres inválidos recebem 64.
+    """
+    if len(codigos) < 3:
+        return np.empty(0, dtype=np.int16)
+    c = codigos.astype(np.int16)
+    indices = 16 * c[:-2] + 4 * c[1:-1] + c[2:]
+    invalidos = (codigos == 4)
+    indices[invalidos[:-2] | invalidos[1:-1] | invalidos[2:]] = 64
+    return indices
+
+def _complemento_codigos(codigos: np.ndarray) -> np.ndarray:
+    """
+    @brief Complemento inverso de uma sequência em códigos 0-3 (o 4 mantém-se).
+    """
+    return np.where(codigos < 4, 3 - codigos, 4).astype(np.uint8)[::-1]
+
+def traduzir_seis_quadros(sequencia, tabela: int = 1) -> list[str]:
+    """
+    @brief Traduz os seis quadros de leitura de uma sequência de DNA.
+
+    @details A sequência é codificada uma vez; o índice do codão em cada posição é
+             calculado numa única operação vetorizada por cadeia e cada quadro é uma
+             fatia com passo 3 desse array, traduzida por consulta a uma tabela de 65
+             entradas pré-compilada.
+
+    @param sequencia Uma string ou ADNCompacto.
+    @param tabela Número da tabela de código genético do NCBI (1 = código padrão).
+
+    @return Lista com 6 proteínas: quadros 0, 1 e 2 da cadeia direta e quadros 0, 1 e 2
+            do complemento inverso (pela mesma ordem que obter_orfs). Só são traduzidos
+            codões completos; os codões de paragem são representados por '_'.
+
+    @exception KeyError Se a tabela não existir em TABELAS_NCBI.
+
+    @code
+    // Exemplo de uso:
+    traduzir_seis_quadros("ATGAAATAG");
+    // Retorna: ["MK_", "_N", "EI", "LFH", "YF", "IS"]
+    @endcode
+    """
+    traducao = _tabela_traducao(tabela)
+    codigos = codigos_bases(sequencia)
+    proteinas = []
+    for cadeia in (codigos, _complemento_codigos(codigos)):
+        indices = _indices_codoes(cadeia)
+        proteinas += [traducao[indices[quadro::3]].tobytes().decode("ascii") for quadro in range(3)]
+    return proteinas
+
+def obter_orfs(sequencia: str):
+    """
+    @brief Calcula todas as 6 possíveis Open Reading Frames (ORFs) de uma sequência de DNA.
+
+    @param Sequência de DNA em formato de string. A sequência deve ser composta apenas pelas bases A, T, C e G.
+    
+    @return Lista com 6 ORFs, sendo 3 da cadeia direta e 3 da cadeia reversa. Cada ORF é representada como uma lista de codões.
+
+    @details A função gera 3 ORFs a partir da cadeia direta e 3 ORFs a partir da cadeia reversa do DNA. Para isso, a sequência é dividida em codões 
+    (grupos de 3 nucleotídeos) a partir de três posições iniciais (0, 1, 2), tanto na sequência original quanto na sequência complementar inversa. 
+    As ORFs geradas podem representar potenciais regiões de tradução para proteínas.
+
+    @note A função assume que a sequência de DNA fornecida está em letras maiúsculas. A função também lida com a inversão e complemento da cadeia 
+    para calcular as ORFs da sequência reversa reversa.
+
+    @code
+    // Exemplo de uso:
+    dna = "ATGAAATAGATGTTTTAATGA"
+    orfs = get_orfs(dna)
+    for orf in orfs:
+        print(orf)
+    @endcode
+
+    @see dividir_codoes
+    @see complemento_inverso
+    @see encontrar_orfs
+    """
+    def dividir_orfs(sequencia):
+        """
+        Gera 3 ORFs a partir de uma única sequência de DNA.
+        
+        """
+        return [dividir_codoes(sequencia[i:]) for i in range(3)]     #retorna uma lista de codões
+
+    orfs_direta = dividir_orfs(sequencia.upper())                    #ORFs da sequência
+    orfs_reversa = dividir_orfs(complemento_inverso(sequencia))      #ORFs da sequência reversa
+    
+    return orfs_direta + orfs_reversa
+
+
+class ADNCompacto:
+    """
+    @brief Sequência de DNA compactada com 2 bits por base.
+
+    @details As bases A, C, G e T são guardadas como 0, 1, 2 e 3, quatro por byte (a
+             primeira base nos bits mais significativos). Os caracteres ambíguos (N e os
+             restantes códigos IUPAC) são guardados à parte como intervalos
+             (início, fim, carácter), pelo que uma região de N ocupa uma única entrada.
+
+             Uma fatia partilha os bytes da sequência original e só guarda a posição
+             inicial e o comprimento. O complemento de uma base é o XOR do seu código
+             com 3, pelo que o complemento inverso se obtém com XOR 0xFF sobre os bytes,
+             uma tabela que inverte as 4 bases de cada byte e a inversão da ordem dos bytes.
+
+    @note A sequência é convertida para maiúsculas.
+
+    @code
+    // Exemplos de uso:
+    seq = ADNCompacto("ATGNNCGT")
+    str(seq[2:6])                       // Retorna "GNNC"
+    str(seq.complemento_inverso())      // Retorna "ACGNNCAT"
+    @endcode
+    """
+
+    __slots__ = ("dados", "inicio", "comprimento", "excecoes")
+
+    def __init__(self, sequencia: str = ""):
+        """
+        @brief Compacta uma string de DNA.
+
+        @param sequencia Sequência de DNA (pode conter N e outros códigos IUPAC).
+        """
+        texto = np.frombuffer(sequencia.upper().encode("ascii", "replace"), dtype=np.uint8)
+        codigos = _codigo_base()[texto]
+        ambiguos = codigos == 255
+        excecoes = []
+        if ambiguos.any():
+            posicoes = np.flatnonzero(ambiguos)
+            quebras = np.flatnonzero((np.diff(posicoes) != 1) | (np.diff(texto[posicoes]) != 0)) + 1
+            for grupo in np.split(posicoes, quebras):                      #um intervalo por sequência de caracteres iguais
+                excecoes.append((int(grupo[0]), int(grupo[-1]) + 1, chr(texto[grupo[0]])))
+            codigos = np.where(ambiguos, 0, codigos).astype(np.uint8)
+        self.dados = ADNCompacto._compactar(codigos)
+        self.inicio = 0
+        self.comprimento = len(codigos)
+        self.excecoes = excecoes
+
+    @staticmethod
+    def _compactar(codigos: np.ndarray) -> np.ndarray:
+        """
+        @brief Junta códigos de 2 bits em bytes (4 bases por byte).
+        """
+        resto = (-len(codigos)) % 4
+        if resto:
+            codigos = np.concatenate([codigos, np.zeros(resto, dtype=np.uint8)])
+        grupos = codigos.reshape(-1, 4)
+        return (grupos[:, 0] << 6) | (grupos[:, 1] << 4) | (grupos[:, 2] << 2) | grupos[:, 3]
+
+    @classmethod
+    def _vista(cls, dados: np.ndarray, inicio: int, comprimento: int, excecoes) -> "ADNCompacto":
+        """
+        @brief Cria uma sequência sobre bytes já compactados, sem os copiar.
+        """
+        vista = cls.__new__(cls)
+        vista.dados, vista.inicio, vista.comprimento, vista.excecoes = dados, inicio, comprimento, excecoes
+        return vista
+
+    def __len__(self) -> int:
+        return self.comprimento
+
+    @property
+    def nbytes(self) -> int:
+        """
+        @brief Número de bytes ocupados pelas bases desta sequência.
+        """
+        return (self.comprimento + 3) // 4
+
+    def _excecoes_locais(self):
+        """
+        @brief Intervalos ambíguos que intersetam esta sequência, em coordenadas locais.
+        """
+        fim = self.inicio + self.comprimento
+        return [(max(a, self.inicio) - self.inicio, min(b, fim) - self.inicio, c)
+                for a, b, c in self.excecoes if a < fim and b > self.inicio]
+
+    def codigos(self) -> np.ndarray:
+        """
+        @brief Descompacta as bases em códigos 0-3 (A, C, G, T); posições ambíguas recebem 4.
+
+        @return Array uint8 com um código por base.
+        """
+        primeiro = self.inicio // 4
+        ultimo = (self.inicio + self.comprimento + 3) // 4
+        bytes_ = self.dados[primeiro:ultimo]
+        codigos = ((bytes_[:, None] >> np.array([6, 4, 2, 0], dtype=np.uint8)) & 3).ravel()
+        desvio = self.inicio - 4 * primeiro
+        codigos = codigos[desvio:desvio + self.comprimento]
+        for a, b, _ in self._excecoes_locais():
+            codigos[a:b] = 4
+        return codigos
+
+    def __str__(self) -> str:
+        texto = np.frombuffer(b"ACGTN", dtype=np.uint8)[self.codigos()]
+        for a, b, c in self._excecoes_locais():
+            texto[a:b] = ord(c)
+        return texto.tobytes().decode("ascii")
+
+    def __repr__(self) -> str:
+        return f"ADNCompacto('{self}')" if self.comprimento <= 40 else \
+            f"ADNCompacto(comprimento={self.comprimento})"
+
+    def __eq__(self, outra) -> bool:
+        if isinstance(outra, ADNCompacto):
+            return str(self) == str(outra)
+        if isinstance(outra, str):
+            return str(self) == outra.upper()
+        return NotImplemented
+
+    def __getitem__(self, indice):
+        """
+        @brief Obtém uma base (índice inteiro) ou uma fatia sem copiar os bytes.
+
+        @exception IndexError Se o índice estiver fora da sequência.
+        """
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(self.comprimento)
+            if passo != 1:
+                return ADNCompacto(str(self)[indice])
+            return ADNCompacto._vista(self.dados, self.inicio + inicio, max(fim - inicio, 0), self.excecoes)
+        if indice < 0:
+            indice += self.comprimento
+        if not 0 <= indice < self.comprimento:
+            raise IndexError("Índice fora da sequência")
+        return str(self[indice:indice + 1])
+
+    def complemento_inverso(self) -> "ADNCompacto":
+        """
+        @brief Calcula o complemento inverso com operações sobre os bytes compactados.
+
+        @return Nova sequência compacta com o complemento inverso.
+        """
+        primeiro = self.inicio // 4
+        ultimo = (self.inicio + self.comprimento + 3) // 4
+        dados = _inverte_byte()[self.dados[primeiro:ultimo] ^ 0xFF][::-1].copy()
+        desvio = self.inicio - 4 * primeiro
+        inicio = 4 * (ultimo - primeiro) - desvio - self.comprimento
+        excecoes = [(inicio + self.comprimento - b, inicio + self.comprimento - a, COMPLEMENTOS_IUPAC.get(c, c))
+                    for a, b, c in reversed(self._excecoes_locais())]
+        return ADNCompacto._vista(dados, inicio, self.comprimento, excecoes)
+
+
+## Número de posições (múltiplo de 3) de cada cadeia codificadas de cada vez por encontrar_orfs
+BLOCO_ORFS = 3 * 2**20
+
+
+class ORF(NamedTuple):
+    """
+    @brief Open Reading Frame encontrada por encontrar_orfs.
+
+    @param cadeia "+" para a cadeia direta, "-" para o complemento inverso.
+    @param quadro Quadro de leitura (0, 1 ou 2) na respetiva cadeia, como em obter_orfs.
+    @param inicio Posição inicial (base 0) na cadeia direta.
+    @param fim Posição final (exclusiva) na cadeia direta, incluindo o codão de paragem.
+    @param proteina Sequência de aminoácidos, sem o codão de paragem.
+    """
+    cadeia: str
+    quadro: int
+    inicio: int
+    fim: int
+    proteina: str
+
+def encontrar_orfs(sequencia, comprimento_minimo: int = 30, tabela: int = 1) -> Iterator[ORF]:
+    """
+    @brief Encontra as ORFs (ATG até ao codão de paragem) dos seis quadros de leitura.
+
+    @details Cada cadeia é codificada em blocos de BLOCO_ORFS posições. Em cada bloco
+             e quadro, as posições dos codões de paragem e dos ATG são obtidas numa
+             passagem vetorizada; cada ORF começa no primeiro ATG após o codão de
+             paragem anterior (a ORF mais longa) e termina no codão de paragem seguinte.
+             De um bloco para o seguinte só passam, por quadro, a posição da última
+             paragem e a do primeiro ATG depois dela. Um codão com caracteres inválidos
+             (por exemplo N) interrompe a ORF, que é descartada. Só as ORFs encontradas
+             são traduzidas e as de cada cadeia são devolvidas no fim dessa cadeia, pelo
+             que a memória usada é a de um bloco mais a das ORFs encontradas.
+
+    @param sequencia Uma string ou ADNCompacto.
+    @param comprimento_minimo Número mínimo de aminoácidos (sem contar o codão de paragem).
+    @param tabela Número da tabela de código genético do NCBI (1 = código padrão).
+
+    @return Gerador de ORFs, primeiro os três quadros da cadeia direta e depois os do
+            complemento inverso. ORFs sem codão de paragem antes do fim da sequência
+            não são reportadas.
+
+    @code
+    // Exemplo de uso:
+    list(encontrar_orfs("CCATGAAATAGG", comprimento_minimo=1));
+    // Retorna: [ORF(cadeia='+', quadro=2, inicio=2, fim=11, proteina='MK')]
+    @endcode
+
+    @see obter_orfs
+    """
+    traducao = _tabela_traducao(tabela)
+    barreiras = np.ones(65, dtype=bool)                                        #paragens e codões inválidos (64)
+    barreiras[:64] = traducao[:64] == ord("_")
+
+    n = len(sequencia)
+
+    def codigos_cadeia(cadeia: str, inicio: int, fim: int) -> np.ndarray:
+        fim = min(fim, n)
+        if cadeia == "+":
+            return codigos_bases(sequencia[inicio:fim])
+        return _complemento_codigos(codigos_bases(sequencia[n - fim:n - inicio]))
+
+    for cadeia in "+-":
+        anteriores = [-1, -1, -1]                                               #última barreira de cada quadro
+        pendentes = [-1, -1, -1]                                                #primeiro ATG depois dela, se houver
+        encontradas = [[], [], []]                                              #(arranque, fim, proteína) em codões
+        for inicio in range(0, n, BLOCO_ORFS):
+            indices = _indices_codoes(codigos_cadeia(cadeia, inicio, inicio + BLOCO_ORFS + 2))
+            base = inicio // 3
+            for quadro in range(3):
+                codoes = indices[quadro::3]
+                fins = np.flatnonzero(barreiras[codoes])
+                inicios = np.flatnonzero(codoes == _CODAO_INICIO)
+                if len(fins) == 0:
+                    if pendentes[quadro] < 0 and len(inicios):
+                        pendentes[quadro] = base + int(inicios[0])
+                    continue
+                limites = np.concatenate([[anteriores[quadro] - base], fins[:-1]])
+                arranques = np.append(inicios, -1)[np.searchsorted(inicios, limites + 1)]   #-1 se não houver ATG
+                validos = arranques >= 0
+                if pendentes[quadro] >= 0:
+                    arranques[0], validos[0] = pendentes[quadro] - base, True
+                validos &= (arranques < fins) & (fins - arranques >= comprimento_minimo) & (codoes[fins] != 64)
+                for arranque, fim in zip(arranques[validos].tolist(), fins[validos].tolist()):
+                    proteina = traducao[codoes[arranque:fim]].tobytes().decode("ascii") if arranque >= 0 else None
+                    encontradas[quadro].append((base + arranque, base + fim, proteina))
+                anteriores[quadro] = base + int(fins[-1])
+                seguinte = np.searchsorted(inicios, fins[-1] + 1)
+                pendentes[quadro] = base + int(inicios[seguinte]) if seguinte < len(inicios) else -1
+        for quadro in range(3):
+            for arranque, fim, proteina in encontradas[quadro]:
+                a, b = quadro + 3 * arranque, quadro + 3 * (fim + 1)
+                if proteina is None:                                            #ORF que começa num bloco anterior
+                    proteina = traducao[_indices_codoes(codigos_cadeia(cadeia, a, b - 3))[::3]].tobytes().decode("ascii")
+                if cadeia == "-":
+                    a, b = n - b, n - a
+                yield ORF(cadeia, quadro, a, b, proteina)
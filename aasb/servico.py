@@ -0,0 +1,386 @@
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Set, Tuple
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+
+from .linha_comandos import alinhar_par, matriz_motivo, resultado_alinhamento
+
+## @package servico
+#  Serviço local assíncrono de alinhamento, tradução e pesquisa.
+#  O protocolo é JSON Lines sobre um socket Unix ou TCP em localhost: cada pedido é
+#  um objeto {"id": ..., "tipo": ..., ...} numa linha e cada resposta é
+#  {"id": ..., "resultado": ...} ou {"id": ..., "erro": ...}. As respostas de uma
+#  ligação são enviadas assim que ficam prontas, não pela ordem dos pedidos.
+#  Pedidos concorrentes (de uma ou várias ligações) são agrupados em micro-lotes e
+#  enviados a um conjunto de processos que têm a Blosum62, as tabelas de codões e os
+#  índices de sufixos carregados desde o arranque. O pedido "metricas" devolve a
+#  profundidade da fila e os percentis de latência, para dimensionar o conjunto.
+
+LOTE: int = 16
+ESPERA: float = 0.002
+AMOSTRAS: int = 10000
+LIMITE: int = 64 * 2**20
+
+_indices: Dict[str, object] = {}
+
+
+def _inicializar(indices: Dict[str, str]) -> None:
+    """
+    @brief Pré-carrega num processo de trabalho as tabelas e os índices usados pelos pedidos.
+
+    @param indices Nome de cada referência -> prefixo de um índice guardado com IndiceSufixos.guardar
+    """
+    from .blosum import Blosum62
+    from .indice_sufixos import IndiceSufixos
+    from .sequencias import TABELAS_NCBI, _tabela_traducao
+    from . import needleman_wunsch, smith_waterman  # noqa: F401
+
+    Blosum62()
+    for tabela in TABELAS_NCBI:
+        _tabela_traducao(tabela)
+    _indices.clear()
+    _indices.update((nome, IndiceSufixos.carregar(prefixo)) for nome, prefixo in indices.items())
+
+
+@lru_cache(maxsize=256)
+def _pssm(sitios: Tuple[str, ...], pseudocontagem: float, pvalor: float):
+    """
+    @brief PSSM e limiar por P-valor de um motivo, em cache por processo.
+    """
+    pssm = matriz_motivo(list(sitios), pseudocontagem)
+    return pssm, pssm.limiar_pvalor(pvalor)
+
+
+def _alinhamento(pedido: Dict) -> Dict:
+    transcricao = alinhar_par(pedido["seq1"], pedido["seq2"], pedido.get("metodo", "global"),
+                              pedido.get("gap"), pedido.get("igual", 2), pedido.get("diferente", -1))
+    return resultado_alinhamento(transcricao, pedido["seq1"], pedido["seq2"], pedido.get("renderizar", False))
+
+
+def _traducao(pedido: Dict) -> Dict:
+    from .sequencias import dna_para_proteina, traduzir_seis_quadros
+
+    tabela = pedido.get("tabela", 1)
+    if pedido.get("seis_quadros", False):
+        return {"quadros": traduzir_seis_quadros(pedido["sequencia"], tabela)}
+    return {"proteina": dna_para_proteina(pedido["sequencia"], tabela)}
+
+
+def _motivo(pedido: Dict) -> List[Dict]:
+    pssm, limiar = _pssm(tuple(pedido["sitios"]), pedido.get("pseudocontagem", 0.5), pedido.get("pvalor", 1e-4))
+    if pedido.get("limiar") is not None:
+        limiar = pedido["limiar"]
+    return [o._asdict() for o in pssm.procurar(pedido["sequencia"], limiar,
+                                               ambas_cadeias=pedido.get("ambas_cadeias"))]
+
+
+def _pesquisa(pedido: Dict) -> List[Dict]:
+    from .blast import hits_mem
+
+    if pedido["indice"] not in _indices:
+        raise KeyError(f"Índice desconhecido: {pedido['indice']}")
+    indice = _indices[pedido["indice"]]
+    resultados = []
+    for pos_query, pos_ref, comprimento in hits_mem(pedido["sequencia"], indice, pedido.get("minimo", 20)):
+        nome, posicao = indice.coordenadas(pos_ref)
+        resultados.append({"referencia": nome, "pos_query": pos_query, "pos_ref": posicao,
+                           "comprimento": comprimento})
+    return resultados
+
+
+TIPOS = {"align": _alinhamento, "translate": _traducao, "scan": _motivo, "search": _pesquisa}
+
+
+def _processar_lote(pedidos: List[Dict]) -> List[Dict]:
+    """
+    @brief Processa um micro-lote de pedidos num processo de trabalho.
+
+    @return Uma resposta por pedido, pela mesma ordem; erros de um pedido não afetam os outros.
+    """
+    respostas = []
+    for pedido in pedidos:
+        try:
+            respostas.append({"id": pedido.get("id"), "resultado": TIPOS[pedido["tipo"]](pedido)})
+        except Exception as erro:
+            respostas.append({"id": pedido.get("id"), "erro": f"{type(erro).__name__}: {erro}"})
+    return respostas
+
+
+def _percentis(valores: List[float]) -> Dict[str, float]:
+    """
+    @brief Percentis 50, 90 e 99 e máximo (em milissegundos) pelo método da ordem mais próxima.
+    """
+    if not valores:
+        return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    ordenados = sorted(valores)
+    n = len(ordenados)
+    percentil = lambda p: 1000 * ordenados[min(n - 1, max(0, -(-p * n // 100) - 1))]
+    return {"p50": percentil(50), "p90": percentil(90), "p99": percentil(99), "max": 1000 * ordenados[-1]}
+
+
+async def _descartar_linha(leitor: asyncio.StreamReader) -> None:
+    """
+    @brief Consome o resto da linha atual de um leitor, até ao "\n" inclusive ou ao fim da ligação.
+    """
+    while True:
+        try:
+            await leitor.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as excesso:
+            await leitor.readexactly(excesso.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+
+class Servico:
+    """
+    @brief Serviço assíncrono que agrupa pedidos em micro-lotes e os executa num conjunto de processos.
+
+    @details Um micro-lote é enviado quando atinge `lote` pedidos ou quando passam `espera`
+             segundos desde o primeiro pedido do lote. No máximo 2 lotes por processo estão em
+             curso; os restantes pedidos aguardam na fila, cuja profundidade é reportada nas
+             métricas juntamente com os percentis da latência total e do tempo em fila.
+    """
+
+    def __init__(self, processos: int = 1, lote: int = LOTE, espera: float = ESPERA,
+                 indices: Optional[Dict[str, str]] = None, amostras: int = AMOSTRAS, limite: int = LIMITE):
+        """
+        @param processos Número de processos de trabalho
+        @param lote Número máximo de pedidos por micro-lote
+        @param espera Tempo máximo (segundos) que o primeiro pedido de um lote espera por outros
+        @param indices Nome -> prefixo dos índices de sufixos disponíveis para "search"
+        @param amostras Número de pedidos recentes usados nos percentis
+        @param limite Tamanho máximo (bytes) de uma linha de pedido; linhas maiores recebem um erro
+        """
+        self.processos, self.lote, self.espera, self.limite = processos, lote, espera, limite
+        self.indices = dict(indices or {})
+        self._latencias: Deque[float] = deque(maxlen=amostras)
+        self._esperas: Deque[float] = deque(maxlen=amostras)
+        self._contagens = {"pedidos": 0, "erros": 0, "lotes": 0}
+        self._em_curso = 0
+        self._executor = None
+        self._agrupador: Optional[asyncio.Task] = None
+        self._lotes: Set[asyncio.Task] = set()
+        self._servidores: List[asyncio.AbstractServer] = []
+        self._sockets: List[str] = []
+
+    async def __aenter__(self) -> "Servico":
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *excecao):
+        await self.fechar()
+
+    async def iniciar(self):
+        """
+        @brief Cria o conjunto de processos (já com as tabelas carregadas) e a tarefa de agrupamento.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._fila: asyncio.Queue = asyncio.Queue()
+        self._vagas = asyncio.Semaphore(2 * self.processos)
+        self._executor = ProcessPoolExecutor(self.processos, initializer=_inicializar, initargs=(self.indices,))
+        ciclo = asyncio.get_running_loop()
+        await asyncio.gather(*(ciclo.run_in_executor(self._executor, _processar_lote, [])
+                               for _ in range(self.processos)))             #arranca os processos antes do 1.º pedido
+        self._agrupador = asyncio.create_task(self._agrupar())
+
+    async def escutar(self, caminho: Optional[str] = None, porta: Optional[int] = None,
+                      anfitriao: str = "127.0.0.1") -> asyncio.AbstractServer:
+        """
+        @brief Aceita ligações num socket Unix (caminho) ou TCP (anfitriao:porta).
+        """
+        if caminho is not None:
+            servidor = await asyncio.start_unix_server(self._ligacao, caminho, limit=self.limite)
+            self._sockets.append(caminho)
+        else:
+            servidor = await asyncio.start_server(self._ligacao, anfitriao, porta, limit=self.limite)
+        self._servidores.append(servidor)
+        return servidor
+
+    async def fechar(self):
+        """
+        @brief Deixa de aceitar ligações, cancela o agrupamento e termina os processos.
+        """
+        for servidor in self._servidores:
+            servidor.close()
+            await servidor.wait_closed()
+        self._servidores.clear()
+        for caminho in self._sockets:
+            if os.path.exists(caminho):
+                os.unlink(caminho)
+        self._sockets.clear()
+        if self._agrupador is not None:
+            self._agrupador.cancel()
+            await asyncio.gather(self._agrupador, return_exceptions=True)
+            self._agrupador = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        await asyncio.gather(*self._lotes, return_exceptions=True)
+
+    async def pedir(self, pedido: Dict) -> Dict:
+        """
+        @brief Submete um pedido e aguarda a resposta.
+        """
+        if pedido.get("tipo") == "metricas":
+            return {"id": pedido.get("id"), "resultado": self.metricas()}
+        if pedido.get("tipo") not in TIPOS:
+            return {"id": pedido.get("id"), "erro": f"Tipo de pedido desconhecido: {pedido.get('tipo')}"}
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put((pedido, futuro, time.perf_counter()))
+        return await futuro
+
+    def metricas(self) -> Dict[str, object]:
+        """
+        @brief Profundidade da fila, pedidos em curso, contagens e percentis (ms) dos pedidos recentes.
+        """
+        lotes = self._contagens["lotes"]
+        return {"fila": self._fila.qsize(), "em_curso": self._em_curso, "processos": self.processos,
+                **self._contagens,
+                "pedidos_por_lote": self._contagens["pedidos"] / lotes if lotes else 0.0,
+                "latencia": _percentis(list(self._latencias)), "espera_fila": _percentis(list(self._esperas))}
+
+    async def _agrupar(self):
+        """
+        @brief Retira pedidos da fila e forma micro-lotes por tamanho ou tempo de espera.
+        """
+        ciclo = asyncio.get_running_loop()
+        while True:
+            await self._vagas.acquire()
+            lote = [await self._fila.get()]
+            limite = ciclo.time() + self.espera
+            while len(lote) < self.lote:
+                if self._fila.empty():
+                    restante = limite - ciclo.time()
+                    if restante <= 0:
+                        break
+                    try:
+                        lote.append(await asyncio.wait_for(self._fila.get(), restante))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    lote.append(self._fila.get_nowait())
+            tarefa = asyncio.create_task(self._executar(lote))
+            self._lotes.add(tarefa)                                         #referência até o lote terminar
+            tarefa.add_done_callback(self._lotes.discard)
+
+    async def _executar(self, lote: List[Tuple[Dict, asyncio.Future, float]]):
+        """
+        @brief Executa um micro-lote num processo e entrega cada resposta ao respetivo pedido.
+        """
+        envio = time.perf_counter()
+        self._em_curso += len(lote)
+        try:
+            respostas = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _processar_lote, [pedido for pedido, _, _ in lote])
+        except Exception as erro:
+            respostas = [{"id": pedido.get("id"), "erro": f"{type(erro).__name__}: {erro}"} for pedido, _, _ in lote]
+        finally:
+            self._em_curso -= len(lote)
+            self._vagas.release()
+        fim = time.perf_counter()
+        self._contagens["lotes"] += 1
+        for (_, futuro, chegada), resposta in zip(lote, respostas):
+            self._contagens["pedidos"] += 1
+            self._contagens["erros"] += "erro" in resposta
+            self._latencias.append(fim - chegada)
+            self._esperas.append(envio - chegada)
+            if not futuro.done():
+                futuro.set_result(resposta)
+
+    async def _ligacao(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """
+        @brief Lê pedidos de uma ligação e escreve cada resposta assim que fica pronta.
+
+        @details Uma linha com mais de `limite` bytes é descartada e recebe um erro, sem
+                 fechar a ligação.
+        """
+        trinco = asyncio.Lock()
+        pendentes = set()
+
+        async def erro(mensagem: str):
+            async with trinco:
+                escritor.write((json.dumps({"id": None, "erro": mensagem}, ensure_ascii=False) + "\n").encode())
+
+        async def responder(pedido: Dict):
+            resposta = await self.pedir(pedido)
+            async with trinco:
+                escritor.write((json.dumps(resposta, ensure_ascii=False) + "\n").encode())
+                await escritor.drain()
+
+        try:
+            while True:
+                try:
+                    linha = await leitor.readuntil(b"\n")
+                except asyncio.IncompleteReadError as fim:
+                    if not fim.partial:
+                        break
+                    linha = fim.partial                                     #última linha sem "\n"
+                except asyncio.LimitOverrunError:
+                    await _descartar_linha(leitor)
+                    await erro(f"Pedido inválido: linha com mais de {self.limite} bytes")
+                    continue
+                if not linha.strip():
+                    continue
+                try:
+                    pedido = json.loads(linha)
+                    if not isinstance(pedido, dict):
+                        raise ValueError("o pedido deve ser um objeto JSON")
+                except ValueError as invalido:
+                    await erro(f"Pedido inválido: {invalido}")
+                    continue
+                tarefa = asyncio.create_task(responder(pedido))
+                pendentes.add(tarefa)
+                tarefa.add_done_callback(pendentes.discard)
+            await asyncio.gather(*pendentes, return_exceptions=True)
+        finally:
+            escritor.close()
+
+
+async def servir(caminho: Optional[str] = None, porta: Optional[int] = None, anfitriao: str = "127.0.0.1",
+                 **opcoes):
+    """
+    @brief Executa o serviço até receber SIGINT ou SIGTERM, terminando depois os processos.
+
+    @param opcoes Argumentos de Servico (processos, lote, espera, indices)
+    """
+    ciclo, tarefa = asyncio.get_running_loop(), asyncio.current_task()
+    for sinal in (signal.SIGINT, signal.SIGTERM):
+        ciclo.add_signal_handler(sinal, tarefa.cancel)
+    async with Servico(**opcoes) as servico:
+        servidor = await servico.escutar(caminho, porta, anfitriao)
+        try:
+            await servidor.serve_forever()
+        except asyncio.CancelledError:
+            pass
+
+
+def pedir(pedidos: List[Dict], caminho: Optional[str] = None, porta: Optional[int] = None,
+          anfitriao: str = "127.0.0.1") -> List[Dict]:
+    """
+    @brief Cliente síncrono: envia pedidos ao serviço e devolve as respostas pela ordem dos pedidos.
+
+    @details Os pedidos sem "id" recebem como identificador a sua posição na lista.
+    """
+    pedidos = [dict(pedido, id=pedido.get("id", i)) for i, pedido in enumerate(pedidos)]
+    if caminho is not None:
+        ligacao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        ligacao.connect(caminho)
+    else:
+        ligacao = socket.create_connection((anfitriao, porta))
+    with ligacao, ligacao.makefile("rwb") as canal:
+        for pedido in pedidos:
+            canal.write((json.dumps(pedido) + "\n").encode())
+        canal.flush()
+        ligacao.shutdown(socket.SHUT_WR)
+        respostas = {}
+        for linha in canal:
+            resposta = json.loads(linha)
+            respostas[resposta["id"]] = resposta
+    return [respostas.get(pedido["id"], {"id": pedido["id"], "erro": "sem resposta"}) for pedido in pedidos]
@@ -0,0 +1,132 @@
+from itertools import groupby
+from typing import Iterable, List, NamedTuple, Tuple
+import re
+import struct
+
+## @package transcricao
+#  Representação compacta de alinhamentos de pares como transcrição de edição (CIGAR).
+#  As operações são "=" (carateres iguais), "X" (substituição), "I" (carater só na
+#  primeira sequência, lacuna na segunda) e "D" (carater só na segunda sequência,
+#  lacuna na primeira). O traceback acrescenta operações a uma lista, do fim para o
+#  início, e inverte-a uma única vez; as sequências com lacunas só são construídas
+#  quando pedidas, com renderizar().
+
+OPERACOES: str = "=XID"
+
+_CABECALHO = struct.Struct("<IIIIi")
+_CIGAR = re.compile(r"(\d+)([=XID])")
+
+
+class Transcricao(NamedTuple):
+    """
+    @brief Alinhamento de duas sequências como CIGAR com coordenadas e pontuação.
+
+    @param cigar Operações com comprimento de corrida, por exemplo "5=1X2I3="
+    @param inicio1 Início (inclusivo) do alinhamento na primeira sequência
+    @param fim1 Fim (exclusivo) do alinhamento na primeira sequência
+    @param inicio2 Início (inclusivo) do alinhamento na segunda sequência
+    @param fim2 Fim (exclusivo) do alinhamento na segunda sequência
+    @param pontuacao Pontuação do alinhamento
+    """
+    cigar: str
+    inicio1: int
+    fim1: int
+    inicio2: int
+    fim2: int
+    pontuacao: int
+
+    @classmethod
+    def de_operacoes(cls, operacoes: Iterable[str], inicio1: int, inicio2: int,
+                     pontuacao: int) -> "Transcricao":
+        """
+        @brief Cria a transcrição a partir das operações individuais, pela ordem do alinhamento.
+
+        @param operacoes Sequência de carateres de OPERACOES (um por coluna)
+        @param inicio1 Início do alinhamento na primeira sequência
+        @param inicio2 Início do alinhamento na segunda sequência
+        @param pontuacao Pontuação do alinhamento
+        @return Transcricao com o CIGAR comprimido e as coordenadas finais calculadas
+        """
+        return cls.de_corridas([(op, sum(1 for _ in grupo)) for op, grupo in groupby(operacoes)],
+                               inicio1, inicio2, pontuacao)
+
+    @classmethod
+    def de_corridas(cls, corridas: List[Tuple[str, int]], inicio1: int, inicio2: int,
+                    pontuacao: int) -> "Transcricao":
+        """
+        @brief Cria a transcrição a partir de corridas (operação, comprimento) já agrupadas.
+        """
+        fim1, fim2 = inicio1, inicio2
+        for op, n in corridas:
+            if op != "D":
+                fim1 += n
+            if op != "I":
+                fim2 += n
+        cigar = "".join(f"{n}{op}" for op, n in corridas)
+        return cls(cigar, inicio1, fim1, inicio2, fim2, pontuacao)
+
+    def operacoes(self) -> List[Tuple[int, str]]:
+        """
+        @brief Lista de corridas (comprimento, operação).
+        """
+        return [(int(n), op) for n, op in _CIGAR.findall(self.cigar)]
+
+    def colunas(self) -> int:
+        """
+        @brief Número de colunas do alinhamento.
+        """
+        return sum(n for n, _ in self.operacoes())
+
+    def identidade(self) -> float:
+        """
+        @brief Fração de colunas com carateres iguais.
+        """
+        total = self.colunas()
+        return sum(n for n, op in self.operacoes() if op == "=") / total if total else 0.0
+
+    def renderizar_lado(self, seq: str, primeira: bool = True) -> str:
+        """
+        @brief Sequência de um dos lados com as lacunas do alinhamento.
+
+        @param seq Sequência completa (ou qualquer texto com as mesmas coordenadas)
+        @param primeira True para a primeira sequência, False para a segunda
+        @return Região alinhada de seq com '-' nas colunas em que não participa
+        """
+        lacuna = "D" if primeira else "I"
+        posicao = self.inicio1 if primeira else self.inicio2
+        partes = []
+        for n, op in self.operacoes():
+            if op == lacuna:
+                partes.append("-" * n)
+            else:
+                partes.append(seq[posicao:posicao + n])
+                posicao += n
+        return "".join(partes)
+
+    def renderizar(self, seq1: str, seq2: str) -> Tuple[str, str]:
+        """
+        @brief Constrói as duas sequências alinhadas com lacunas, em tempo linear.
+        """
+        return self.renderizar_lado(seq1, True), self.renderizar_lado(seq2, False)
+
+    def codificar(self) -> bytes:
+        """
+        @brief Serializa a transcrição em 20 bytes de cabeçalho mais o CIGAR em ASCII.
+        """
+        return _CABECALHO.pack(self.inicio1, self.fim1, self.inicio2, self.fim2, self.pontuacao) \
+            + self.cigar.encode("ascii")
+
+    @classmethod
+    def descodificar(cls, dados: bytes) -> "Transcricao":
+        """
+        @brief Reconstrói uma transcrição serializada com codificar().
+        """
+        inicio1, fim1, inicio2, fim2, pontuacao = _CABECALHO.unpack_from(dados)
+        return cls(bytes(dados[_CABECALHO.size:]).decode("ascii"), inicio1, fim1, inicio2, fim2, pontuacao)
+
+
+def operacao_par(a: str, b: str) -> str:
+    """
+    @brief Operação de uma coluna com dois carateres: "=" se iguais, "X" caso contrário.
+    """
+    return "=" if a == b else "X"